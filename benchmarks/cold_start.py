@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Cold start benchmark: how long does `shell.py` take to start, compared to an empty python interpreter?
+# Usage: python3 benchmarks/cold_start.py [number of runs]
+# Exits with code 1 if one of the targets is missed. Use `shell.py --profile-startup` to find what is slow.
+
+# IMPORTS
+# built-in python imports
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+import time
+
+NOUG_DIR = os.path.abspath(pathlib.Path(__file__).parent.parent.absolute())
+SHELL = os.path.join(NOUG_DIR, "shell.py")
+
+# name: (command, target in ms, in addition to the startup time of python itself)
+CASES: dict[str, tuple[list[str], float]] = {
+    "version": ([sys.executable, SHELL, "-v"], 40),
+    "empty command": ([sys.executable, SHELL, "-d", "void()"], 250),
+}
+
+
+def median_time_ms(command: list[str], runs: int) -> float:
+    times: list[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True, cwd=NOUG_DIR)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    python_startup = median_time_ms([sys.executable, "-c", "pass"], runs)
+    print(f"python startup: {python_startup:.1f} ms (median of {runs} runs)")
+    all_targets_met = True
+    for name, (command, target) in CASES.items():
+        overhead = median_time_ms(command, runs) - python_startup
+        met = overhead <= target
+        all_targets_met = all_targets_met and met
+        print(f"{name}: +{overhead:.1f} ms (target: +{target} ms) {'OK' if met else 'MISSED'}")
+    if not all_targets_met:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# String building benchmark: how long does it take to build a report line by line (10 MB with the default 100000
+# lines of 100 chars), with `var report += line` and with `join`? Both should be linear in the number of lines.
+# Usage: python3 benchmarks/string_building.py [number of lines]
+
+# IMPORTS
+# built-in python imports
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+import time
+
+NOUG_DIR = os.path.abspath(pathlib.Path(__file__).parent.parent.absolute())
+SHELL = os.path.join(NOUG_DIR, "shell.py")
+
+# name: nougaro code. {lines} is replaced by the number of lines. Each line is 100 chars long (with its "\n").
+CASES: dict[str, str] = {
+    "+=": """
+var report = ""
+for i in range({lines}) then var report += "line " + str(i) + ": " + "x" * (92 - len(str(i))) + "\\n"
+assert len(report) == {lines} * 100
+""",
+    "join": """
+var lines = []
+for i in range({lines}) then append(lines, "line " + str(i) + ": " + "x" * (92 - len(str(i))))
+var report = join(lines, "\\n") + "\\n"
+assert len(report) == {lines} * 100
+""",
+}
+
+
+def run_case(code: str) -> float:
+    with tempfile.NamedTemporaryFile("w", suffix=".noug", delete=False, encoding="UTF-8") as file:
+        file.write(code)
+    try:
+        start = time.perf_counter()
+        subprocess.run([sys.executable, SHELL, file.name], check=True, cwd=NOUG_DIR)
+        return time.perf_counter() - start
+    finally:
+        os.remove(file.name)
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"building a report of {lines} lines ({lines * 100 / 1_000_000:.1f} MB)")
+    for name, code in CASES.items():
+        print(f"{name}: {run_case(code.format(lines=lines)):.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+""" Array module
+
+    Array is a module that provides typed arrays of numbers. An array of floats takes 8 bytes per element, where a
+    list takes a whole nougaro number per element. Arrays work with `len`, `append`, `in`, `for` loops, `list` and
+    indexes (`array_(0)`, `array_(1:3)`), and this module computes their sum, min and max without making any number.
+"""
+
+# IMPORTS
+# nougaro modules imports
+from lib_.lib_to_make_libs import *
+# Comment about the above line : Context, RTResult, errors and values are imported in lib_to_make_libs.py
+# built-in python imports
+from typing import Any, Iterable, Iterator
+import array
+
+# the type codes of python’s array module, except the unicode ones
+TYPECODES = ('b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q', 'f', 'd')
+
+
+def _check_typecode(typecode: str):
+    if typecode not in TYPECODES:
+        raise LibError(f"invalid type code: '{typecode}'. Expected one of {', '.join(TYPECODES)}.", arg=0)
+
+
+class ArrayModule(ModuleFunction):
+    """ Array module (`Array` is the value) """
+    functions: dict[str, BuiltinFunctionDict] = {}
+
+    def __init__(self, name: str):
+        super().__init__("array", name, functions=self.functions)
+
+    def copy(self):
+        """Return a copy of self"""
+        copy = ArrayModule(self.name)
+        return self.set_context_and_pos_to_a_copy(copy)
+
+    # =========
+    # FUNCTIONS
+    # =========
+    @lib_function(functions, "array")
+    def execute_array_array(self, typecode: str, values: Value | None = None) -> Value | RTResult:
+        """Return a new array of type 'typecode' ('i' for ints, 'd' for floats, ...), with the numbers of 'values'
+        (any iterable value)"""
+        _check_typecode(typecode)
+        if values is None:
+            return array.array(typecode)
+        if isinstance(values, Range):  # made in C
+            python_values: Iterable[Any] = values.range_
+        elif isinstance(values, Array):
+            python_values = values.array_
+        else:
+            iterator = values.iter_()
+            if iterator is None:
+                raise LibError(f"expected an iterable value, but got {values.type_}.", RTTypeError, arg=1)
+            python_values = self._numbers(iterator)
+        try:
+            return array.array(typecode, python_values)
+        except IterationError as e:
+            return RTResult().failure(e.error)
+        except TypeError as e:
+            raise LibError(f"can not make an array of type '{typecode}': {e}.", RTTypeError, arg=1)
+        except OverflowError as e:
+            raise LibError(f"can not make an array of type '{typecode}': {e}.", RTOverflowError, arg=1)
+
+    @staticmethod
+    def _numbers(iterator: Iterator[Value]) -> Iterator[int | float]:
+        for element in iterator:
+            if not isinstance(element, Number):
+                raise LibError(f"an array can only contain numbers, but found an element of type {element.type_}.",
+                               RTTypeError, arg=1)
+            yield element.value
+
+    @lib_function(functions, "array")
+    def execute_array_zeros(self, typecode: str, length: int) -> array.array:
+        """Return a new array of type 'typecode' that contains 'length' zeros"""
+        _check_typecode(typecode)
+        if length < 0:
+            raise LibError("the length of an array can not be negative.", arg=1)
+        return array.array(typecode, bytes(array.array(typecode).itemsize * length))
+
+    @lib_function(functions, "array")
+    def execute_array_typecode(self, array_: array.array) -> str:
+        """Return the type code of the array"""
+        return array_.typecode
+
+    @lib_function(functions, "array")
+    def execute_array_sum(self, array_: array.array) -> float:
+        """Return the sum of the elements of the array"""
+        return sum(array_)
+
+    @lib_function(functions, "array")
+    def execute_array_min(self, array_: array.array) -> float:
+        """Return the smallest element of the array"""
+        if len(array_) == 0:
+            raise LibError("the array is empty.", arg=0)
+        return min(array_)
+
+    @lib_function(functions, "array")
+    def execute_array_max(self, array_: array.array) -> float:
+        """Return the biggest element of the array"""
+        if len(array_) == 0:
+            raise LibError("the array is empty.", arg=0)
+        return max(array_)
+
+
+WHAT_TO_IMPORT = {  # what are the new entries in the symbol table when the module is imported
+    # Constants
+    "typecodes": List([String(typecode) for typecode in TYPECODES]),
+
+    # Functions
+    "array": ArrayModule("array"),
+    "zeros": ArrayModule("zeros"),
+    "typecode": ArrayModule("typecode"),
+    "sum": ArrayModule("sum"),
+    "min": ArrayModule("min"),
+    "max": ArrayModule("max"),
+}
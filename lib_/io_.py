@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+""" IO module
+
+    IO is a module that provides file handles: a file is opened once with `io.open(path, mode)`, then read or written
+    as many times as needed (`file.read_line()`, `file.write_str(str_)`, `for line in file`, ...), instead of opening
+    it again for each `read` or `write` statement (`read` and `write` are keywords, so they can not be method names).
+    `io.mmap(path)` maps a file in memory: its lines, slices and parts are views, that are read from the disk only
+    when they are used.
+"""
+
+# IMPORTS
+# __future__ import (must be first)
+from __future__ import annotations
+# nougaro modules imports
+from lib_.lib_to_make_libs import *
+# Comment about the above line : Context, RTResult, errors and values are imported in lib_to_make_libs.py
+# built-in python imports
+from typing import IO, Iterator
+import atexit
+import mmap
+import os
+import weakref
+
+MODES = ("r", "w", "a", "r+", "w+", "a+")
+
+
+# ##########
+# FILE HANDLE
+# ##########
+class _FileOwner:
+    """Shared by all the copies of a FileHandle: when the last copy is deleted (e.g. at the end of the function where
+    the file was opened), the file is closed, and its buffer is written."""
+    def __init__(self, file: IO[str], path: str, mode: str):
+        self.file = file
+        self.path = path
+        self.mode = mode
+        _OPEN_FILES.add(self)
+
+    def __repr__(self):
+        return f"<_FileOwner {self.path} (closed={self.file.closed})>"
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+    def __del__(self):
+        self.close()
+
+
+_OPEN_FILES: weakref.WeakSet[_FileOwner] = weakref.WeakSet()
+
+
+@atexit.register
+def close_open_files():
+    """Close the files that are still open (their buffers are written). Called at exit, and at the end of each script
+    (see src.misc.close_open_files)"""
+    for owner in list(_OPEN_FILES):
+        try:
+            owner.close()
+        except OSError:
+            pass
+
+
+class FileHandle(Value):
+    """Returned by `io.open(path, mode)`: an open file. Iterating over it gives its lines."""
+    def __init__(self, owner: _FileOwner):
+        super().__init__()
+        self.owner = owner
+        self.type_ = "file"
+        for name in FileMethod.functions:
+            self.attributes[name] = FileMethod(name, owner)
+
+    def __repr__(self):
+        return f"<file {self.owner.path!r} (mode {self.owner.mode!r}{', closed' if self.owner.file.closed else ''})>"
+
+    def to_python_str(self) -> str:
+        return self.__repr__()
+
+    def iter_(self) -> Iterator[Value]:
+        file = self.owner.file
+        try:
+            for line in file:
+                yield String(line)
+        except (OSError, ValueError) as e:
+            assert self.pos_start is not None
+            assert self.pos_end is not None
+            assert self.context is not None
+            raise IterationError(RunTimeError(
+                self.pos_start, self.pos_end, f"unable to read file '{self.owner.path}'. More info: {e}",
+                self.context, origin_file="lib_.io_.FileHandle.iter_"
+            ))
+
+    def to_str_(self):
+        return String(self.__repr__()).set_context(self.context), None
+
+    def to_list_(self):
+        """The remaining lines of the file"""
+        try:
+            return List(list(self.iter_())).set_context(self.context), None
+        except IterationError as e:
+            return None, RTResult().failure(e.error)
+
+    def is_eq(self, other: Value):
+        return isinstance(other, FileHandle) and self.owner is other.owner
+
+    def get_comparison_eq(self, other: Value):
+        if self.is_eq(other):
+            return TRUE.copy().set_context(self.context), None
+        return FALSE.copy().set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        if self.is_eq(other):
+            return FALSE.copy().set_context(self.context), None
+        return TRUE.copy().set_context(self.context), None
+
+    def is_true(self):
+        return True
+
+    def copy(self):
+        """Return a copy of self (the file is shared)"""
+        copy = FileHandle(self.owner)
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+    def __copy__(self):
+        return self.copy()
+
+
+class FileMethod(ModuleFunction):
+    """The methods of a FileHandle (`file.read_line()`, `file.write_str(str_)`, ...)"""
+    functions: dict[str, BuiltinFunctionDict] = {}
+
+    def __init__(self, name: str, owner: _FileOwner):
+        super().__init__("io", name, functions=self.functions)
+        self.owner = owner
+
+    def __repr__(self):
+        return f'<built-in method {self.name} of file>'
+
+    def copy(self):
+        """Return a copy of self"""
+        copy = FileMethod(self.name, self.owner)
+        return self.set_context_and_pos_to_a_copy(copy)
+
+    def _file(self) -> IO[str]:
+        if self.owner.file.closed:
+            raise LibError(f"the file '{self.owner.path}' is closed.")
+        return self.owner.file
+
+    @lib_function(functions, "io")
+    def execute_io_read_line(self) -> str:
+        """Return the next line of the file (with its '\\n'), or an empty str at the end of the file"""
+        try:
+            return self._file().readline()
+        except (OSError, ValueError) as e:
+            raise LibError(f"unable to read file '{self.owner.path}'. More info: {e}")
+
+    @lib_function(functions, "io")
+    def execute_io_read_all(self) -> str:
+        """Return the rest of the file"""
+        try:
+            return self._file().read()
+        except (OSError, ValueError) as e:
+            raise LibError(f"unable to read file '{self.owner.path}'. More info: {e}")
+
+    @lib_function(functions, "io")
+    def execute_io_write_str(self, str_: str) -> None:
+        """Write the str in the file. It is written in the buffer first: use `flush` to write the buffer to the disk"""
+        try:
+            self._file().write(str_)
+        except (OSError, ValueError) as e:
+            raise LibError(f"unable to write in file '{self.owner.path}'. More info: {e}")
+
+    @lib_function(functions, "io")
+    def execute_io_flush(self) -> None:
+        """Write the buffer to the disk"""
+        try:
+            self._file().flush()
+        except (OSError, ValueError) as e:
+            raise LibError(f"unable to write in file '{self.owner.path}'. More info: {e}")
+
+    @lib_function(functions, "io")
+    def execute_io_close(self) -> None:
+        """Close the file (does nothing if it is already closed)"""
+        try:
+            self.owner.close()
+        except OSError as e:
+            raise LibError(f"unable to write in file '{self.owner.path}'. More info: {e}")
+
+    @lib_function(functions, "io")
+    def execute_io_is_closed(self) -> bool:
+        """Return True if the file is closed"""
+        return self.owner.file.closed
+
+
+# ##########
+# MAPPED FILE
+# ##########
+class MappedFile(Value):
+    """Returned by `io.mmap(path)`: the bytes start:end of a file mapped in memory. Its lines (`for line in mapped`),
+    its slices (`mapped(a:b)`, in bytes) and its parts (`mapped.split(separator)`) are MappedFiles that share the same
+    mapping: nothing is copied, and the file is read from the disk only when the bytes are needed (e.g. by `str`).
+    The file is unmapped when its last view is deleted."""
+    def __init__(self, path: str, buffer: mmap.mmap | bytes, start: int, end: int):
+        self._attributes: dict[str, Value] | None = None
+        super().__init__()
+        self.path = path
+        self.buffer = buffer
+        self.start = start
+        self.end = end
+        self.type_ = "mapped_file"
+
+    @property
+    def attributes(self) -> dict[str, Value]:  # type: ignore[override]
+        # the methods are made only when they are used: a file can have millions of lines
+        if self._attributes is None:
+            self._attributes = {name: MappedFileMethod(name, self) for name in MappedFileMethod.functions}
+        return self._attributes
+
+    @attributes.setter
+    def attributes(self, attributes: dict[str, Value]):
+        self._attributes = attributes if attributes else None
+
+    def __repr__(self):
+        return f"<mapped file {self.path!r} ({self.start}:{self.end})>"
+
+    def __len__(self):
+        return self.end - self.start
+
+    def view(self, start: int, end: int) -> MappedFile:
+        """Return the bytes start:end of the file (offsets in the file, not in self), without copying them"""
+        return MappedFile(self.path, self.buffer, start, end).set_context(self.context)
+
+    def to_bytes(self) -> bytes:
+        return bytes(self.buffer[self.start:self.end])
+
+    def to_python_str(self) -> str:
+        return self.to_bytes().decode("UTF-8", errors="replace")
+
+    def to_str_(self):
+        try:
+            return String(self.to_bytes().decode("UTF-8")).set_context(self.context), None
+        except UnicodeDecodeError as e:
+            assert self.pos_start is not None
+            assert self.pos_end is not None
+            assert self.context is not None
+            return None, RTResult().failure(RunTimeError(
+                self.pos_start, self.pos_end, f"unable to decode file '{self.path}'. More info: {e}",
+                self.context, origin_file="lib_.io_.MappedFile.to_str_"
+            ))
+
+    def iter_(self) -> Iterator[Value]:
+        """The lines (with their '\n')"""
+        buffer, end = self.buffer, self.end
+        position = self.start
+        while position < end:
+            new_line = buffer.find(b"\n", position, end)
+            line_end = end if new_line == -1 else new_line + 1
+            yield self.view(position, line_end)
+            position = line_end
+
+    def to_list_(self):
+        return List(list(self.iter_())).set_context(self.context), None
+
+    def sliced(self, slice_: slice) -> MappedFile:
+        indexes = range(self.start, self.end)[slice_]
+        if indexes.step == 1:
+            return self.view(indexes.start, max(indexes.start, indexes.stop))
+        # the bytes are not contiguous: they are copied
+        data = bytes(self.buffer[self.start:self.end][slice_])
+        return MappedFile(self.path, data, 0, len(data)).set_context(self.context)
+
+    def split(self, separator: bytes) -> list[Value]:
+        """Return the parts of self between the separators, without copying them"""
+        buffer, end = self.buffer, self.end
+        parts: list[Value] = []
+        position = self.start
+        while True:
+            found = buffer.find(separator, position, end)
+            if found == -1:
+                parts.append(self.view(position, end))
+                return parts
+            parts.append(self.view(position, found))
+            position = found + len(separator)
+
+    def hash_key(self):
+        try:
+            return self.to_bytes().decode("UTF-8")  # a mapped file can be used as the str it contains
+        except UnicodeDecodeError:
+            return None
+
+    def is_eq(self, other: Value) -> bool:
+        if isinstance(other, MappedFile):
+            return len(self) == len(other) and self.to_bytes() == other.to_bytes()
+        if isinstance(other, String):
+            return self.to_bytes() == other.value.encode("UTF-8")
+        return False
+
+    def get_comparison_eq(self, other: Value):
+        if self.is_eq(other):
+            return TRUE.copy().set_context(self.context), None
+        return FALSE.copy().set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        if self.is_eq(other):
+            return FALSE.copy().set_context(self.context), None
+        return TRUE.copy().set_context(self.context), None
+
+    def is_true(self):
+        return self.end > self.start
+
+    def copy(self):
+        """Return a copy of self (the mapping is shared)"""
+        copy = MappedFile(self.path, self.buffer, self.start, self.end)
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        return copy
+
+    def __copy__(self):
+        return self.copy()
+
+
+class MappedFileMethod(ModuleFunction):
+    """The methods of a MappedFile (`mapped.split(separator)`, ...)"""
+    functions: dict[str, BuiltinFunctionDict] = {}
+
+    def __init__(self, name: str, mapped_file: MappedFile):
+        super().__init__("io", name, functions=self.functions)
+        self.mapped_file = mapped_file
+
+    def __repr__(self):
+        return f'<built-in method {self.name} of mapped_file>'
+
+    def copy(self):
+        """Return a copy of self"""
+        copy = MappedFileMethod(self.name, self.mapped_file)
+        return self.set_context_and_pos_to_a_copy(copy)
+
+    @lib_function(functions, "io")
+    def execute_io_split(self, separator: str = " ") -> Value:
+        """Return the list of the parts of the mapped file between the separators (views, like the mapped file)"""
+        if separator == "":
+            raise LibError("empty separator.", arg=0)
+        return List(self.mapped_file.split(separator.encode("UTF-8")))
+
+    @lib_function(functions, "io")
+    def execute_io_find(self, sub: str, start: int = 0) -> int:
+        """Return the offset (in bytes) of the first `sub` in the mapped file after `start`, or -1 if there is none"""
+        mapped_file = self.mapped_file
+        found = mapped_file.buffer.find(sub.encode("UTF-8"), mapped_file.start + max(start, 0), mapped_file.end)
+        return -1 if found == -1 else found - mapped_file.start
+
+    @lib_function(functions, "io")
+    def execute_io_decode(self) -> str:
+        """Return the content of the mapped file as a str (it is copied)"""
+        try:
+            return self.mapped_file.to_bytes().decode("UTF-8")
+        except UnicodeDecodeError as e:
+            raise LibError(f"unable to decode file '{self.mapped_file.path}'. More info: {e}")
+
+
+class Io(ModuleFunction):
+    """ IO module """
+    functions: dict[str, BuiltinFunctionDict] = {}
+
+    def __init__(self, name: str):
+        super().__init__("io", name, functions=self.functions)
+
+    def copy(self):
+        """Return a copy of self"""
+        copy = Io(self.name)
+        return self.set_context_and_pos_to_a_copy(copy)
+
+    # =========
+    # FUNCTIONS
+    # =========
+    @lib_function(functions, "io")
+    def execute_io_open(self, path: str, mode: str = "r", buffer_size: int | None = None) -> Value:
+        """Open a file and return a file handle. The mode is 'r' (read, by default), 'w' (overwrite), 'a' (append),
+        or one of them followed by '+' (read and write). The written strs are kept in a buffer of 'buffer_size' chars
+        (chosen by python by default) until it is full, until `flush` is called, or until the file is closed."""
+        if mode not in MODES:
+            raise LibError(f"invalid mode '{mode}'. Available modes: {', '.join(MODES)}.", arg=1)
+        if buffer_size is not None and buffer_size < 1:
+            raise LibError("the buffer size must be at least 1.", arg=2)
+        try:
+            file = open(path, mode, buffering=buffer_size if buffer_size is not None else -1, encoding="UTF-8")
+        except FileNotFoundError:
+            raise LibError(path, RTFileNotFoundError, arg=0)  # RTFileNotFoundError makes the message from the path
+        except OSError as e:
+            raise LibError(f"unable to open file '{path}'. More info: Python{e.__class__.__name__}: {e}", arg=0)
+        return FileHandle(_FileOwner(file, path, mode))
+
+    @lib_function(functions, "io")
+    def execute_io_mmap(self, path: str) -> Value:
+        """Map a file in memory (read-only), and return it as a mapped file: a str-like value whose lines, slices and
+        parts are read only when they are used. It works with files bigger than the memory."""
+        try:
+            with open(path, "rb") as file:
+                if os.fstat(file.fileno()).st_size == 0:  # an empty file can not be mapped
+                    buffer: mmap.mmap | bytes = b""
+                else:
+                    buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            raise LibError(path, RTFileNotFoundError, arg=0)
+        except (OSError, ValueError) as e:
+            raise LibError(f"unable to map file '{path}'. More info: Python{e.__class__.__name__}: {e}", arg=0)
+        return MappedFile(path, buffer, 0, len(buffer))
+
+
+WHAT_TO_IMPORT = {  # what are the new entries in the symbol table when the module is imported
+    # functions
+    "open": Io("open"),
+    "mmap": Io("mmap"),
+}
@@ -14,14 +14,280 @@
 from __future__ import annotations
 # nougaro modules imports
 from src.runtime.values.functions.builtin_function import *
+from src.runtime.values.functions.function_caller import FunctionCaller
 from src.runtime.values.tools.py2noug import *
 from src.errors.errors import *
 # Note: Context, RTResult, errors and values are imported in builtin_function.py
 # built-in python imports
-# no imports
+from typing import Any, Callable, get_type_hints
+import array
+import inspect
+import types
 
 builtin_function_dict = BuiltinFunctionDict
 
+_WRONG_TYPE = object()  # returned by the argument converters when the nougaro value has not the right type
+_ORDINALS = ("first", "second", "third", "fourth", "fifth", "sixth", "seventh", "eighth", "ninth", "tenth")
+
+
+def _ordinal(index: int) -> str:
+    """0 -> 'first', 1 -> 'second', ..."""
+    if index < len(_ORDINALS):
+        return _ORDINALS[index]
+    return f"{index + 1}th"
+
+
+def _to_int(value: Value) -> Any:
+    if isinstance(value, Number) and isinstance(value.value, int):
+        return value.value
+    return _WRONG_TYPE
+
+
+def _to_number(value: Value) -> Any:
+    if isinstance(value, Number):
+        return value.value
+    return _WRONG_TYPE
+
+
+def _to_str(value: Value) -> Any:
+    if isinstance(value, String):
+        return value.value
+    return _WRONG_TYPE
+
+
+def _to_list(value: Value) -> Any:
+    if isinstance(value, List):
+        return value.elements
+    return _WRONG_TYPE
+
+
+def _to_array(value: Value) -> Any:
+    if isinstance(value, Array):
+        return value.array_
+    return _WRONG_TYPE
+
+
+# python annotation: (converter, nougaro type name used in the error messages)
+_CONVERTERS: dict[Any, tuple[Callable[[Value], Any], str]] = {
+    int: (_to_int, "int"),
+    float: (_to_number, "number"),
+    str: (_to_str, "str"),
+    list: (_to_list, "list"),
+    array.array: (_to_array, "array"),
+    bool: (lambda value: value.is_true(), "bool"),
+    Value: (lambda value: value, "value"),
+}
+
+# python return annotation: function that converts the returned value
+_RETURN_CONVERTERS: dict[Any, Callable[[Any], Value]] = {
+    int: Number,
+    float: Number,
+    str: String,
+}
+
+
+def _converter_from_annotation(annotation: Any, func_name: str) -> tuple[Callable[[Value], Any], str, str | None]:
+    """Return (converter, type name, 'None' if the parameter is optional) for the annotation of a parameter"""
+    if isinstance(annotation, types.UnionType):  # `float | None`
+        other_types = [type_ for type_ in annotation.__args__ if type_ is not type(None)]
+        if len(other_types) != 1 or len(annotation.__args__) != 2:
+            raise TypeError(f"{func_name}: unsupported annotation {annotation}.")
+        converter, type_name, _ = _converter_from_annotation(other_types[0], func_name)
+
+        def optional_converter(value: Value) -> Any:
+            if isinstance(value, NoneValue):
+                return None
+            return converter(value)
+        return optional_converter, type_name, "None"
+    if annotation not in _CONVERTERS:
+        if isinstance(annotation, type) and issubclass(annotation, Value):  # a value class defined by a module
+            def value_converter(value: Value) -> Any:
+                return value if isinstance(value, annotation) else _WRONG_TYPE
+            return value_converter, annotation.__name__.lower(), None
+        raise TypeError(f"{func_name}: unsupported annotation {annotation}.")
+    converter, type_name = _CONVERTERS[annotation]
+    return converter, type_name, None
+
+
+class LibError(Exception):
+    """Raise it in a function exposed with `lib_function` to make the call fail with a nougaro error.
+    `arg` is the index of the argument the error is about (None if the error is about the whole call)."""
+    def __init__(self, message: str, error_class: type[RunTimeError] = RunTimeError, arg: int | None = None):
+        super().__init__(message)
+        self.message = message
+        self.error_class = error_class
+        self.arg = arg
+
+
+def lib_function(functions: dict[str, BuiltinFunctionDict], module_name: str, elementwise: bool = False):
+    """Decorator that exposes a python method `execute_<module>_<name>` of a ModuleFunction subclass as the nougaro
+    function `<module>.<name>`.
+    The arguments are converted from their annotations (int, float (any number), str, list, array.array, bool, Value,
+    a subclass of Value, or `X | None`) and the errors are generated once, when the module is imported. Parameters
+    with a default value are optional.
+    The return value is converted from the return annotation (int, float or str), or else with py2noug (it can also
+    be a Value or an RTResult). The function is called using the fast-call protocol: no context is created.
+    If `elementwise` is True, the number parameters also accept lists and arrays of numbers: the python method is
+    called on each element (in a python loop), and the results are returned in a list (or in an array of floats if
+    the first list is an array and the return annotation is float)."""
+    def decorator(function: Callable[..., Any]) -> Callable[..., RTResult]:
+        prefix = f"execute_{module_name}_"
+        assert function.__name__.startswith(prefix), f"{function.__name__} should start with {prefix}"
+        name = function.__name__.removeprefix(prefix)
+        full_name = f"{module_name}.{name}"
+        origin_file = f"lib_.{module_name}_.{function.__qualname__}"
+
+        type_hints = get_type_hints(function)
+        param_names: list[str] = []
+        optional_params: list[str] = []
+        converters: list[tuple[Callable[[Value], Any], str, str | None]] = []
+        for parameter in list(inspect.signature(function).parameters.values())[1:]:  # skip `self`
+            if parameter.default is inspect.Parameter.empty:
+                param_names.append(parameter.name)
+            else:
+                optional_params.append(parameter.name)
+            converters.append(_converter_from_annotation(type_hints.get(parameter.name, Value), full_name))
+        return_converter = _RETURN_CONVERTERS.get(type_hints.get("return", None), None)
+
+        # the parameters that accept lists of numbers, if elementwise
+        elementwise_params = [
+            index for index, (_, type_name, _) in enumerate(converters) if type_name in ("int", "number")
+        ] if elementwise else []
+
+        def failure(self: ModuleFunction, error_class: type[RunTimeError], message: str,
+                    value: Value | None) -> RTResult:
+            """Make the call fail with an error shown at the position of the value (or of the call)"""
+            assert self.context is not None
+            if value is not None and value.pos_start is not None:
+                pos_start, pos_end = value.pos_start, value.pos_end
+            else:
+                pos_start, pos_end = self.pos_start, self.pos_end
+            assert pos_start is not None
+            assert pos_end is not None
+            return RTResult().failure(error_class(pos_start, pos_end, message, self.context, origin_file=origin_file))
+
+        def execute_elementwise(self: ModuleFunction, args: tuple[Value, ...], sequences: list[int]) -> RTResult:
+            """Call the function on each element of the lists given instead of numbers"""
+            length = len(args[sequences[0]])
+            for index in sequences[1:]:
+                if len(args[index]) != length:
+                    return failure(
+                        self, RunTimeError,
+                        f"the lists given to ‘{full_name}’ have different lengths "
+                        f"({length} and {len(args[index])}).",
+                        args[index]
+                    )
+
+            results: list[Any] = []
+            for element_index in range(length):
+                python_args: list[Any] = []
+                position_values: list[Value] = []  # the errors about an argument are shown at their position
+                for index, arg in enumerate(args):
+                    if index in sequences:
+                        element = arg[element_index]
+                        position_value = element if element.pos_start is not None else arg
+                    else:
+                        element = position_value = arg
+                    converter, type_name, or_ = converters[index]
+                    python_arg = converter(element)
+                    if python_arg is _WRONG_TYPE:
+                        if index in sequences:
+                            return failure(
+                                self, RTTypeError,
+                                f"type of the elements of the {_ordinal(index)} argument of builtin function "
+                                f"‘{full_name}’ should be ‘{type_name}’, got ‘{element.type_}’ instead.",
+                                position_value
+                            )
+                        return failure(
+                            self, RTTypeError,
+                            f"type of the {_ordinal(index)} argument of builtin function ‘{full_name}’ should be "
+                            f"‘{type_name}’{f' or ‘{or_}’' if or_ is not None else ''}, "
+                            f"got ‘{arg.type_}’ instead.",
+                            arg
+                        )
+                    python_args.append(python_arg)
+                    position_values.append(position_value)
+
+                try:
+                    return_value = function(self, *python_args)
+                except LibError as e:
+                    value = position_values[e.arg] if e.arg is not None and e.arg < len(args) else None
+                    return failure(self, e.error_class, e.message, value)
+                if isinstance(return_value, RTResult):
+                    if return_value.should_return():
+                        return return_value
+                    return_value = return_value.value
+                results.append(return_value)
+
+            first_sequence = args[sequences[0]]
+            if type_hints.get("return") is float and isinstance(first_sequence, Array):  # the floats stay compact
+                return RTResult().success(Array(array.array("d", results)).set_context(self.context))
+            if return_converter is not None:
+                return RTResult().success(List([
+                    return_converter(result).set_context(self.context) for result in results
+                ]))
+            return RTResult().success(List([
+                (result if isinstance(result, Value) else py2noug(result)).set_context(self.context)
+                for result in results
+            ]))
+
+        def execute(self: ModuleFunction, *args: Value) -> RTResult:
+            assert self.context is not None
+            if len(elementwise_params) != 0:
+                sequences = [
+                    index for index in elementwise_params
+                    if index < len(args) and isinstance(args[index], (List, Array))
+                ]
+                if len(sequences) != 0:
+                    return execute_elementwise(self, args, sequences)
+
+            python_args: list[Any] = []
+            for index, arg in enumerate(args):
+                converter, type_name, or_ = converters[index]
+                python_arg = converter(arg)
+                if python_arg is _WRONG_TYPE:
+                    assert arg.pos_start is not None
+                    assert arg.pos_end is not None
+                    return RTResult().failure(RTTypeErrorF(
+                        arg.pos_start, arg.pos_end, _ordinal(index), full_name, type_name, arg,
+                        self.context, origin_file, or_=or_
+                    ))
+                python_args.append(python_arg)
+
+            try:
+                return_value = function(self, *python_args)
+            except LibError as e:
+                if e.arg is not None and e.arg < len(args):
+                    pos_start, pos_end = args[e.arg].pos_start, args[e.arg].pos_end
+                else:
+                    pos_start, pos_end = self.pos_start, self.pos_end
+                assert pos_start is not None
+                assert pos_end is not None
+                return RTResult().failure(e.error_class(
+                    pos_start, pos_end, e.message, self.context, origin_file=origin_file
+                ))
+
+            if return_converter is not None:
+                return RTResult().success(return_converter(return_value))
+            if isinstance(return_value, RTResult):
+                return return_value
+            return RTResult().success(py2noug(return_value))
+
+        execute.__name__ = function.__name__
+        execute.__qualname__ = function.__qualname__
+        execute.__doc__ = function.__doc__
+        functions[name] = {
+            "function": execute,
+            "param_names": param_names,
+            "optional_params": optional_params,
+            "should_respect_args_number": True,
+            "run_noug_dir_work_dir": False,
+            "noug_dir": False,
+            "fast_call": True
+        }
+        return execute
+    return decorator
+
 
 class ModuleFunction(BaseBuiltInFunction):
     """ Parent class for all the modules """
@@ -51,6 +317,24 @@ class ModuleFunction(BaseBuiltInFunction):
         # create the result
         result = RTResult()
 
+        # fast-call protocol (used by `lib_function`): no context, the arguments are given directly to the method
+        method_dict = self.functions.get(self.name)
+        if method_dict is not None and method_dict.get("fast_call", False):
+            result.register(self.check_args(
+                method_dict["param_names"], args, method_dict["optional_params"],
+                method_dict["should_respect_args_number"]
+            ))
+            if result.should_return():
+                return result
+            for arg in args:  # there is no new context: the arguments are in the context of the function
+                arg.set_context(self.context)
+            if method_dict.get("calls_functions", False):
+                caller = FunctionCaller(
+                    interpreter_, run, noug_dir, f"{self.module_name}.{self.name} from {exec_from}", cli_args, work_dir
+                )
+                return method_dict["function"](self, caller, *args)
+            return method_dict["function"](self, *args)
+
         # generate the context and change the symbol table for the context
         exec_context = self.generate_new_context()
         assert exec_context.symbol_table is not None
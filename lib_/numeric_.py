@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+""" Numeric module
+
+    Numeric is a module that provides one-dimensional arrays of numbers (ndarray) for vectorised math: `a + b`,
+    `a * 2`, `numeric.sqrt(a)` or `numeric.sum(a)` are computed on the whole array in a single call, instead of a
+    nougaro loop over a list. NumPy is used if it is installed, else the arrays are python lists (slower, but the
+    results are the same).
+    With both backends, the ints of an ndarray are 64-bit ints: an operation whose result does not fit is an
+    OverflowError (NumPy would wrap around).
+    The ndarray must be on the left of the operators: `a * 2` works, but not `2 * a`.
+"""
+
+# IMPORTS
+# nougaro modules imports
+from lib_.lib_to_make_libs import *
+# Comment about the above line : Context, RTResult, errors and values are imported in lib_to_make_libs.py
+# built-in python imports
+from typing import Any, Callable, Iterator
+import math
+import operator
+# optional imports
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+BACKEND = String("numpy" if numpy is not None else "python")
+INT_MIN, INT_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+# ##########
+# BACKEND
+# ##########
+# The data of an ndarray is a numpy.ndarray if numpy is installed, else a python list of ints and floats.
+# In both cases, the ints are between INT_MIN and INT_MAX.
+def _from_python(values: list[int | float]) -> Any:
+    for value in values:
+        if isinstance(value, int) and not INT_MIN <= value <= INT_MAX:
+            raise OverflowError("a number is too big for an ndarray")
+    if numpy is None:
+        return values
+    return numpy.array(values)
+
+
+def _to_python(data: Any) -> list[int | float]:
+    if numpy is None:
+        return list(data)
+    return data.tolist()  # python numbers instead of numpy ones
+
+
+def _scalar(value: Any) -> int | float:
+    """Convert a numpy number to a python one"""
+    return value.item() if hasattr(value, "item") else value
+
+
+def _is_int_data(data: Any) -> bool:
+    """Return True if data is an int or numpy data of ints"""
+    return isinstance(data, int) or (isinstance(data, numpy.ndarray) and data.dtype.kind == "i")
+
+
+def _may_overflow(estimate: Any) -> bool:
+    """Return True if an int result, estimated with floats, may not fit in 64 bits. The margin is much bigger than
+    the rounding errors of the estimation."""
+    return not bool((numpy.abs(estimate) < 2 ** 62).all())
+
+
+def _elementwise(data: Any, other: Any, operation: Callable[[Any, Any], Any]) -> Any:
+    """Apply the operation to each element of data and other (an array data of the same length or a number)"""
+    if numpy is not None:
+        if _is_int_data(data) and _is_int_data(other):
+            # numpy ints wrap around and can not be raised to negative powers: if the result may not fit in 64 bits or
+            # if a power is negative, it is computed with python ints
+            with numpy.errstate(all="ignore"):
+                estimate = operation(data.astype(float), numpy.asarray(other, dtype=float))
+            if _may_overflow(estimate) or (operation is operator.pow and bool((numpy.asarray(other) < 0).any())):
+                python_other = _to_python(other) if isinstance(other, numpy.ndarray) else other
+                return _from_python(_python_elementwise(_to_python(data), python_other, operation))
+        with numpy.errstate(all="ignore"):
+            return operation(data, other)
+    return _from_python(_python_elementwise(data, other, operation))
+
+
+def _python_elementwise(data: list[int | float], other: Any, operation: Callable[[Any, Any], Any]) -> list:
+    if isinstance(other, list):
+        return [operation(x, y) for x, y in zip(data, other)]
+    return [operation(x, other) for x in data]
+
+
+def _reduce(data: Any, numpy_function_name: str, python_function: Callable[..., int | float],
+            *others: Any) -> int | float:
+    """Reduce the data (and the other data of the same length) to a python number. The int results are exact with
+    both backends: with numpy, if the result may not fit in 64 bits, it is computed with python ints."""
+    if numpy is None:
+        return python_function(data, *others)
+    numpy_function = getattr(numpy, numpy_function_name)
+    if _is_int_data(data) and all(_is_int_data(other) for other in others):
+        # the reduction of the absolute values is bigger than the absolute value of any partial result
+        with numpy.errstate(all="ignore"):
+            estimate = numpy_function(*(numpy.abs(d.astype(float)) for d in (data, *others)))
+        if _may_overflow(estimate):
+            return python_function(_to_python(data), *map(_to_python, others))
+    return _scalar(numpy_function(data, *others))
+
+
+def _map(data: Any, numpy_function_name: str, python_function: Callable[[Any], Any]) -> Any:
+    if numpy is not None:
+        return getattr(numpy, numpy_function_name)(data)
+    return [python_function(x) for x in data]
+
+
+def _power(x: int | float, y: int | float) -> int | float:
+    """x ** y, but nan instead of a complex number (like numpy)"""
+    if x < 0 and not float(y).is_integer():
+        return math.nan
+    return x ** y
+
+
+def _min(data: Any) -> int | float:
+    if numpy is not None:
+        return data.min().item()
+    return min(data)
+
+
+def _contains_zero(data: Any) -> bool:
+    if numpy is not None:
+        return bool((data == 0).any())
+    return 0 in data
+
+
+# ##########
+# NDARRAY
+# ##########
+class NDArray(Value):
+    """One-dimensional array of numbers, with elementwise operators"""
+    def __init__(self, data: Any):
+        super().__init__()
+        self.data = data
+        self.type_ = "ndarray"
+
+    def __repr__(self):
+        return f"ndarray([{', '.join(map(str, _to_python(self.data)))}])"
+
+    def to_python_str(self) -> str:
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self.data)
+
+    def iter_(self) -> Iterator[Value]:
+        context = self.context
+        return (Number(element).set_context(context) for element in _to_python(self.data))
+
+    def _operation(self, other: Value, operation: Callable[[Any, Any], Any],
+                   divides: bool = False) -> tuple[Value, None] | tuple[None, RunTimeError]:
+        """self <operation> other, elementwise. Other can be an ndarray of the same length or a number."""
+        if isinstance(other, NDArray):
+            if len(other.data) != len(self.data):
+                assert self.pos_start is not None
+                assert other.pos_end is not None
+                assert self.context is not None
+                return None, RunTimeError(
+                    self.pos_start, other.pos_end,
+                    f"the ndarrays have different lengths ({len(self.data)} and {len(other.data)}).",
+                    self.context, origin_file="lib_.numeric_.NDArray._operation"
+                )
+            other_data = other.data
+        elif isinstance(other, Number):
+            other_data = other.value
+        else:
+            return None, self.illegal_operation(other)
+
+        if divides and (other_data == 0 if isinstance(other, Number) else _contains_zero(other_data)):
+            assert other.pos_start is not None
+            assert other.pos_end is not None
+            assert self.context is not None
+            return None, RTArithmeticError(
+                other.pos_start, other.pos_end, 'division by zero is not possible.', self.context,
+                origin_file="lib_.numeric_.NDArray._operation"
+            )
+        try:
+            return NDArray(_elementwise(self.data, other_data, operation)).set_context(self.context), None
+        except OverflowError as e:
+            assert self.pos_start is not None
+            assert other.pos_end is not None
+            assert self.context is not None
+            return None, RTOverflowError(
+                self.pos_start, other.pos_end, f"{e}.", self.context, origin_file="lib_.numeric_.NDArray._operation"
+            )
+        except (ArithmeticError, ValueError) as e:
+            assert self.pos_start is not None
+            assert other.pos_end is not None
+            assert self.context is not None
+            return None, RTArithmeticError(
+                self.pos_start, other.pos_end, f"{e}.", self.context, origin_file="lib_.numeric_.NDArray._operation"
+            )
+
+    def added_to(self, other: Value):
+        return self._operation(other, operator.add)
+
+    def subbed_by(self, other: Value):
+        return self._operation(other, operator.sub)
+
+    def multiplied_by(self, other: Value):
+        return self._operation(other, operator.mul)
+
+    def dived_by(self, other: Value):
+        return self._operation(other, operator.truediv, divides=True)
+
+    def modded_by(self, other: Value):
+        return self._operation(other, operator.mod, divides=True)
+
+    def floor_dived_by(self, other: Value):
+        return self._operation(other, operator.floordiv, divides=True)
+
+    def powered_by(self, other: Value):
+        return self._operation(other, operator.pow if numpy is not None else _power)
+
+    def to_str_(self):
+        return String(self.__repr__()).set_context(self.context), None
+
+    def to_list_(self):
+        context = self.context
+        return List([Number(e).set_context(context) for e in _to_python(self.data)]).set_context(context), None
+
+    def is_eq(self, other: Value):
+        return isinstance(other, NDArray) and _to_python(self.data) == _to_python(other.data)
+
+    def get_comparison_eq(self, other: Value):
+        if self.is_eq(other):
+            return TRUE.copy().set_context(self.context), None
+        return FALSE.copy().set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        if self.is_eq(other):
+            return FALSE.copy().set_context(self.context), None
+        return TRUE.copy().set_context(self.context), None
+
+    def and_(self, other: Value):
+        return Number(int(self.is_true() and other.is_true())), None
+
+    def or_(self, other: Value):
+        return Number(int(self.is_true() or other.is_true())), None
+
+    def is_true(self):
+        return len(self.data) != 0
+
+    def copy(self):
+        """Return a copy of self (the data is shared: the operators never modify it)"""
+        copy = NDArray(self.data)
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+    def __copy__(self):
+        return self.copy()
+
+
+def _not_empty(ndarray: NDArray, function_name: str):
+    if len(ndarray.data) == 0:
+        raise LibError(f"first argument of the built-in function ‘numeric.{function_name}’ must not be empty.", arg=0)
+
+
+class Numeric(ModuleFunction):
+    """ Numeric module """
+    functions: dict[str, BuiltinFunctionDict] = {}
+
+    def __init__(self, name: str):
+        super().__init__("numeric", name, functions=self.functions)
+
+    def copy(self):
+        """Return a copy of self"""
+        copy = Numeric(self.name)
+        return self.set_context_and_pos_to_a_copy(copy)
+
+    # =========
+    # FUNCTIONS
+    # =========
+    @lib_function(functions, "numeric")
+    def execute_numeric_array(self, values: Value) -> Value | RTResult:
+        """Return a new ndarray with the numbers of 'values' (a list, a range, an array or any iterable value)"""
+        if isinstance(values, NDArray):
+            return values.copy()
+        if isinstance(values, Array):
+            python_values: list[int | float] = values.array_.tolist()
+        elif isinstance(values, Range):
+            python_values = list(values.range_)
+        else:
+            iterator = values.iter_()
+            if iterator is None:
+                raise LibError(f"expected an iterable value, but got {values.type_}.", RTTypeError, arg=0)
+            python_values = []
+            try:
+                for element in iterator:
+                    if not isinstance(element, Number):
+                        raise LibError(f"an ndarray can only contain numbers, but found an element of type "
+                                       f"{element.type_}.", RTTypeError, arg=0)
+                    python_values.append(element.value)
+            except IterationError as e:
+                return RTResult().failure(e.error)
+        try:
+            return NDArray(_from_python(python_values))
+        except OverflowError as e:
+            raise LibError(f"{e}.", RTOverflowError, arg=0)
+
+    @lib_function(functions, "numeric")
+    def execute_numeric_zeros(self, length: int) -> Value:
+        """Return a new ndarray that contains 'length' zeros"""
+        if length < 0:
+            raise LibError("the length of an ndarray can not be negative.", arg=0)
+        return NDArray(numpy.zeros(length) if numpy is not None else [0.0] * length)
+
+    @lib_function(functions, "numeric")
+    def execute_numeric_arange(self, start: int, stop: int | None = None, step: int = 1) -> Value:
+        """Like `range`, but returns an ndarray. arange(stop) is arange(0, stop)."""
+        if stop is None:
+            start, stop = 0, start
+        if step == 0:
+            raise LibError("the step of a range can not be 0.", arg=2)
+        range_ = range(start, stop, step)
+        if len(range_) != 0 and not (INT_MIN <= range_[0] <= INT_MAX and INT_MIN <= range_[-1] <= INT_MAX):
+            raise LibError("a number is too big for an ndarray.", RTOverflowError, arg=0)
+        return NDArray(numpy.arange(start, stop, step, dtype=numpy.int64) if numpy is not None else list(range_))
+
+    @lib_function(functions, "numeric")
+    def execute_numeric_to_list(self, ndarray: NDArray) -> Value:
+        """Return the elements of the ndarray in a new list"""
+        return List([Number(e).set_context(self.context) for e in _to_python(ndarray.data)])
+
+    @lib_function(functions, "numeric")
+    def execute_numeric_sum(self, ndarray: NDArray) -> float:
+        """Return the sum of the elements"""
+        return _reduce(ndarray.data, "sum", sum)
+
+    @lib_function(functions, "numeric")
+    def execute_numeric_prod(self, ndarray: NDArray) -> float:
+        """Return the product of the elements"""
+        return _reduce(ndarray.data, "prod", math.prod)
+
+    @lib_function(functions, "numeric")
+    def execute_numeric_mean(self, ndarray: NDArray) -> float:
+        """Return the mean of the elements"""
+        _not_empty(ndarray, "mean")
+        return _scalar(ndarray.data.mean()) if numpy is not None else sum(ndarray.data) / len(ndarray.data)
+
+    @lib_function(functions, "numeric")
+    def execute_numeric_min(self, ndarray: NDArray) -> float:
+        """Return the smallest element"""
+        _not_empty(ndarray, "min")
+        return _min(ndarray.data)
+
+    @lib_function(functions, "numeric")
+    def execute_numeric_max(self, ndarray: NDArray) -> float:
+        """Return the biggest element"""
+        _not_empty(ndarray, "max")
+        return _scalar(ndarray.data.max()) if numpy is not None else max(ndarray.data)
+
+    @lib_function(functions, "numeric")
+    def execute_numeric_dot(self, first: NDArray, second: NDArray) -> float:
+        """Return the dot product of the two ndarrays (sum of first(i) * second(i))"""
+        if len(first.data) != len(second.data):
+            raise LibError(f"the ndarrays have different lengths ({len(first.data)} and {len(second.data)}).", arg=1)
+        return _reduce(first.data, "dot", lambda x, y: sum(a * b for a, b in zip(x, y)), second.data)
+
+    @lib_function(functions, "numeric")
+    def execute_numeric_sqrt(self, ndarray: NDArray) -> Value:
+        """Return the square roots of the elements"""
+        if len(ndarray.data) != 0 and _min(ndarray.data) < 0:
+            raise LibError("first argument of the built-in function ‘numeric.sqrt’ must not contain negative numbers.",
+                           RTArithmeticError, arg=0)
+        return NDArray(_map(ndarray.data, "sqrt", math.sqrt))
+
+    @lib_function(functions, "numeric")
+    def execute_numeric_log(self, ndarray: NDArray) -> Value:
+        """Return the natural logarithms of the elements"""
+        if len(ndarray.data) != 0 and _min(ndarray.data) <= 0:
+            raise LibError("first argument of the built-in function ‘numeric.log’ must contain only positive numbers.",
+                           RTArithmeticError, arg=0)
+        return NDArray(_map(ndarray.data, "log", math.log))
+
+    @lib_function(functions, "numeric")
+    def execute_numeric_exp(self, ndarray: NDArray) -> Value | RTResult:
+        """Return e ** x for each element x"""
+        try:
+            if numpy is not None:
+                with numpy.errstate(over="raise"):
+                    return NDArray(numpy.exp(ndarray.data))
+            return NDArray([math.exp(x) for x in ndarray.data])
+        except (OverflowError, FloatingPointError):
+            raise LibError("math range error.", RTOverflowError, arg=0)
+
+    @lib_function(functions, "numeric")
+    def execute_numeric_sin(self, ndarray: NDArray) -> Value:
+        """Return the sines of the elements (in radians)"""
+        return NDArray(_map(ndarray.data, "sin", math.sin))
+
+    @lib_function(functions, "numeric")
+    def execute_numeric_cos(self, ndarray: NDArray) -> Value:
+        """Return the cosines of the elements (in radians)"""
+        return NDArray(_map(ndarray.data, "cos", math.cos))
+
+    @lib_function(functions, "numeric")
+    def execute_numeric_abs(self, ndarray: NDArray) -> Value:
+        """Return the absolute values of the elements"""
+        minimum = _min(ndarray.data) if len(ndarray.data) != 0 else None
+        if isinstance(minimum, int) and minimum == INT_MIN:  # abs(INT_MIN) is INT_MAX + 1
+            raise LibError("a number is too big for an ndarray.", RTOverflowError, arg=0)
+        return NDArray(_map(ndarray.data, "abs", abs))
+
+
+WHAT_TO_IMPORT = {  # what are the new entries in the symbol table when the module is imported
+    # Constants
+    "backend": BACKEND,
+
+    # Functions
+    "array": Numeric("array"),
+    "zeros": Numeric("zeros"),
+    "arange": Numeric("arange"),
+    "to_list": Numeric("to_list"),
+    "sum": Numeric("sum"),
+    "prod": Numeric("prod"),
+    "mean": Numeric("mean"),
+    "min": Numeric("min"),
+    "max": Numeric("max"),
+    "dot": Numeric("dot"),
+    "sqrt": Numeric("sqrt"),
+    "log": Numeric("log"),
+    "exp": Numeric("exp"),
+    "sin": Numeric("sin"),
+    "cos": Numeric("cos"),
+    "abs": Numeric("abs"),
+}
@@ -18,6 +18,177 @@ from lib_.lib_to_make_libs import *
 # Comment about the above line : Context, RTResult, errors and values are imported in lib_to_make_libs.py
 # built-in python imports
 import random
+import types
+
+# a random.Random, or the random module itself (its functions use the global generator, whose seed is set by
+# `random.seed`)
+_RNG = random.Random | types.ModuleType
+
+
+# ##########
+# BULK GENERATION
+# ##########
+def _randints(rng: _RNG, a: int, b: int, n: int, context: Context | None) -> Value:
+    """A list of n random integers in [a, b], in this context"""
+    if a > b:
+        raise LibError("first argument of the built-in function 'random.randints' MUST be less than or equal to its "
+                       "second argument.")
+    if n < 0:
+        raise LibError("the number of integers can not be negative.", arg=2)
+    if b - a < 2 ** 53:  # `choices` picks each integer in one float multiplication, it is exact below 2**53
+        integers = rng.choices(range(a, b + 1), k=n)
+    else:
+        integers = [rng.randint(a, b) for _ in range(n)]
+    return List([Number(integer).set_context(context) for integer in integers])
+
+
+def _floats(rng: _RNG, n: int, context: Context | None) -> Value:
+    """A list of n random floats in [0, 1), in this context"""
+    if n < 0:
+        raise LibError("the number of floats can not be negative.", arg=0)
+    random_ = rng.random
+    return List([Number(random_()).set_context(context) for _ in range(n)])
+
+
+def _sample(rng: _RNG, elements: list[Value], k: int) -> Value:
+    """A list of k different elements of the list (different by their positions in the list)"""
+    if not 0 <= k <= len(elements):
+        raise LibError(f"the size of the sample must be between 0 and the length of the list ({len(elements)}).",
+                       arg=1)
+    return List(rng.sample(elements, k))
+
+
+def _seed_value(seed: Value) -> int | float | str | None:
+    """The python seed of a nougaro value (a number, a str or None)"""
+    if isinstance(seed, NoneValue):
+        return None
+    if isinstance(seed, (Number, String)):
+        return seed.value
+    raise LibError(f"type of the seed should be ‘int’, ‘float’, ‘str’ or ‘None’, got ‘{seed.type_}’ instead.",
+                   RTTypeError, arg=0)
+
+
+# ##########
+# GENERATOR
+# ##########
+class RandomGenerator(Value):
+    """Returned by `random.Generator(seed)`: a generator of pseudo-random numbers independent from the global one (and
+    from the other generators), with the same functions as the random module (`generator.randint(a, b)`, ...). Two
+    generators made with the same seed give the same numbers."""
+    def __init__(self, rng: random.Random):
+        super().__init__()
+        self.rng = rng
+        self.type_ = "random_generator"
+        for name in RandomGeneratorMethod.functions:
+            self.attributes[name] = RandomGeneratorMethod(name, rng)
+
+    def __repr__(self):
+        return "<random generator>"
+
+    def to_python_str(self) -> str:
+        return self.__repr__()
+
+    def to_str_(self):
+        return String(self.__repr__()).set_context(self.context), None
+
+    def is_eq(self, other: Value):
+        return isinstance(other, RandomGenerator) and self.rng is other.rng
+
+    def get_comparison_eq(self, other: Value):
+        if self.is_eq(other):
+            return TRUE.copy().set_context(self.context), None
+        return FALSE.copy().set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        if self.is_eq(other):
+            return FALSE.copy().set_context(self.context), None
+        return TRUE.copy().set_context(self.context), None
+
+    def is_true(self):
+        return True
+
+    def copy(self):
+        """Return a copy of self (the state is shared: a number taken from a copy is also taken from self)"""
+        copy = RandomGenerator(self.rng)
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+    def __copy__(self):
+        return self.copy()
+
+
+class RandomGeneratorMethod(ModuleFunction):
+    """The methods of a RandomGenerator (`generator.randint(a, b)`, ...)"""
+    functions: dict[str, BuiltinFunctionDict] = {}
+
+    def __init__(self, name: str, rng: random.Random):
+        super().__init__("random", name, functions=self.functions)
+        self.rng = rng
+
+    def __repr__(self):
+        return f'<built-in method {self.name} of random generator>'
+
+    def copy(self):
+        """Return a copy of self"""
+        copy = RandomGeneratorMethod(self.name, self.rng)
+        return self.set_context_and_pos_to_a_copy(copy)
+
+    @lib_function(functions, "random")
+    def execute_random_randint(self, a: int, b: int) -> int:
+        """Pick a random integer number in [a, b] mathematical range"""
+        if a > b:
+            raise LibError("first argument of the built-in function 'random.randint' MUST be less than or equal to its"
+                           " second argument.")
+        return self.rng.randint(a, b)
+
+    @lib_function(functions, "random")
+    def execute_random_random(self) -> float:
+        """Pick a random float in [0, 1)"""
+        return self.rng.random()
+
+    @lib_function(functions, "random")
+    def execute_random_choice(self, list_: list) -> Value:
+        """Return a random element of a list"""
+        if len(list_) == 0:
+            raise LibError("list is empty.", arg=0)
+        return self.rng.choice(list_)
+
+    @lib_function(functions, "random")
+    def execute_random_shuffle(self, list_: List) -> Value:
+        """Shuffle a list and returns it."""
+        py_list = list_.elements.copy()
+        self.rng.shuffle(py_list)
+        list_.elements = py_list
+        return list_
+
+    @lib_function(functions, "random")
+    def execute_random_seed(self, seed: Value) -> None:
+        """Set the seed of the generator"""
+        self.rng.seed(_seed_value(seed))
+
+    @lib_function(functions, "random")
+    def execute_random_randints(self, a: int, b: int, n: int) -> Value:
+        """Return a list of n random integers in [a, b]"""
+        return _randints(self.rng, a, b, n, self.context)
+
+    @lib_function(functions, "random")
+    def execute_random_floats(self, n: int) -> Value:
+        """Return a list of n random floats in [0, 1)"""
+        return _floats(self.rng, n, self.context)
+
+    @lib_function(functions, "random")
+    def execute_random_sample(self, list_: list, k: int) -> Value:
+        """Return a list of k different elements of the list"""
+        return _sample(self.rng, list_, k)
+
+    @lib_function(functions, "random")
+    def execute_random_spawn(self) -> Value:
+        """Return a new generator, seeded by this one: the generators spawned from generators with the same seed give
+        the same numbers (e.g. one generator per worker)"""
+        return RandomGenerator(random.Random(self.rng.getrandbits(128)))
 
 
 class Random(ModuleFunction):
@@ -187,6 +358,26 @@ class Random(ModuleFunction):
         "noug_dir": False
     }
 
+    @lib_function(functions, "random")
+    def execute_random_randints(self, a: int, b: int, n: int) -> Value:
+        """Return a list of n random integers in [a, b], in one call"""
+        return _randints(random, a, b, n, self.context)
+
+    @lib_function(functions, "random")
+    def execute_random_floats(self, n: int) -> Value:
+        """Return a list of n random floats in [0, 1), in one call"""
+        return _floats(random, n, self.context)
+
+    @lib_function(functions, "random")
+    def execute_random_sample(self, list_: list, k: int) -> Value:
+        """Return a list of k different elements of the list"""
+        return _sample(random, list_, k)
+
+    @lib_function(functions, "random")
+    def execute_random_Generator(self, seed: Value | None = None) -> Value:
+        """Return a new random generator, independent from the global one. Without seed, it is seeded by the system."""
+        return RandomGenerator(random.Random(_seed_value(seed) if seed is not None else None))
+
 
 WHAT_TO_IMPORT = {  # what are the new entries in the symbol table when the module is imported
     # functions
@@ -195,4 +386,8 @@ WHAT_TO_IMPORT = {  # what are the new entries in the symbol table when the modu
     "choice": Random("choice"),
     "shuffle": Random("shuffle"),
     "seed": Random("seed"),
+    "randints": Random("randints"),
+    "floats": Random("floats"),
+    "sample": Random("sample"),
+    "Generator": Random("Generator"),
 }
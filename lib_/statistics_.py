@@ -17,6 +17,7 @@
 from lib_.lib_to_make_libs import *
 # Comment about the above line : Context, RTResult and values are imported in lib_to_make_libs.py
 # built-in python imports
+import math
 import statistics
 
 
@@ -29,6 +30,252 @@ class RTStatisticsError(RunTimeError):
         self.context = context
 
 
+# ##########
+# RUNNING STATISTICS
+# ##########
+class _P2Quantile:
+    """Estimates a quantile of a stream of numbers with the P² algorithm (Jain and Chlamtac, 1985): only five markers
+    are kept, whatever the number of values"""
+    def __init__(self, p: float):
+        self.p = p
+        self.heights: list[float] = []  # the first five values, then the heights of the markers
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired_positions = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def __repr__(self):
+        return f"<_P2Quantile {self.p}>"
+
+    def push(self, x: float):
+        heights = self.heights
+        if len(heights) < 5:
+            heights.append(x)
+            if len(heights) == 5:
+                heights.sort()
+            return
+
+        # find the cell of x, and update the extreme markers
+        if x < heights[0]:
+            heights[0] = x
+            cell = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            cell = 3
+        else:
+            cell = 0
+            while x >= heights[cell + 1]:
+                cell += 1
+        positions = self.positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self.desired_positions[i] += self.increments[i]
+
+        # move the middle markers if they are too far from their desired positions
+        for i in range(1, 4):
+            delta = self.desired_positions[i] - positions[i]
+            if (delta >= 1 and positions[i + 1] - positions[i] > 1) or \
+                    (delta <= -1 and positions[i - 1] - positions[i] < -1):
+                d = 1 if delta > 0 else -1
+                height = self._parabolic(i, d)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + d * (heights[i + d] - heights[i]) / (positions[i + d] - positions[i])
+                heights[i] = height
+                positions[i] += d
+
+    def _parabolic(self, i: int, d: int) -> float:
+        heights, positions = self.heights, self.positions
+        return heights[i] + d / (positions[i + 1] - positions[i - 1]) * (
+            (positions[i] - positions[i - 1] + d) * (heights[i + 1] - heights[i]) / (positions[i + 1] - positions[i])
+            + (positions[i + 1] - positions[i] - d) * (heights[i] - heights[i - 1]) / (positions[i] - positions[i - 1])
+        )
+
+    def value(self) -> float:
+        if self.positions[4] > 5:  # more than five values: the markers give the estimation
+            return self.heights[2]
+        # five values or less: exact quantile, linearly interpolated
+        heights = sorted(self.heights)
+        index = self.p * (len(heights) - 1)
+        lower = int(index)
+        if lower + 1 == len(heights):
+            return heights[lower]
+        return heights[lower] + (heights[lower + 1] - heights[lower]) * (index - lower)
+
+
+class _RunningState:
+    """Count, mean and sum of squared deviations (Welford’s algorithm), extrema and quantile estimators of a stream of
+    numbers. Shared by the copies of a RunningStatistics."""
+    def __init__(self, quantiles: list[float]):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # sum of the squared deviations from the mean
+        self.min: int | float | None = None
+        self.max: int | float | None = None
+        self.quantiles = [_P2Quantile(p) for p in quantiles]
+
+    def __repr__(self):
+        return f"<_RunningState (count={self.count})>"
+
+    def push(self, x: int | float):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+        for quantile in self.quantiles:
+            quantile.push(x)
+
+
+class RunningStatistics(Value):
+    """Returned by `statistics.running()`: statistics of a stream of numbers given one by one with `.push(x)`, computed
+    in constant memory"""
+    def __init__(self, state: _RunningState):
+        super().__init__()
+        self.state = state
+        self.type_ = "running_statistics"
+        for name in RunningMethod.functions:
+            self.attributes[name] = RunningMethod(name, state)
+
+    def __repr__(self):
+        return f"<running statistics (count={self.state.count})>"
+
+    def to_python_str(self) -> str:
+        return self.__repr__()
+
+    def to_str_(self):
+        return String(self.__repr__()).set_context(self.context), None
+
+    def is_eq(self, other: Value):
+        return isinstance(other, RunningStatistics) and self.state is other.state
+
+    def get_comparison_eq(self, other: Value):
+        if self.is_eq(other):
+            return TRUE.copy().set_context(self.context), None
+        return FALSE.copy().set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        if self.is_eq(other):
+            return FALSE.copy().set_context(self.context), None
+        return TRUE.copy().set_context(self.context), None
+
+    def is_true(self):
+        return True
+
+    def copy(self):
+        """Return a copy of self (the state is shared: pushing a value to a copy also pushes it to self)"""
+        copy = RunningStatistics(self.state)
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+    def __copy__(self):
+        return self.copy()
+
+
+class RunningMethod(ModuleFunction):
+    """The methods of a RunningStatistics (`running.push(x)`, `running.mean()`, ...)"""
+    functions: dict[str, BuiltinFunctionDict] = {}
+
+    def __init__(self, name: str, state: _RunningState):
+        super().__init__("statistics", name, functions=self.functions)
+        self.state = state
+
+    def __repr__(self):
+        return f'<built-in method {self.name} of running statistics>'
+
+    def copy(self):
+        """Return a copy of self"""
+        copy = RunningMethod(self.name, self.state)
+        return self.set_context_and_pos_to_a_copy(copy)
+
+    def _not_empty(self, minimum_count: int = 1):
+        if self.state.count < minimum_count:
+            raise LibError(f"‘{self.name}’ needs at least {minimum_count} value{'s' if minimum_count > 1 else ''}, "
+                           f"but {self.state.count} {'were' if self.state.count > 1 else 'was'} pushed.",
+                           RTStatisticsError)
+
+    @lib_function(functions, "statistics")
+    def execute_statistics_push(self, x: float) -> None:
+        """Add a number to the data"""
+        self.state.push(x)
+
+    @lib_function(functions, "statistics")
+    def execute_statistics_extend(self, iterable: Value) -> Value | RTResult:
+        """Add all the numbers of a list (or of any iterable value, such as a generator) to the data"""
+        iterator = iterable.iter_()
+        if iterator is None:
+            raise LibError(f"expected an iterable value, but got {iterable.type_}.", RTTypeError, arg=0)
+        try:
+            for element in iterator:
+                if not isinstance(element, Number):
+                    raise LibError(f"expected numbers, but found an element of type {element.type_}.",
+                                   RTTypeError, arg=0)
+                self.state.push(element.value)
+        except IterationError as e:
+            return RTResult().failure(e.error)
+        return NoneValue(False)
+
+    @lib_function(functions, "statistics")
+    def execute_statistics_count(self) -> int:
+        """Return the number of values pushed so far"""
+        return self.state.count
+
+    @lib_function(functions, "statistics")
+    def execute_statistics_mean(self) -> float:
+        """Return the mean of the data"""
+        self._not_empty()
+        return self.state.mean
+
+    @lib_function(functions, "statistics")
+    def execute_statistics_variance(self) -> float:
+        """Return the sample variance of the data (like statistics.variance in python)"""
+        self._not_empty(2)
+        return self.state.m2 / (self.state.count - 1)
+
+    @lib_function(functions, "statistics")
+    def execute_statistics_pvariance(self) -> float:
+        """Return the population variance of the data (like statistics.pvariance in python)"""
+        self._not_empty()
+        return self.state.m2 / self.state.count
+
+    @lib_function(functions, "statistics")
+    def execute_statistics_stdev(self) -> float:
+        """Return the sample standard deviation of the data"""
+        self._not_empty(2)
+        return math.sqrt(self.state.m2 / (self.state.count - 1))
+
+    @lib_function(functions, "statistics")
+    def execute_statistics_min(self) -> float:
+        """Return the smallest value"""
+        self._not_empty()
+        assert self.state.min is not None
+        return self.state.min
+
+    @lib_function(functions, "statistics")
+    def execute_statistics_max(self) -> float:
+        """Return the biggest value"""
+        self._not_empty()
+        assert self.state.max is not None
+        return self.state.max
+
+    @lib_function(functions, "statistics")
+    def execute_statistics_quantile(self, p: float) -> float:
+        """Return an estimation of the quantile p (e.g. 0.5 for the median). Only the quantiles given to
+        `statistics.running` are available."""
+        for quantile in self.state.quantiles:
+            if quantile.p == p:
+                self._not_empty()
+                return quantile.value()
+        available = ", ".join(str(quantile.p) for quantile in self.state.quantiles)
+        raise LibError(f"the quantile {p} is not estimated. Available quantiles: {available}.",
+                       RTStatisticsError, arg=0)
+
+
 class Statistics(ModuleFunction):
     """ Statistics module """
     functions: dict[str, BuiltinFunctionDict] = {}
@@ -657,6 +904,21 @@ class Statistics(ModuleFunction):
         "noug_dir": False
     }
 
+    @lib_function(functions, "statistics")
+    def execute_statistics_running(self, quantiles: list | None = None) -> Value:
+        """Return a new running statistics value: push the numbers one by one with `.push(x)`, then ask for their
+        `.mean()`, `.variance()`, `.quantile(p)`, ... Only a few numbers are stored, whatever the size of the data.
+        The quantiles to estimate (the quartiles by default) must be given here."""
+        if quantiles is None:
+            return RunningStatistics(_RunningState([0.25, 0.5, 0.75]))
+        probabilities: list[float] = []
+        for element in quantiles:
+            if not isinstance(element, Number) or not 0 < element.value < 1:
+                raise LibError("the quantiles to estimate must be numbers between 0 and 1 (excluded).",
+                               RTStatisticsError, arg=0)
+            probabilities.append(element.value)
+        return RunningStatistics(_RunningState(probabilities))
+
 
 WHAT_TO_IMPORT = {  # what are the new entries in the symbol table when the module is imported
     # functions
@@ -668,4 +930,5 @@ WHAT_TO_IMPORT = {  # what are the new entries in the symbol table when the modu
     "scope": Statistics("scope"),
     "mode": Statistics("mode"),
     "multimode": Statistics("multimode"),
+    "running": Statistics("running"),
 }
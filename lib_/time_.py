@@ -17,6 +17,8 @@
 from lib_.lib_to_make_libs import *
 # Comment about the above line : Context, RTResult and values are imported in lib_to_make_libs.py
 # built-in python imports
+import math
+import statistics
 import time
 
 # CONSTANTS
@@ -121,6 +123,100 @@ class Time(ModuleFunction):
         "noug_dir": False
     }
 
+    @lib_function(functions, "time")
+    def execute_time_perf_counter(self) -> float:
+        """Like python time.perf_counter(): a clock with the highest available resolution, in seconds. Only the
+        difference between two results makes sense."""
+        return time.perf_counter()
+
+    @lib_function(functions, "time")
+    def execute_time_perf_counter_ns(self) -> int:
+        """Like time.perf_counter(), but in nanoseconds (int)"""
+        return time.perf_counter_ns()
+
+    @lib_function(functions, "time")
+    def execute_time_monotonic(self) -> float:
+        """Like python time.monotonic(): a clock that can not go backwards, in seconds"""
+        return time.monotonic()
+
+    @lib_function(functions, "time")
+    def execute_time_process_time(self) -> float:
+        """Like python time.process_time(): the CPU time of the process (without the sleeps), in seconds"""
+        return time.process_time()
+
+    def execute_time_bench(self, caller: FunctionCaller, function: Value, n: Value | None = None):
+        """Call a function (without arguments) n times (100 by default), and return a dict with the minimum, the
+        median, the 95th percentile and the mean of the durations of the calls, in seconds. The cost of reading the
+        clock (the `overhead`, also in the dict) is subtracted from each duration."""
+        # Params:
+        # * function
+        # Optional params:
+        # * n
+        assert self.context is not None
+        if not isinstance(function, BaseFunction):
+            assert function.pos_start is not None
+            assert function.pos_end is not None
+            return RTResult().failure(RTTypeErrorF(
+                function.pos_start, function.pos_end, "first", "time.bench", "function", function,
+                self.context, "lib_.time_.Time.execute_time_bench"
+            ))
+        if n is None:
+            n = Number(100)
+        if not (isinstance(n, Number) and isinstance(n.value, int)):
+            assert n.pos_start is not None
+            assert n.pos_end is not None
+            return RTResult().failure(RTTypeErrorF(
+                n.pos_start, n.pos_end, "second", "time.bench", "int", n,
+                self.context, "lib_.time_.Time.execute_time_bench"
+            ))
+        if n.value < 1:
+            assert n.pos_start is not None
+            assert n.pos_end is not None
+            return RTResult().failure(RunTimeError(
+                n.pos_start, n.pos_end, "second argument of built-in function ‘time.bench’ must be at least 1.",
+                self.context, origin_file="lib_.time_.Time.execute_time_bench"
+            ))
+
+        # calibration: the shortest time between two readings of the clock. The cost of the call itself is not
+        # subtracted: it depends on the function (built-in or not, frame reused or not), and it is part of what is
+        # measured.
+        overhead = math.inf
+        for _ in range(min(n.value, 100)):
+            start = time.perf_counter_ns()
+            overhead = min(overhead, time.perf_counter_ns() - start)
+
+        call = caller.repeated(function)
+        durations: list[int] = []
+        for _ in range(n.value):
+            start = time.perf_counter_ns()
+            result = call([])
+            end = time.perf_counter_ns()
+            if result.should_return():  # we stop at the first error
+                return result
+            durations.append(max(end - start - overhead, 0))
+
+        durations.sort()
+        p95 = durations[math.ceil(0.95 * len(durations)) - 1]
+        return RTResult().success(py2noug({
+            "n": n.value,
+            "min": durations[0] / 1e9,
+            "median": statistics.median(durations) / 1e9,
+            "p95": p95 / 1e9,
+            "mean": statistics.fmean(durations) / 1e9,
+            "overhead": overhead / 1e9,
+        }))
+
+    functions["bench"] = {
+        "function": execute_time_bench,
+        "param_names": ["function"],
+        "optional_params": ["n"],
+        "should_respect_args_number": True,
+        "run_noug_dir_work_dir": False,
+        "noug_dir": False,
+        "fast_call": True,
+        "calls_functions": True
+    }
+
 
 WHAT_TO_IMPORT = {  # what are the new entries in the symbol table when the module is imported
     # functions
@@ -128,6 +224,11 @@ WHAT_TO_IMPORT = {  # what are the new entries in the symbol table when the modu
     "sleep_milliseconds": Time("sleep_milliseconds"),
     "time": Time("time"),
     "epoch": Time("epoch"),
+    "perf_counter": Time("perf_counter"),
+    "perf_counter_ns": Time("perf_counter_ns"),
+    "monotonic": Time("monotonic"),
+    "process_time": Time("process_time"),
+    "bench": Time("bench"),
     # constants
     "timezone": TIMEZONE,
 }
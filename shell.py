@@ -20,25 +20,30 @@
 # Works with python 3.11 and 3.12
 
 # IMPORTS
+# __future__ import (must be first)
+from __future__ import annotations
+# startup profile (must be before the other imports, in order to record them)
+import sys
+from src.startup_profile import STARTUP_PROFILE
+if "--profile-startup" in sys.argv:
+    STARTUP_PROFILE.enable()
 # nougaro modules imports
-import src.nougaro as nougaro
-from src.misc import print_in_red
-from src.runtime.values.basevalues.value import Value
-from src.runtime.values.basevalues.basevalues import List
-from src.errors.errors import Error
+# Note: the interpreter (src.nougaro) and the server are imported in the functions that need them, so that `-v` or
+# `--client` do not have to wait for them
+from src.misc import print_in_red, close_open_files
+from src.output import install_console_output, get_console_output
+from src.runtime.import_resolver import get_import_resolver
+from src.runtime.module_cache import MODULE_CACHE
 # built in python imports
 import json
-import sys
 import os
-import platform
 import pathlib
-import argparse
-from datetime import datetime
-if platform.system() in ["Linux", "Darwin"] or "BSD" in platform.system():
-    try:
-        import readline  # browse command history # type: ignore
-    except ImportError:
-        pass
+# special typing import
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import argparse
+    from src.runtime.values.basevalues.value import Value
+    from src.errors.errors import Error
 
 
 def check_arguments(args: argparse.Namespace, noug_dir: str, version: str):
@@ -82,6 +87,12 @@ def check_arguments(args: argparse.Namespace, noug_dir: str, version: str):
 
 
 def execute_file(path: str, debug_on: bool, noug_dir: str, version: str, args: list[str]):
+    with open(path, encoding="UTF-8") as file:
+        file_content = str(file.read())
+    execute_file_content(path, file_content, debug_on, noug_dir, version, args)
+
+
+def execute_file_content(path: str, file_content: str, debug_on: bool, noug_dir: str, version: str, args: list[str]):
     work_dir = os.path.dirname(os.path.realpath(path))
     endswith_slash = work_dir.endswith("/") or work_dir.endswith("\\")
     if endswith_slash:
@@ -89,20 +100,21 @@ def execute_file(path: str, debug_on: bool, noug_dir: str, version: str, args: l
     if debug_on:
         print(f"Nougaro working directory is {work_dir} ({type(work_dir)})")
 
-    with open(path, encoding="UTF-8") as file:
-        file_content = str(file.read())
-
     if file_content == "":  # no need to run this empty file
         error = None
     else:  # the file isn't empty, let's run it !
+        import src.nougaro as nougaro
         try:
-            _, error = nougaro.run('<stdin>', file_content, noug_dir, version, args=args, work_dir=work_dir)
+            _, error = nougaro.run('<stdin>', file_content, noug_dir, version, args=args, work_dir=work_dir,
+                                   result_is_used=False)
         except KeyboardInterrupt:  # if CTRL+C, just exit the Nougaro shell
             print_in_red("\nKeyboardInterrupt")
             sys.exit()
         except EOFError:
             print_in_red("\nEOF")
             sys.exit()
+        finally:
+            close_open_files()
 
     if error is not None:  # there is an error, so before exiting we have to say "OH NO IT'S BROKEN"
         print_in_red(error.as_string())
@@ -118,6 +130,7 @@ def print_result_and_error(result: Value | None, error: Error | None, args: argp
         return
     if exit_on_cd and args.command_ is not None:
         return
+    from src.runtime.values.basevalues.basevalues import List
     if not isinstance(result, List):
         print("WARNING: Looks like something went wrong. Don't panic, and just report this bug at:\n"
               "https://jd-develop.github.io/nougaro/bugreport.html.\n"
@@ -143,15 +156,50 @@ def print_result_and_error(result: Value | None, error: Error | None, args: argp
             print(result)
 
 
+def get_version(noug_dir: str) -> str:
+    """Return the version stored in config/noug_version.json, such as '0.18.0-beta'"""
+    with open(os.path.abspath(noug_dir + "/config/noug_version.json")) as ver_json:
+        # we load the nougaro version stored in noug_version.json
+        ver_json_loaded = json.load(ver_json)
+        major = ver_json_loaded.get("major")
+        minor = ver_json_loaded.get("minor")
+        patch = ver_json_loaded.get("patch")
+        phase = ver_json_loaded.get("phase")
+        phase_minor = ver_json_loaded.get("phase-minor")
+        version = f"{major}.{minor}.{patch}-{phase}"
+        if phase_minor != 0:
+            version += f".{phase_minor}"
+    return version
+
+
+def get_socket_path(socket_argument: str | None) -> str:
+    """Return the path of the UNIX socket used by `--serve` and `--client`: the `--socket` argument, or the default
+    one"""
+    if socket_argument is not None:
+        return socket_argument
+    import src.server as server
+    try:
+        return server.default_socket_path()
+    except OSError as e:
+        print_in_red(f"[nougaro] fatal error: unable to use the default socket ({e}). Use --socket to choose another "
+                     f"path.")
+        sys.exit(1)
+
+
 def main():
     noug_dir = os.path.abspath(pathlib.Path(__file__).parent.absolute())
 
+    if sys.argv[1:] in (["-v"], ["--version"]):  # fast path: no need to parse the arguments
+        print(get_version(noug_dir))
+        return
+
     with open(os.path.abspath(noug_dir + "/config/debug.conf")) as debug_f:
         debug_on = bool(int(debug_f.read()))
 
     with open(os.path.abspath(noug_dir + "/config/print_context.conf")) as print_context_f:
         print_context = bool(int(print_context_f.read()))
 
+    import argparse
     argument_parser = argparse.ArgumentParser(prog="nougaro",
                                               description="Nougaro: a programming language.",
                                               epilog="Any other argument is passed in Nougaro. Arguments "
@@ -163,24 +211,52 @@ def main():
     argument_parser.add_argument("-c", "--command", help="run a command with shell output.")
     argument_parser.add_argument("-d", "--cd", "--command_dont_verbose", help="run a command without shell output.", dest="command_")
     argument_parser.add_argument("-v", "--version", help="print the version and exit.", action="store_true")
+    argument_parser.add_argument("--trace-imports", help="print on stderr where each imported module is found and "
+                                                         "how long it took to find it.", action="store_true")
+    argument_parser.add_argument("--eager-imports", help="execute the imported modules as soon as they are imported, "
+                                                         "instead of when they are first used (useful for "
+                                                         "debugging).", action="store_true")
+    argument_parser.add_argument("--serve", help="keep a pre-warmed interpreter listening on a UNIX socket, that runs "
+                                                 "the files sent by `--client`.", action="store_true")
+    argument_parser.add_argument("--client", help="send the file to the `--serve` server instead of running it in "
+                                                  "this process.", action="store_true")
+    argument_parser.add_argument("--socket", help="path of the UNIX socket used by `--serve` and `--client`.",
+                                 default=None)
     argument_parser.add_argument("file", nargs="?", help="name of the file to run.", default="<stdin>")
+    argument_parser.add_argument("--profile-startup", help="print on stderr how long each import and each startup "
+                                                           "phase took.", action="store_true")
+    argument_parser.add_argument("--output-buffer", help="size (in chars) of the buffer of the console output. 0 "
+                                                         "writes each print at once. By default, the buffer is "
+                                                         "written at each new line in a terminal, and when it is full "
+                                                         "in a pipe.", type=int, default=None)
     args, nougaro_args = argument_parser.parse_known_args()
 
-    with open(os.path.abspath(noug_dir + "/config/noug_version.json")) as ver_json:
-        # we load the nougaro version stored in noug_version.json
-        ver_json_loaded = json.load(ver_json)
-        major = ver_json_loaded.get("major")
-        minor = ver_json_loaded.get("minor")
-        patch = ver_json_loaded.get("patch")
-        phase = ver_json_loaded.get("phase")
-        phase_minor = ver_json_loaded.get("phase-minor")
-        version = f"{major}.{minor}.{patch}-{phase}"
-        if phase_minor != 0:
-            version += f".{phase_minor}"
+    version = get_version(noug_dir)
+
+    if args.serve:
+        import src.server as server
+        socket_path = get_socket_path(args.socket)
+        server.serve(
+            socket_path, noug_dir,
+            lambda file, text, cwd, args_: execute_file_content(file, text, debug_on, noug_dir, version, args_)
+        )
+        return
 
     path, line_to_exec = check_arguments(args, noug_dir, version)
+    if args.trace_imports:
+        get_import_resolver(noug_dir).trace = True
+    if args.eager_imports:
+        MODULE_CACHE.eager_imports = True
 
     has_to_run_a_file = path not in ["<stdin>", "<commandline>"]
+    if args.client:
+        if not has_to_run_a_file:
+            print_in_red("[nougaro] fatal error: --client needs a file to send to the server.")
+            sys.exit(1)
+        import src.server as server
+        socket_path = get_socket_path(args.socket)
+        sys.exit(server.client(socket_path, path, nougaro_args))
+    install_console_output(args.output_buffer)
     if has_to_run_a_file:
         execute_file(path, debug_on, noug_dir, version, nougaro_args)
         return
@@ -194,7 +270,15 @@ def main():
     # HOWEVER, if we are in a pipe, like `echo "$" | nougaro`, we don’t want our prompt to be printed
     should_print_stuff = sys.stdin.isatty()
 
+    import src.nougaro as nougaro
     if path == "<stdin>":  # we open the shell
+        import platform
+        from datetime import datetime
+        if platform.system() in ["Linux", "Darwin"] or "BSD" in platform.system():
+            try:
+                import readline  # browse command history # type: ignore
+            except ImportError:
+                pass
         if should_print_stuff:
             # this text is always printed when we start the shell
             print(f"Welcome to Nougaro {version} on {platform.system()}!")
@@ -270,4 +354,10 @@ def main():
 
 
 if __name__ == '__main__':  # SOMEBODY ONCE TOLD ME it was good to do that
-    main()
+    try:
+        main()
+    finally:
+        console_output = get_console_output()
+        if console_output is not None:
+            console_output.flush()
+        STARTUP_PROFILE.report(console_output)
@@ -180,6 +180,14 @@ class RTIndexError(RunTimeError):
                          origin_file=origin_file)
 
 
+class RTKeyError(RunTimeError):
+    """Key error (like 'get({"a": 1}, "b")')"""
+    def __init__(self, pos_start: Position, pos_end: Position, details: str, context: Context,
+                 origin_file: str = "(undetermined)"):
+        super().__init__(pos_start, pos_end, details, context, rt_error=False, error_name="KeyError",
+                         origin_file=origin_file)
+
+
 class RTArithmeticError(RunTimeError):
     """Arithmetic error (like 1/0)"""
     def __init__(self, pos_start: Position, pos_end: Position, details: str, context: Context,
@@ -274,3 +282,11 @@ class PythonError(RunTimeError):
         tb += "============ End of the python traceback ============\n"
 
         return tb
+
+
+class IterationError(Exception):
+    """Python exception raised by the iterators returned by Value.iter_() when the next element can not be made (e.g.
+    there is an error in the body of a generator). It is not a Nougaro error: the Nougaro error is in `error`."""
+    def __init__(self, error: Error):
+        super().__init__(error.details)
+        self.error = error
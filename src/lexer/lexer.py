@@ -219,6 +219,14 @@ class Lexer:
                 there_is_a_space_or_a_tab_or_a_comment = False
                 tokens.append(Token(TT["RSQUARE"], pos_start=self.pos))
                 self.advance()
+            elif self.current_char == '{':
+                there_is_a_space_or_a_tab_or_a_comment = False
+                tokens.append(Token(TT["LCURLY"], pos_start=self.pos))
+                self.advance()
+            elif self.current_char == '}':
+                there_is_a_space_or_a_tab_or_a_comment = False
+                tokens.append(Token(TT["RCURLY"], pos_start=self.pos))
+                self.advance()
 
             # equals (+=, -=, ... are generated above, in the 'basic math stuff' category)
             elif self.current_char == '!':
@@ -256,6 +264,12 @@ class Lexer:
                 tokens.append(Token(TT["COMMA"], pos_start=self.pos))
                 self.advance()
 
+            # colon (in dicts)
+            elif self.current_char == ':':
+                there_is_a_space_or_a_tab_or_a_comment = False
+                tokens.append(Token(TT["COLON"], pos_start=self.pos))
+                self.advance()
+
             # dollar-print
             elif self.current_char == "$":
                 there_is_a_space_or_a_tab_or_a_comment = False
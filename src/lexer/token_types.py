@@ -73,8 +73,11 @@ TT = {
     "LPAREN": '(',               # (
     "RSQUARE": ']',              # ]
     "LSQUARE": '[',              # [
+    "RCURLY": '}',               # }
+    "LCURLY": '{',               # {
     
     "COMMA": ',',                # ,
+    "COLON": ':',                # :
     "ARROW": '->',               # ->
     "INTERROGATIVE_PNT": '?',    # ?
 
@@ -111,6 +114,7 @@ KEYWORDS = [                        # List of all the keywords (TT["KEYWORD"])
     # functions
     'def',
     'return',
+    'yield',
     # classes
     'class',
     # modules
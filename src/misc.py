@@ -11,33 +11,48 @@
 # __future__ import (must be first)
 from __future__ import annotations
 # nougaro modules imports
-from src.runtime.context import Context
-from src.parser.nodes import Node
-from src.errors.errors import Error
-from src.runtime.values.basevalues.basevalues import String
-from src.runtime.values.basevalues.value import Value
-from src.runtime.runtime_result import RTResult
+# String is imported in nice_str_from_idk: this file is imported by shell.py before the interpreter is needed
 # built-in python imports
-from typing import Protocol, Any, TypedDict, Sequence, Callable
+from typing import Protocol, Any, TypedDict, Sequence, Callable, NotRequired
 import os
-try:
-    from colorama import init as colorama_init, Fore
-    ForeRED: str = Fore.RED
-    ForeRESET: str = Fore.RESET
-except (ModuleNotFoundError, ImportError):
-    def colorama_init():
-        return None
-    ForeRED: str = ""
-    ForeRESET: str = ""
-
-colorama_init()
+import sys
+# special typing import
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.runtime.context import Context
+    from src.parser.nodes import Node
+    from src.errors.errors import Error
+    from src.runtime.values.basevalues.basevalues import String
+    from src.runtime.values.basevalues.value import Value
+    from src.runtime.runtime_result import RTResult
 
 
 # ##########
 # COLORS
 # ##########
+_colors: tuple[str, str] | None = None
+
+
+def _red_and_reset() -> tuple[str, str]:
+    """Import and init colorama the first time something is printed in red"""
+    global _colors
+    if _colors is None:
+        try:
+            from colorama import init as colorama_init, Fore
+            colorama_init()
+            _colors = (Fore.RED, Fore.RESET)
+        except (ModuleNotFoundError, ImportError):
+            _colors = ("", "")
+    return _colors
+
+
 # prints text in red.
-def print_in_red(txt: str = ""): print(ForeRED + txt + ForeRESET)
+def print_in_red(txt: str = ""):
+    """Print the text in red, then flush stdout (the errors are printed in red: they must be seen at once, even if
+    the console output is buffered, see src.output)"""
+    fore_red, fore_reset = _red_and_reset()
+    sys.stdout.write(f"{fore_red}{txt}{fore_reset}\n")
+    sys.stdout.flush()
 
 
 # ##########
@@ -72,8 +87,18 @@ def clear_screen():
     os.system('cls' if (os.name.lower() == "nt" or os.name.lower().startswith("windows")) else 'clear')
 
 
+def close_open_files():
+    """Close the files opened with the `io` lib that are still open, so that their buffers are written. Call it at the
+    end of a script: the `atexit` handler of the lib is not enough, because the children of the server (`--serve`)
+    leave with os._exit."""
+    io_lib = sys.modules.get("lib_.io_")  # the lib is not imported if no script used it
+    if io_lib is not None:
+        io_lib.close_open_files()
+
+
 def nice_str_from_idk(idk: Any) -> String:
     """Returns a NOUGARO string from either a PYTHON value either a NOUGARO string"""
+    from src.runtime.values.basevalues.basevalues import String
     if isinstance(idk, String):
         return idk
     elif isinstance(idk, str):
@@ -96,7 +121,8 @@ class RunFunction(Protocol):
         use_default_symbol_table: bool = False,
         use_context: Context | None = None,
         args: Sequence[str | String] | None = None,
-        work_dir: str | None = None
+        work_dir: str | None = None,
+        result_is_used: bool = True
     ) -> tuple[Value, None] | tuple[None, Error]:
         ...
 
@@ -111,6 +137,13 @@ class BuiltinFunctionDict(TypedDict):
     should_respect_args_number: bool
     run_noug_dir_work_dir: bool
     noug_dir: bool  # if run_noug_dir_work_dir is True then this is False
+    # fast-call protocol: if True, `function` is called as `function(self, *args)`, without creating a context.
+    # The arguments are the given values (missing optional params are not given), in the context of the function
+    # (`self.context`, set on each argument like the normal protocol sets its new context), and errors use it too.
+    fast_call: NotRequired[bool]
+    # with fast_call: if True, `function` is called as `function(self, caller, *args)`, where caller is a FunctionCaller
+    # that can call the nougaro functions given as arguments (see src.runtime.values.functions.function_caller)
+    calls_functions: NotRequired[bool]
 
 
 # ##########
@@ -21,6 +21,7 @@
 # nougaro modules imports
 from src.lexer.lexer import Lexer
 from src.parser.parser import Parser
+from src.parser.nodes import mark_value_unused
 import src.runtime.interpreter
 from src.runtime.symbol_table import SymbolTable
 from src.runtime.set_symbol_table import set_symbol_table
@@ -28,18 +29,29 @@ from src.errors.errors import *
 from src.runtime.values.basevalues.value import Value
 from src.runtime.values.basevalues.basevalues import String, List, NoneValue
 from src.misc import nice_str_from_idk
+from src.startup_profile import STARTUP_PROFILE
 # built-in python imports
-import json
 import os.path
 from typing import Sequence
 
 # ##########
 # SYMBOL TABLE
 # ##########
-# we create a symbol table, then we define base things a symbol table needs
-global_symbol_table = SymbolTable()
-set_symbol_table(global_symbol_table)  # This function is in src.set_symbol_table
-default_symbol_table = global_symbol_table.copy()
+# the symbol tables are created the first time `run` is called, not at import time
+global_symbol_table: SymbolTable | None = None
+default_symbol_table: SymbolTable | None = None
+
+
+def init_symbol_tables() -> tuple[SymbolTable, SymbolTable]:
+    """Create the global and the default symbol tables if they do not exist yet, then return them."""
+    global global_symbol_table, default_symbol_table
+    if global_symbol_table is None or default_symbol_table is None:
+        with STARTUP_PROFILE.phase("build the symbol tables"):
+            # we create a symbol table, then we define base things a symbol table needs
+            global_symbol_table = SymbolTable()
+            set_symbol_table(global_symbol_table)  # This function is in src.set_symbol_table
+            default_symbol_table = global_symbol_table.copy()
+    return global_symbol_table, default_symbol_table
 
 
 # ##########
@@ -55,10 +67,13 @@ def run(
         use_default_symbol_table: bool = False,
         use_context: Context | None = None,
         args: Sequence[str | String] | None = None,
-        work_dir: str | None = None
+        work_dir: str | None = None,
+        result_is_used: bool = True
 ) -> tuple[Value, None] | tuple[None, Error]:
     """Run the given code.
-    The code is given through the `text` argument."""
+    The code is given through the `text` argument.
+    If `result_is_used` is False, the top-level loops do not keep the values of their body."""
+    global_symbol_table, default_symbol_table = init_symbol_tables()
     with open(os.path.abspath(noug_dir + "/config/debug.conf")) as debug_f:
         debug_on = bool(int(debug_f.read()))
 
@@ -66,6 +81,7 @@ def run(
         print_context = bool(int(print_context.read()))
 
     if version is None:
+        import json
         with open(os.path.abspath(noug_dir + "/config/noug_version.json")) as ver_json:
             # we get the nougaro version from noug_version.json
             ver_json_loaded = json.load(ver_json)
@@ -111,6 +127,8 @@ def run(
     assert ast.node is not None
     if debug_on:
         print(ast)
+    if not result_is_used:
+        mark_value_unused(ast.node)
 
     # run the code (interpreter)
     if work_dir is None:
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Console output: `print`, `write ... >> "<stdout>"` and the errors are written in a buffer, that is written to the
+# real stdout in one go. This file must stay light: it is imported by shell.py before the interpreter is needed.
+
+# IMPORTS
+# built-in python imports
+import atexit
+import io
+import sys
+from typing import TextIO
+
+DEFAULT_BUFFER_SIZE = 64 * 1024  # in chars
+
+
+# ##########
+# CONSOLE OUTPUT
+# ##########
+class ConsoleOutput(io.TextIOBase):
+    """Replaces sys.stdout. What is written is kept in a buffer, and written to the real stream when the buffer is full,
+    when `flush()` is called, before `input` (python's `input` flushes sys.stdout), after an error (see
+    src.misc.print_in_red) and at exit. If the stream is a terminal, the buffer is also written at the end of each line,
+    so that the user sees the lines when they are printed."""
+    def __init__(self, stream: TextIO, buffer_size: int | None = None):
+        super().__init__()
+        self.stream = stream
+        self.line_buffering = buffer_size is None and stream.isatty()
+        self.buffer_size = buffer_size if buffer_size is not None else DEFAULT_BUFFER_SIZE
+        self._parts: list[str] = []
+        self._size = 0  # number of chars in self._parts
+        # stats (see `--profile-startup`)
+        self.bytes_written = 0
+        self.lines_written = 0
+        self.flushes = 0
+
+    def __repr__(self) -> str:
+        return f"<ConsoleOutput of {self.stream!r} (buffer size {self.buffer_size})>"
+
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        return getattr(self.stream, "encoding", None) or "UTF-8"
+
+    @property
+    def errors(self) -> str | None:  # type: ignore[override]
+        return getattr(self.stream, "errors", None)
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self.stream.isatty()
+
+    def fileno(self) -> int:
+        return self.stream.fileno()
+
+    def write(self, text: str) -> int:
+        if not isinstance(text, str):
+            raise TypeError(f"write() argument must be str, not {text.__class__.__name__}")
+        if text != "":
+            self._parts.append(text)
+            self._size += len(text)
+            if self._size >= self.buffer_size or (self.line_buffering and "\n" in text):
+                self.flush()
+        return len(text)
+
+    def flush(self):
+        if len(self._parts) != 0:
+            data = "".join(self._parts)
+            self._parts.clear()
+            self._size = 0
+            self.stream.write(data)
+            self.bytes_written += len(data.encode(self.encoding, "replace"))
+            self.lines_written += data.count("\n")
+            self.flushes += 1
+        self.stream.flush()
+
+    def close(self):
+        """Write the buffer, but do not close the real stream"""
+        try:
+            self.flush()
+        except (OSError, ValueError):  # the stream is already closed
+            pass
+        super().close()
+
+
+_console_output: ConsoleOutput | None = None
+
+
+def install_console_output(buffer_size: int | None = None) -> ConsoleOutput:
+    """Replace sys.stdout by a ConsoleOutput, that is flushed at exit. Return the ConsoleOutput."""
+    global _console_output
+    _console_output = ConsoleOutput(sys.stdout, buffer_size)
+    sys.stdout = _console_output
+    atexit.register(_console_output.close)
+    return _console_output
+
+
+def get_console_output() -> ConsoleOutput | None:
+    """Return the ConsoleOutput installed by install_console_output, if any"""
+    return _console_output
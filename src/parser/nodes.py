@@ -13,7 +13,7 @@ from src.lexer.position import Position
 from src.lexer.token import Token
 from src.lexer.token_types import TT
 # built-in python imports
-# no imports
+from typing import Any
 
 
 # ##########
@@ -72,6 +72,18 @@ class ListNode(Node):
         return f'list:{str(self.element_nodes)}'
 
 
+class DictNode(Node):
+    """Node for dict literals. self.key_value_nodes is a list of (key node, value node). Needs pos_start and pos_end
+    when init."""
+    def __init__(self, key_value_nodes: list[tuple[Node, Node]], pos_start: Position, pos_end: Position):
+        self.key_value_nodes = key_value_nodes
+        self.pos_start = pos_start
+        self.pos_end = pos_end
+
+    def __repr__(self):
+        return f'dict:{str(self.key_value_nodes)}'
+
+
 # VAR NODES
 class VarAssignNode(Node):
     """Node for variable assign
@@ -105,6 +117,10 @@ class VarAccessNode(Node):
     def __init__(self, var_name_tokens_list: list[Token | Node], attr: bool = False):
         self.var_name_tokens_list = var_name_tokens_list
         self.attr = attr
+        # `__symbol_table__` is generated only when it is read: see Interpreter.visit_VarAccessNode
+        self.reads_symbol_table = any(
+            isinstance(var_name, Token) and var_name.value == "__symbol_table__" for var_name in var_name_tokens_list
+        )
 
         self.pos_start = self.var_name_tokens_list[0].pos_start
         self.pos_end = self.var_name_tokens_list[-1].pos_end
@@ -264,6 +280,7 @@ class ForNode(Node):
         self.end_value_node: Node = end_value_node
         self.step_value_node: Node | None = step_value_node
         self.body_node: Node = body_node
+        self.value_is_used = True  # see mark_value_unused
 
         self.pos_start = self.var_name_token.pos_start
         self.pos_end = self.body_node.pos_end
@@ -287,6 +304,7 @@ class ForNodeList(Node):
         self.var_name_token: Token = var_name_token
         self.body_node = body_node
         self.list_node = list_node
+        self.value_is_used = True  # see mark_value_unused
 
         # Position
         self.pos_start = self.var_name_token.pos_start
@@ -305,6 +323,7 @@ class WhileNode(Node):
     def __init__(self, condition_node: Node, body_node: Node):
         self.condition_node: Node = condition_node
         self.body_node: Node = body_node
+        self.value_is_used = True  # see mark_value_unused
 
         self.pos_start = self.condition_node.pos_start
         self.pos_end = self.body_node.pos_end
@@ -322,6 +341,7 @@ class DoWhileNode(Node):
     def __init__(self, body_node: Node, condition_node: Node):
         self.body_node = body_node
         self.condition_node = condition_node
+        self.value_is_used = True  # see mark_value_unused
 
         self.pos_start = self.condition_node.pos_start
         self.pos_end = self.body_node.pos_end
@@ -358,14 +378,16 @@ class FuncDefNode(Node):
               param_names_tokens is [Token(TT_IDENTIFIER, 'bar')]
               body_node is CallNode (identifier: foo, args: bar)
     should_auto_return is bool (it happens in one-line functions)
+    is_generator is True if there is a `yield` statement in the body
     If, in the function definition, the name is not defined (like in `def()->void()`), var_name_token is None
     """
     def __init__(self, var_name_token: Token | None, param_names_tokens: list[Token], body_node: Node,
-                 should_auto_return: bool):
+                 should_auto_return: bool, is_generator: bool = False):
         self.var_name_token = var_name_token
         self.param_names_tokens = param_names_tokens
         self.body_node = body_node
         self.should_auto_return = should_auto_return
+        self.is_generator = is_generator
 
         if self.var_name_token is not None:  # a name is given: we take its pos_start as our pos_start
             self.pos_start = self.var_name_token.pos_start
@@ -434,6 +456,23 @@ class CallNode(Node):
         return f'call:{self.node_to_call}({self.arg_nodes})'
 
 
+class SliceNode(Node):
+    """Node for a slice given to a list or a str (like `a:b:c` in `foo(a:b:c)`).
+    start, stop and step may be None if they are omitted (like in `foo(:b)` or `foo(a:)`)
+    """
+    def __init__(self, start: Node | None, stop: Node | None, step: Node | None, pos_start: Position,
+                 pos_end: Position):
+        self.start = start
+        self.stop = stop
+        self.step = step
+
+        self.pos_start = pos_start
+        self.pos_end = pos_end
+
+    def __repr__(self):
+        return f'slice:({self.start}:{self.stop}:{self.step})'
+
+
 class ReturnNode(Node):
     """Node for `return` structure.
     node_to_return is the node after the 'return' keyword. It may be None
@@ -448,6 +487,20 @@ class ReturnNode(Node):
         return f'return:({self.node_to_return})'
 
 
+class YieldNode(Node):
+    """Node for `yield` structure (only in the body of multi-line functions, that become generators).
+    node_to_yield is the node after the 'yield' keyword.
+    """
+    def __init__(self, node_to_yield: Node, pos_start: Position, pos_end: Position):
+        self.node_to_yield: Node = node_to_yield
+
+        self.pos_start = pos_start
+        self.pos_end = pos_end
+
+    def __repr__(self):
+        return f'yield:({self.node_to_yield})'
+
+
 # MODULE NODES
 class ImportNode(Node):
     """Node for `import` structure.
@@ -555,6 +608,7 @@ class DollarPrintNode(Node):
     """$identifier"""
     def __init__(self, identifier: Token, pos_start: Position, pos_end: Position):
         self.identifier: Token = identifier
+        self.reads_symbol_table = identifier.value == "__symbol_table__"
 
         self.pos_start = pos_start
         self.pos_end = pos_end
@@ -568,3 +622,60 @@ class NoNode(Node):
     """If the file to execute is empty or filled by back lines, this node is the only node of the node list."""
     def __repr__(self):
         return "NoNode"
+
+
+# ##########
+# HELPERS
+# ##########
+def mark_value_unused(node: Node):
+    """Called on nodes whose value is never read, such as the body of multi-line functions. The loops inside these
+    nodes do not keep the values of their body (the list returned by a loop), so that they run in constant memory."""
+    if isinstance(node, ListNode):
+        for element_node, _ in node.element_nodes:
+            mark_value_unused(element_node)
+    elif isinstance(node, BinOpCompNode) and len(node.nodes_and_tokens_list) == 1:  # not a comparison
+        value_node = node.nodes_and_tokens_list[0]
+        if isinstance(value_node, list) and len(value_node) == 1:  # no attributes
+            value_node = value_node[0]
+        if isinstance(value_node, Node):
+            mark_value_unused(value_node)
+    elif isinstance(node, (ForNode, ForNodeList, WhileNode, DoWhileNode)):
+        node.value_is_used = False
+        mark_value_unused(node.body_node)
+    elif isinstance(node, IfNode):
+        for _, case_body in node.cases:
+            mark_value_unused(case_body)
+        if node.else_case is not None:
+            mark_value_unused(node.else_case)
+
+
+def contains_node(node: Node | list[Any] | tuple[Any, ...], node_types: tuple[type[Node], ...]) -> bool:
+    """Return True if node (or a list of nodes) contains a node of one of these types, at any depth"""
+    if isinstance(node, (list, tuple)):
+        return any(contains_node(element, node_types) for element in node if isinstance(element, (Node, list, tuple)))
+    if isinstance(node, node_types):
+        return True
+    return any(
+        contains_node(attribute, node_types)
+        for attribute in vars(node).values() if isinstance(attribute, (Node, list, tuple))
+    )
+
+
+def only_defines_and_exports(node: Node) -> bool:
+    """Return True if the statements of a file (its main node) export something, and only define variables, functions
+    and classes, import modules or export values. Such a file can be executed when what it exports is first needed
+    instead of when it is imported: nothing else would happen in the meantime."""
+    statements = node.element_nodes if isinstance(node, ListNode) else [(node, False)]
+    exports = False
+    for statement, _ in statements:
+        if isinstance(statement, BinOpCompNode) and len(statement.nodes_and_tokens_list) == 1:  # not a comparison
+            value_node = statement.nodes_and_tokens_list[0]
+            if isinstance(value_node, list) and len(value_node) == 1:  # no attributes
+                value_node = value_node[0]
+            if isinstance(value_node, Node):
+                statement = value_node
+        if isinstance(statement, ExportNode):
+            exports = True
+        elif not isinstance(statement, (VarAssignNode, FuncDefNode, ClassNode, ImportNode, NoNode)):
+            return False
+    return exports
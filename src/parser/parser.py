@@ -32,6 +32,8 @@ class Parser:
         self.current_token: Token | None = None  # Token is imported in src.nodes
         self.advance()
         self.then_s: list[tuple[Position, Position]] = []  # pos start then pos end
+        # one element per function or class body being parsed: True if the function contains 'yield' (None for classes)
+        self.generator_defs: list[bool | None] = []
 
     def parse(self):
         """Parse tokens and return a result that contain a main node"""
@@ -190,6 +192,7 @@ class Parser:
     def statement(self) -> ParseResult:  # only one statement
         """
         statement  : KEYWORD:RETURN expr?
+                   : KEYWORD:YIELD expr
                    : KEYWORD:IMPORT IDENTIFIER (DOT IDENTIFIER)?* (AS IDENTIFIER)?
                    : KEYWORD:EXPORT expr AS IDENTIFIER
                    : KEYWORD:EXPORT IDENTIFIER (AS IDENTIFIER)
@@ -219,6 +222,27 @@ class Parser:
             
             return result.success(ReturnNode(expr, pos_start, self.current_token.pos_start.copy()))
 
+        # KEYWORD:YIELD expr
+        if self.current_token.matches(TT["KEYWORD"], 'yield'):
+            if len(self.generator_defs) == 0 or self.generator_defs[-1] is None:
+                return result.failure(InvalidSyntaxError(
+                    self.current_token.pos_start, self.current_token.pos_end,
+                    "'yield' outside of a multi-line function.",
+                    "src.parser.parser.Parser.statement"
+                ))
+            self.generator_defs[-1] = True  # the function is a generator
+
+            result.register_advancement()
+            self.advance()
+
+            expr = result.register(self.expr())
+            if result.error is not None:
+                return result
+            assert expr is not None
+            assert not isinstance(expr, list)
+
+            return result.success(YieldNode(expr, pos_start, self.current_token.pos_start.copy()))
+
         # KEYWORD:IMPORT IDENTIFIER
         if self.current_token.matches(TT["KEYWORD"], 'import'):
             # we advance
@@ -857,7 +881,7 @@ class Parser:
 
     def call(self) -> ParseResult:
         """
-        call       : atom (LPAREN (MUL? expr (COMMA MUL? expr)?*)? RPAREN)?*
+        call       : atom (LPAREN (call_arg (COMMA call_arg)?*)? RPAREN)?*
         """
         result = ParseResult()
 
@@ -868,7 +892,7 @@ class Parser:
         assert atom is not None
 
         assert self.current_token is not None
-        # (LPAREN (MUL? expr (COMMA MUL? expr)?*)? RPAREN)?*
+        # (LPAREN (call_arg (COMMA call_arg)?*)? RPAREN)?*
         if self.current_token.type == TT["LPAREN"]:
             call_node = atom
 
@@ -885,21 +909,21 @@ class Parser:
                 if self.current_token.type == TT["RPAREN"]:
                     result.register_advancement()
                     self.advance()
-                else:  # (MUL? expr (COMMA MUL? expr)?*)?
+                else:  # (call_arg (COMMA call_arg)?*)?
                     if self.current_token.type == TT["MUL"]:  # MUL?
                         mul = True
                         # we advance
                         result.register_advancement()
                         self.advance()
-                    # expr
-                    expr_ = result.register(self.expr())
+                    # call_arg
+                    expr_ = result.register(self.call_arg(mul))
                     if result.error is not None:
                         return result
                     assert expr_ is not None
                     assert not isinstance(expr_, list)
                     expr_and_mul = (expr_, mul)
                     arg_nodes.append(expr_and_mul)
-                    while self.current_token.type == TT["COMMA"]:  # (COMMA MUL? expr)?*
+                    while self.current_token.type == TT["COMMA"]:  # (COMMA call_arg)?*
                         mul = False
                         # we advance
                         result.register_advancement()
@@ -910,9 +934,9 @@ class Parser:
                             # we advance
                             result.register_advancement()
                             self.advance()
-                        # expr
-                        # we register an expr then check for an error
-                        expr_ = result.register(self.expr())
+                        # call_arg
+                        # we register a call_arg then check for an error
+                        expr_ = result.register(self.call_arg(mul))
                         if result.error is not None:
                             return result
                         assert expr_ is not None
@@ -937,6 +961,50 @@ class Parser:
             return result.success(call_node)
         return result.success(atom)
 
+    def call_arg(self, mul: bool = False) -> ParseResult:
+        """
+        call_arg   : MUL? expr
+                   : expr? COLON expr? (COLON expr?)?
+        The MUL is checked in self.call. A slice can not be used after a MUL.
+        """
+        result = ParseResult()
+        assert self.current_token is not None
+        assert self.current_token.pos_start is not None
+        pos_start = self.current_token.pos_start.copy()
+
+        start: Node | None = None
+        if self.current_token.type != TT["COLON"] or mul:  # expr
+            start = result.register(self.expr())
+            if result.error is not None:
+                return result
+            assert start is not None
+            assert not isinstance(start, list)
+            if self.current_token.type != TT["COLON"] or mul:
+                return result.success(start)
+
+        # this is a slice: COLON expr? (COLON expr?)?
+        bounds: list[Node | None] = [start]
+        pos_end = pos_start
+        while self.current_token.type == TT["COLON"] and len(bounds) < 3:
+            assert self.current_token.pos_end is not None
+            pos_end = self.current_token.pos_end.copy()
+            result.register_advancement()
+            self.advance()
+            if self.current_token.type in (TT["COLON"], TT["COMMA"], TT["RPAREN"]):  # this bound is omitted
+                bounds.append(None)
+                continue
+            bound = result.register(self.expr())
+            if result.error is not None:
+                return result
+            assert bound is not None
+            assert not isinstance(bound, list)
+            assert bound.pos_end is not None
+            pos_end = bound.pos_end.copy()
+            bounds.append(bound)
+        if len(bounds) == 2:  # no step
+            bounds.append(None)
+        return result.success(SliceNode(bounds[0], bounds[1], bounds[2], pos_start, pos_end))
+
     def atom(self) -> ParseResult:
         """
         atom  : (INT|FLOAT)(E_INFIX INT)?|(STRING (STRING NEWLINE?*)?*)
@@ -1104,6 +1172,13 @@ class Parser:
                 return result
             assert list_expr is not None
             return result.success(list_expr)
+        # dict_expr
+        elif token.type == TT["LCURLY"]:
+            dict_expr = result.register(self.dict_expr())
+            if result.error is not None:  # we check for error
+                return result
+            assert dict_expr is not None
+            return result.success(dict_expr)
         # if_expr
         elif token.matches(TT["KEYWORD"], 'if'):
             if_expr = result.register(self.if_expr())
@@ -1248,6 +1323,81 @@ class Parser:
             element_nodes, pos_start, pos_end
         ))
 
+    def dict_expr(self) -> ParseResult:
+        """
+        dict_expr  : LCURLY (expr COLON expr (COMMA expr COLON expr)?*)? RCURLY
+        """
+        # we create the result
+        result = ParseResult()
+        # the python list that will contain the (key, value) nodes
+        key_value_nodes: list[tuple[Node, Node]] = []
+        # we copy the current token pos start
+        assert self.current_token is not None
+        assert self.current_token.pos_start is not None
+        assert self.current_token.pos_end is not None
+        pos_start = self.current_token.pos_start.copy()
+        first_tok_pos_end = self.current_token.pos_end.copy()
+
+        if self.current_token.type != TT["LCURLY"]:
+            return result.failure(InvalidSyntaxError(
+                self.current_token.pos_start, self.current_token.pos_end,
+                "expected '{'.", "src.parser.parser.Parser.dict_expr"
+            ))
+
+        # we advance
+        result.register_advancement()
+        self.advance()
+
+        if self.current_token.type != TT["RCURLY"]:  # there are entries
+            while True:
+                # expr
+                key = result.register(self.expr())
+                if result.error is not None:
+                    return result
+                assert key is not None
+                assert not isinstance(key, list)
+
+                # COLON
+                if self.current_token.type != TT["COLON"]:
+                    return result.failure(InvalidSyntaxError(
+                        self.current_token.pos_start, self.current_token.pos_end,
+                        "expected ':' after a key of the dict.",
+                        "src.parser.parser.Parser.dict_expr"
+                    ))
+                result.register_advancement()
+                self.advance()
+
+                # expr
+                value = result.register(self.expr())
+                if result.error is not None:
+                    return result
+                assert value is not None
+                assert not isinstance(value, list)
+                key_value_nodes.append((key, value))
+
+                if self.current_token.type != TT["COMMA"]:
+                    break
+                # we advance
+                result.register_advancement()
+                self.advance()
+
+            if self.current_token.type != TT["RCURLY"]:  # there is no '}' to close the dict
+                return result.failure(InvalidSyntaxError(
+                    pos_start, first_tok_pos_end,
+                    "'{' was never closed.",
+                    "src.parser.parser.Parser.dict_expr"
+                ))
+
+        assert self.current_token.pos_end is not None
+        pos_end = self.current_token.pos_end.copy()
+        # we advance
+        result.register_advancement()
+        self.advance()
+
+        return result.success(DictNode(
+            key_value_nodes, pos_start, pos_end
+        ))
+
     def if_expr(self) -> ParseResult:
         """
         if_expr : KEYWORD:IF expr KEYWORD:THEN
@@ -1895,6 +2045,7 @@ class Parser:
         assert def_tok.pos_start is not None
         assert def_tok.pos_end is not None
         self.then_s.append((def_tok.pos_start, def_tok.pos_end))
+        self.generator_defs.append(False)
 
         # statements
         body = result.register(self.statements(stop=[(TT["KEYWORD"], 'end')]))
@@ -1910,16 +2061,20 @@ class Parser:
                 "src.parser.parser.Parser.func_def"
             ))
         del self.then_s[-1]
+        is_generator = self.generator_defs.pop()
+        assert is_generator is not None
 
         result.register_advancement()
         self.advance()
         assert not isinstance(body, list)
+        mark_value_unused(body)  # multi-line functions return None, or the value of a 'return' statement
 
         return result.success(FuncDefNode(
             var_name_token,
             param_names_tokens,
             body,
-            False
+            False,
+            is_generator
         ))
 
     def class_def(self) -> ParseResult:
@@ -2011,6 +2166,7 @@ class Parser:
         assert class_tok.pos_start is not None
         assert class_tok.pos_end is not None
         self.then_s.append((class_tok.pos_start, class_tok.pos_end))
+        self.generator_defs.append(None)  # 'yield' is not allowed in a class body
 
         # statements
         body = result.register(self.statements(stop=[(TT["KEYWORD"], 'end')]))
@@ -2026,10 +2182,12 @@ class Parser:
                 "src.parser.parser.Parser.func_def"
             ))
         del self.then_s[-1]
+        del self.generator_defs[-1]
 
         result.register_advancement()
         self.advance()
         assert not isinstance(body, list)
+        mark_value_unused(body)
 
         return result.success(ClassNode(
             var_name_token,
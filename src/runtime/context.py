@@ -14,6 +14,10 @@ from src.lexer.position import Position
 # built-in python imports
 import pprint
 from typing import Self
+# special typing import
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.runtime.values.functions.generator import GeneratorChannel
 
 
 # ##########
@@ -31,6 +35,7 @@ class Context:
         # The entry pos seems to be the pos start of a context, but... Well, I don't know....
         self.symbol_table = None
         self.what_to_export: SymbolTable = SymbolTable()
+        self.generator_channel: GeneratorChannel | None = None  # where `yield` sends its values, in generators
 
     def dict_(self):
         """Repr the context under a dict form."""
@@ -77,4 +82,5 @@ class Context:
         new_ctx = Context(self.display_name, self.parent, self.parent_entry_pos)
         assert self.symbol_table is not None
         new_ctx.symbol_table = self.symbol_table.copy()
+        new_ctx.generator_channel = self.generator_channel
         return new_ctx
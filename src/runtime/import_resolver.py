@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# built-in python imports
+import os
+import sys
+
+
+# ##########
+# IMPORT RESOLVER
+# ##########
+class ImportResolver:
+    """Find where the modules are without asking the file system every time.
+    `lib_/` is scanned once, the other directories (work dirs and dotted imports) are listed once and listed again
+    only when their modification time changes (i.e. when a file is added, removed or renamed inside)."""
+    def __init__(self, noug_dir: str):
+        self.lib_dir = os.path.abspath(noug_dir + "/lib_")
+        self.directories: dict[str, tuple[float, dict[str, bool]]] = {}  # path: (mtime, {name: is_dir})
+        self.trace = False  # set by `--trace-imports`
+
+        self.noug_libs: set[str] = set()
+        self.python_libs: set[str] = set()
+        for name, is_dir in self.listdir(self.lib_dir).items():
+            if is_dir:
+                continue
+            if name.endswith("_.py"):
+                self.python_libs.add(name.removesuffix("_.py"))
+            elif name.endswith(".noug"):
+                self.noug_libs.add(name.removesuffix(".noug"))
+
+    def __repr__(self) -> str:
+        return f"<ImportResolver of {self.lib_dir}>"
+
+    def listdir(self, directory: str) -> dict[str, bool]:
+        """Return {name: is_dir} for every entry of the directory (empty dict if it does not exist)."""
+        directory = os.path.abspath(directory)
+        try:
+            mtime = os.stat(directory).st_mtime
+        except OSError:
+            self.directories.pop(directory, None)
+            return {}
+        cached = self.directories.get(directory, None)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        entries: dict[str, bool] = {}
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        entries[entry.name] = entry.is_dir()
+                    except OSError:
+                        entries[entry.name] = False
+        except OSError:
+            return {}
+        self.directories[directory] = (mtime, entries)
+        return entries
+
+    def is_file(self, directory: str, name: str) -> bool:
+        """Like os.path.exists(directory + "/" + name), but for files only and cached"""
+        is_dir = self.listdir(directory).get(name, None)
+        return is_dir is not None and not is_dir
+
+    def is_dir(self, directory: str, name: str) -> bool:
+        """Like os.path.isdir(directory + "/" + name), but cached"""
+        return self.listdir(directory).get(name, False)
+
+    def is_lib(self, name: str) -> bool:
+        """Return True if `name` is a module of lib_/ (nougaro or python one)."""
+        return name in self.noug_libs or name in self.python_libs
+
+    def resolve(self, work_dir: str, name: str) -> tuple[str, bool, bool]:
+        """Return (path, is_nougaro_lib, is_python_lib) for a single-identifier import. Path is "" if not found.
+        Priority: `name.noug` in work dir, then `lib_/name.noug`, then `lib_/name_.py`."""
+        if self.is_file(work_dir, f"{name}.noug"):
+            return os.path.abspath(os.path.join(work_dir, f"{name}.noug")), True, False
+        if name in self.noug_libs:
+            return os.path.join(self.lib_dir, f"{name}.noug"), True, False
+        if name in self.python_libs:
+            return os.path.join(self.lib_dir, f"{name}_.py"), False, True
+        return "", False, False
+
+    def print_trace(self, name: str, path: str, time_ns: int, cached: bool):
+        """Print a line of `--trace-imports` on stderr"""
+        if path == "":
+            path = "(not found)"
+        cached_str = ", from module cache" if cached else ""
+        print(f"[import] {name} -> {path} (resolved in {time_ns / 1000:.1f} µs{cached_str})", file=sys.stderr)
+
+
+_RESOLVERS: dict[str, ImportResolver] = {}
+
+
+def get_import_resolver(noug_dir: str) -> ImportResolver:
+    """Return the resolver of this noug_dir, creating it (and scanning lib_/) the first time"""
+    resolver = _RESOLVERS.get(noug_dir, None)
+    if resolver is None:
+        resolver = ImportResolver(noug_dir)
+        _RESOLVERS[noug_dir] = resolver
+    return resolver
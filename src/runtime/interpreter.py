@@ -9,23 +9,30 @@
 
 # IMPORTS
 # nougaro modules imports
-from src.runtime.values.basevalues.basevalues import Number, String, List, NoneValue, Value, Module, Constructor, Object
+from src.runtime.values.basevalues.basevalues import (Number, String, List, NoneValue, Value, Module, Constructor,
+                                                      Object, Dict, Array)
 from src.runtime.values.number_constants import FALSE, TRUE
 from src.runtime.values.functions.function import Function, Method
 from src.runtime.values.functions.base_function import BaseFunction
 from src.parser.nodes import *
+from src.lexer.lexer import Lexer
+from src.parser.parser import Parser
 from src.errors.errors import *
 from src.lexer.token_types import TT, TOKENS_NOT_TO_QUOTE
 from src.runtime.runtime_result import RTResult
 from src.runtime.context import Context
 from src.misc import clear_screen, RunFunction
 from src.runtime.symbol_table import SymbolTable
+from src.runtime.module_cache import MODULE_CACHE, ModuleLoader
+from src.runtime.line_index import LINE_INDEX_CACHE
+from src.runtime.import_resolver import get_import_resolver
 from src.lexer.position import Position
 # built-in python imports
 from inspect import signature
 import os.path
+import sys
+import time
 import importlib
-import pprint
 
 _ORIGIN_FILE = "src.runtime.interpreter.Interpreter"
 
@@ -43,6 +50,7 @@ class Interpreter:
         self.noug_dir = noug_dir_
         self.args = args
         self.work_dir: str = work_dir
+        self.import_resolver = get_import_resolver(noug_dir_)
         self._methods = None
         self.init_methods()
         assert self._methods is not None
@@ -59,6 +67,7 @@ class Interpreter:
             "ClassNode": self.visit_ClassNode,
             "ContinueNode": self.visit_ContinueNode,
             "DoWhileNode": self.visit_DoWhileNode,
+            "DictNode": self.visit_DictNode,
             "DollarPrintNode": self.visit_DollarPrintNode,
             "ExportNode": self.visit_ExportNode,
             "ForNode": self.visit_ForNode,
@@ -72,6 +81,7 @@ class Interpreter:
             "NumberNode": self.visit_NumberNode,
             "ReadNode": self.visit_ReadNode,
             "ReturnNode": self.visit_ReturnNode,
+            "SliceNode": self.visit_SliceNode,
             "StringNode": self.visit_StringNode,
             "UnaryOpNode": self.visit_UnaryOpNode,
             "VarAccessNode": self.visit_VarAccessNode,
@@ -79,27 +89,35 @@ class Interpreter:
             "VarDeleteNode": self.visit_VarDeleteNode,
             "WhileNode": self.visit_WhileNode,
             "WriteNode": self.visit_WriteNode,
+            "YieldNode": self.visit_YieldNode,
+        }
+        # the number of parameters of each method, computed once instead of at each visit
+        self._methods_arity: dict[str, int] = {
+            name: len(signature(method).parameters) for name, method in self._methods.items()
         }
 
     @staticmethod
     def update_symbol_table(ctx: Context):
+        """Define `__symbol_table__` in the symbol table of the context.
+        Its value is generated only when it is read (see SymbolTable.symbol_table_as_string), because pretty-printing
+        the whole table after every assignment made every assignment O(size of the table)."""
         assert ctx.symbol_table is not None
-        symbols_copy: dict[str, Value] = ctx.symbol_table.symbols.copy()
-        if '__symbol_table__' in symbols_copy.keys():
-            del symbols_copy['__symbol_table__']
-        ctx.symbol_table.set('__symbol_table__', String(pprint.pformat(symbols_copy)))
+        if '__symbol_table__' not in ctx.symbol_table.symbols:
+            ctx.symbol_table.set('__symbol_table__', String(""))
 
     def visit(self, node: Node, ctx: Context, methods_instead_of_funcs: bool, other_ctx: Context | None = None,
               main_visit: bool = False) -> RTResult:
         """Visit a node."""
         method_name = f'{type(node).__name__}'
         assert self._methods is not None
-        method = self._methods.get(method_name, self.no_visit_method)
-        if other_ctx is None:
-            other_ctx = ctx.copy()
+        method = self._methods.get(method_name, None)
+        if method is None:
+            method = self.no_visit_method
+            arity = len(signature(method).parameters)
+        else:
+            arity = self._methods_arity[method_name]
 
-        PARAMETERS = signature(method).parameters
-        match len(PARAMETERS):
+        match arity:
             case 0:  # def method(self) is 1 param, def staticmethod() is 0 param
                 result = method()  # type: ignore
             case 1:  # def method(self) is 1 param, def staticmethod() is 0 param
@@ -107,6 +125,8 @@ class Interpreter:
             case 3:
                 result = method(node, ctx, methods_instead_of_funcs=methods_instead_of_funcs)  # type: ignore
             case 4:
+                if other_ctx is None:
+                    other_ctx = ctx.copy()
                 result = method(node, ctx, other_ctx, methods_instead_of_funcs=methods_instead_of_funcs)  # type: ignore
             case _:
                 result = method(node, ctx)  # type: ignore
@@ -148,14 +168,13 @@ class Interpreter:
         Note: `edit` parameter is used when the user wants to edit an undefined variable"""
         assert ctx.symbol_table is not None
         close_match_in_symbol_table = ctx.symbol_table.best_match(var_name)
-        IS_NOUGARO_LIB = os.path.exists(os.path.abspath(self.noug_dir + f"/lib_/{var_name}.noug"))
-        IS_PYTHON_LIB = os.path.exists(os.path.abspath(self.noug_dir + f"/lib_/{var_name}_.py"))
+        IS_LIB = self.import_resolver.is_lib(var_name)
         if edit:
             err_msg = f"name '{var_name}' is not defined or is not editable in current scope."
         else:
             err_msg = f"name '{var_name}' is not defined."
 
-        if IS_NOUGARO_LIB or IS_PYTHON_LIB:
+        if IS_LIB:
             if ctx.symbol_table.exists(f'__{var_name}__'):
                 # e.g. user entered `var foo += 1` instead of `var __foo__ += 1`
                 return result.failure(RTNotDefinedError(
@@ -209,6 +228,10 @@ class Interpreter:
                 return result
             if len(node_or_list) != 1:
                 for node_ in node_or_list[1:]:
+                    if isinstance(value, Module):
+                        error = value.load()
+                        if error is not None:
+                            return result.failure(error)
                     new_ctx = Context(display_name=value.__repr__(), parent=context)
                     new_ctx.symbol_table = SymbolTable()
                     new_ctx.symbol_table.set_whole_table(value.attributes)
@@ -301,6 +324,30 @@ class Interpreter:
 
         return result.success(List(elements).set_context(ctx).set_pos(node.pos_start, node.pos_end))
 
+    def visit_DictNode(self, node: DictNode, ctx: Context, methods_instead_of_funcs: bool) -> RTResult:
+        """Visit DictNode"""
+        result = RTResult()
+        dict_ = Dict()
+
+        for key_node, value_node in node.key_value_nodes:
+            key = result.register(self.visit(key_node, ctx, methods_instead_of_funcs))
+            if result.should_return() or key is None:  # if there is an error
+                return result
+            value = result.register(self.visit(value_node, ctx, methods_instead_of_funcs))
+            if result.should_return() or value is None:  # if there is an error
+                return result
+            if not dict_.set(key, value):
+                assert key.pos_start is not None
+                assert key.pos_end is not None
+                return result.failure(RTTypeError(
+                    key.pos_start, key.pos_end,
+                    f"unhashable type: ‘{key.type_}’ can not be a key of a dict.",
+                    ctx,
+                    origin_file=f"{_ORIGIN_FILE}.visit_DictNode"
+                ))
+
+        return result.success(dict_.set_context(ctx).set_pos(node.pos_start, node.pos_end))
+
     def visit_BinOpNode(self, node: BinOpNode, ctx: Context, methods_instead_of_funcs: bool) -> RTResult:
         """Visit BinOpNode"""
         res = RTResult()
@@ -511,6 +558,8 @@ class Interpreter:
             assert isinstance(var_name.value, str)
             value = ctx.symbol_table.get(var_name.value)  # we get the value of the variable
             if value is not None:  # if the variable is defined, we can stop here
+                if node.reads_symbol_table and var_name.value == "__symbol_table__":
+                    value = ctx.symbol_table.symbol_table_as_string()
                 break
 
         VARIABLE_IS_DEFINED = value is not None
@@ -632,6 +681,10 @@ class Interpreter:
                 assert isinstance(value, Value)
 
                 for node_or_tok in var_name[1:-1]:
+                    if isinstance(value, Module):
+                        error = value.load()
+                        if error is not None:
+                            return result.failure(error)
                     new_ctx = Context(display_name=value.__repr__(), parent=ctx)
                     new_ctx.symbol_table = SymbolTable()
                     new_ctx.symbol_table.set_whole_table(value.attributes)
@@ -684,6 +737,10 @@ class Interpreter:
 
                 assert isinstance(var_name[-1].value, str)
                 final_var_name: str = var_name[-1].value
+                if isinstance(value, Module):
+                    error = value.load()
+                    if error is not None:
+                        return result.failure(error)
                 variable_exists = final_var_name in value.attributes
                 if variable_exists:
                     var_actual_value: Value | None = value.attributes[var_name[-1].value]
@@ -925,11 +982,13 @@ class Interpreter:
 
             value = result.register(self.visit(node.body_node, ctx, methods_instead_of_funcs))
             if result.loop_should_continue:
-                elements.append(NoneValue(False))
+                if node.value_is_used:
+                    elements.append(NoneValue(False))
                 continue  # will continue the 'while condition()' -> the interpreted 'for' loop is continued
 
             if result.loop_should_break:
-                elements.append(NoneValue(False))
+                if node.value_is_used:
+                    elements.append(NoneValue(False))
                 break  # will break the 'while condition()' -> the interpreted 'for' loop is break
 
             if result.should_return():
@@ -937,7 +996,8 @@ class Interpreter:
                 return result
             assert value is not None
 
-            elements.append(value)
+            if node.value_is_used:
+                elements.append(value)
 
         return result.success(
             List(elements).set_context(ctx).set_pos(node.pos_start, node.pos_end)
@@ -952,45 +1012,56 @@ class Interpreter:
         if result.should_return():  # check for errors
             return result
 
-        if isinstance(iterable_, List):
-            python_iterable = iterable_.elements
-        elif isinstance(iterable_, String):
-            python_iterable = iterable_.to_python_str()
-        else:  # this is not a list nor a str
+        assert iterable_ is not None
+        iterator = iterable_.iter_()  # the elements are made one by one, e.g. for ranges
+        if iterator is None:  # this is not an iterable
             assert node.list_node.pos_start is not None
             assert node.list_node.pos_end is not None
-            assert iterable_ is not None
             return result.failure(RTTypeError(
                 node.list_node.pos_start, node.list_node.pos_end,
-                f"expected a list or a str after 'in', but found {iterable_.type_}.",
+                f"expected an iterable (e.g. a list, a str or a range) after 'in', but found {iterable_.type_}.",
                 ctx, f"{_ORIGIN_FILE}.visit_ForNodeList"
             ))
 
         assert ctx.symbol_table is not None
         assert isinstance(node.var_name_token.value, str)
-        for element in python_iterable:
-            # we set the variable to the actual list element
-            if isinstance(element, str):
-                element = String(element)
+        while True:
+            try:
+                element = next(iterator)
+            except StopIteration:
+                break
+            except IterationError as e:  # e.g. an error in the body of a generator
+                return result.failure(e.error)
+            except RuntimeError as e:  # e.g. python's 'dictionary changed size during iteration'
+                assert node.list_node.pos_start is not None
+                assert node.list_node.pos_end is not None
+                return result.failure(RunTimeError(
+                    node.list_node.pos_start, node.list_node.pos_end,
+                    f"{iterable_.type_} changed during iteration ({e}).",
+                    ctx, origin_file=f"{_ORIGIN_FILE}.visit_ForNodeList"
+                ))
+            # we set the variable to the actual element
             ctx.symbol_table.set(node.var_name_token.value, element)
             self.update_symbol_table(ctx)
             value = result.register(self.visit(node.body_node, ctx, methods_instead_of_funcs))
 
             if result.loop_should_continue:
-                elements.append(NoneValue(False))
-                continue  # will continue the 'for e in iterable_.elements' -> the interpreted 'for' loop is
-                #           continued
+                if node.value_is_used:
+                    elements.append(NoneValue(False))
+                continue  # will continue the 'while True' -> the interpreted 'for' loop is continued
 
             if result.loop_should_break:
-                elements.append(NoneValue(False))
-                break  # will break the 'for e in iterable_.elements' -> the interpreted 'for' loop is break
+                if node.value_is_used:
+                    elements.append(NoneValue(False))
+                break  # will break the 'while True' -> the interpreted 'for' loop is break
 
             if result.should_return():
                 # error or 'return' statement
                 return result
             assert value is not None
 
-            elements.append(value)
+            if node.value_is_used:
+                elements.append(value)
 
         return result.success(
             List(elements).set_context(ctx).set_pos(node.pos_start, node.pos_end)
@@ -1009,11 +1080,13 @@ class Interpreter:
         while condition.is_true():
             value = result.register(self.visit(node.body_node, ctx, methods_instead_of_funcs))
             if result.loop_should_continue:
-                elements.append(NoneValue(False))
+                if node.value_is_used:
+                    elements.append(NoneValue(False))
                 continue
 
             if result.loop_should_break:
-                elements.append(NoneValue(False))
+                if node.value_is_used:
+                    elements.append(NoneValue(False))
                 break
 
             if result.should_return():
@@ -1021,7 +1094,8 @@ class Interpreter:
                 return result
             assert value is not None
 
-            elements.append(value)
+            if node.value_is_used:
+                elements.append(value)
 
             condition = result.register(self.visit(node.condition_node, ctx, methods_instead_of_funcs))
             if result.should_return():  # check for errors
@@ -1040,11 +1114,13 @@ class Interpreter:
         while True:
             value = result.register(self.visit(node.body_node, ctx, methods_instead_of_funcs))
             if result.loop_should_continue:
-                elements.append(NoneValue(False))
+                if node.value_is_used:
+                    elements.append(NoneValue(False))
                 continue
 
             if result.loop_should_break:
-                elements.append(NoneValue(False))
+                if node.value_is_used:
+                    elements.append(NoneValue(False))
                 break
 
             if result.should_return():
@@ -1052,7 +1128,8 @@ class Interpreter:
                 return result
             assert value is not None
 
-            elements.append(value)
+            if node.value_is_used:
+                elements.append(value)
 
             condition = result.register(self.visit(node.condition_node, ctx, methods_instead_of_funcs))
             if result.should_return():  # check for errors
@@ -1082,13 +1159,13 @@ class Interpreter:
             param_names.append(param_name.value)
 
         if not methods_instead_of_funcs:
-            func_value = Function(func_name, body_node, param_names, node.should_auto_return).set_context(ctx).set_pos(
-                node.pos_start, node.pos_end
-            )
+            func_value = Function(
+                func_name, body_node, param_names, node.should_auto_return, is_generator=node.is_generator
+            ).set_context(ctx).set_pos(node.pos_start, node.pos_end)
         else:
-            func_value = Method(func_name, body_node, param_names, node.should_auto_return).set_context(ctx).set_pos(
-                node.pos_start, node.pos_end
-            )
+            func_value = Method(
+                func_name, body_node, param_names, node.should_auto_return, is_generator=node.is_generator
+            ).set_context(ctx).set_pos(node.pos_start, node.pos_end)
 
         if func_name is not None:
             assert ctx.symbol_table is not None
@@ -1239,7 +1316,7 @@ class Interpreter:
 
             return self._init_constructor(value_to_call, outer_context, result, node)
 
-        elif isinstance(value_to_call, List):  # the value is a list
+        elif isinstance(value_to_call, (List, Array)):  # the value is a list (or a typed array)
             # get the element at the given index
             if len(node.arg_nodes) == 0:
                 assert node.pos_start is not None
@@ -1250,6 +1327,12 @@ class Interpreter:
                     outer_context, origin_file=f"{_ORIGIN_FILE}.visit_CallNode"
                 ))
 
+            elif len(node.arg_nodes) == 1 and isinstance(node.arg_nodes[0][0], SliceNode):  # l(a:b:c)
+                slice_ = self._slice_from_node(node.arg_nodes[0][0], result, outer_context, methods_instead_of_funcs)
+                if slice_ is None:
+                    return result
+                return result.success(value_to_call.sliced(slice_).set_pos(node.pos_start, node.pos_end))
+
             elif len(node.arg_nodes) == 1:  # there is only one index given
                 index = result.register(self.visit(node.arg_nodes[0][0], outer_context, methods_instead_of_funcs))
                 if result.should_return():
@@ -1273,7 +1356,7 @@ class Interpreter:
                     assert node.arg_nodes[0][0].pos_end is not None
                     return result.failure(RTIndexError(
                         node.arg_nodes[0][0].pos_start, node.arg_nodes[0][0].pos_end,
-                        f'list index {index} out of range.',
+                        f'{value_to_call.type_} index {index} out of range.',
                         outer_context, f"{_ORIGIN_FILE}.visit_CallNode"
                     ))
 
@@ -1301,7 +1384,7 @@ class Interpreter:
                         assert arg_node[0].pos_end is not None
                         return result.failure(RTIndexError(
                             arg_node[0].pos_start, arg_node[0].pos_end,
-                            f'list index {index} out of range.',
+                            f'{value_to_call.type_} index {index} out of range.',
                             outer_context, f"{_ORIGIN_FILE}.Visit_CallNode"
                         ))
 
@@ -1309,6 +1392,31 @@ class Interpreter:
                     List(return_value_list).set_context(outer_context).set_pos(node.pos_start, node.pos_end)
                 )
 
+        elif isinstance(value_to_call, Dict):  # the value is a dict
+            # get the value of the given key
+            if len(node.arg_nodes) != 1:
+                assert node.pos_start is not None
+                assert node.pos_end is not None
+                return result.failure(RunTimeError(
+                    node.pos_start, node.pos_end,
+                    f"please give exactly one key.",
+                    outer_context, origin_file=f"{_ORIGIN_FILE}.visit_CallNode"
+                ))
+            key = result.register(self.visit(node.arg_nodes[0][0], outer_context, methods_instead_of_funcs))
+            if result.should_return():
+                return result
+            assert key is not None
+            value = value_to_call.get(key)
+            if value is None:
+                assert node.arg_nodes[0][0].pos_start is not None
+                assert node.arg_nodes[0][0].pos_end is not None
+                return result.failure(RTKeyError(
+                    node.arg_nodes[0][0].pos_start, node.arg_nodes[0][0].pos_end,
+                    f"key {key} not found in dict.",
+                    outer_context, f"{_ORIGIN_FILE}.visit_CallNode"
+                ))
+            return result.success(value.copy().set_pos(node.pos_start, node.pos_end))
+
         elif isinstance(value_to_call, String):  # the value is a string
             # get the element at the given index
             if len(node.arg_nodes) == 0:
@@ -1319,6 +1427,13 @@ class Interpreter:
                     f"please give at least one index.",
                     outer_context, origin_file=f"{_ORIGIN_FILE}.Visit_CallNode"
                 ))
+            elif len(node.arg_nodes) == 1 and isinstance(node.arg_nodes[0][0], SliceNode):  # s(a:b:c)
+                slice_ = self._slice_from_node(node.arg_nodes[0][0], result, outer_context, methods_instead_of_funcs)
+                if slice_ is None:
+                    return result
+                return result.success(
+                    value_to_call.sliced(slice_).set_context(outer_context).set_pos(node.pos_start, node.pos_end)
+                )
             elif len(node.arg_nodes) == 1:  # there is only one index given
                 index = result.register(self.visit(node.arg_nodes[0][0], outer_context, methods_instead_of_funcs))
                 if result.should_return():
@@ -1378,7 +1493,18 @@ class Interpreter:
                     String(return_value).set_context(outer_context).set_pos(node.pos_start, node.pos_end)
                 )
 
-        else:  # the object is not callable
+        else:
+            if len(node.arg_nodes) == 1 and isinstance(node.arg_nodes[0][0], SliceNode):  # other sliceable values
+                slice_ = self._slice_from_node(node.arg_nodes[0][0], result, outer_context, methods_instead_of_funcs)
+                if slice_ is None:
+                    return result
+                sliced_value = value_to_call.sliced(slice_)
+                if sliced_value is not None:
+                    return result.success(
+                        sliced_value.set_context(outer_context).set_pos(node.pos_start, node.pos_end)
+                    )
+
+            # the object is not callable
             assert node.pos_start is not None
             assert node.pos_end is not None
             return result.failure(RunTimeError(
@@ -1387,6 +1513,51 @@ class Interpreter:
                 outer_context, origin_file=f"{_ORIGIN_FILE}.Visit_CallNode"
             ))
 
+    def _slice_from_node(self, node: SliceNode, result: RTResult, ctx: Context,
+                         methods_instead_of_funcs: bool) -> slice | None:
+        """Visit the bounds of the slice and return the python slice. Return None if there is an error (the error is
+        in result)."""
+        bounds: list[int | None] = []
+        for bound_node in (node.start, node.stop, node.step):
+            if bound_node is None:
+                bounds.append(None)
+                continue
+            bound = result.register(self.visit(bound_node, ctx, methods_instead_of_funcs))
+            if result.should_return():
+                return None
+            assert bound is not None
+            if not (isinstance(bound, Number) and isinstance(bound.value, int)):
+                assert bound_node.pos_start is not None
+                assert bound_node.pos_end is not None
+                result.failure(RunTimeError(
+                    bound_node.pos_start, bound_node.pos_end,
+                    f"the bounds and the step of a slice must be integers, not {bound.type_}.",
+                    ctx, origin_file=f"{_ORIGIN_FILE}._slice_from_node"
+                ))
+                return None
+            bounds.append(bound.value)
+        if bounds[2] == 0:
+            assert node.step is not None
+            assert node.step.pos_start is not None
+            assert node.step.pos_end is not None
+            result.failure(RunTimeError(
+                node.step.pos_start, node.step.pos_end,
+                "the step of a slice can not be 0.",
+                ctx, origin_file=f"{_ORIGIN_FILE}._slice_from_node"
+            ))
+            return None
+        return slice(*bounds)
+
+    def visit_SliceNode(self, node: SliceNode, ctx: Context) -> RTResult:
+        """Visit SliceNode: a slice can only be used alone in the call of a list or a str (see visit_CallNode)"""
+        assert node.pos_start is not None
+        assert node.pos_end is not None
+        return RTResult().failure(RunTimeError(
+            node.pos_start, node.pos_end,
+            "a slice can only be used to get a part of a list or a str, like in `list_(start:stop:step)`.",
+            ctx, origin_file=f"{_ORIGIN_FILE}.visit_SliceNode"
+        ))
+
     # todo: separate call methods
 
     def _init_constructor(self, constructor: Constructor, outer_context: Context, result: RTResult, node: Node,
@@ -1469,6 +1640,29 @@ class Interpreter:
 
         return result.success_return(value, node.pos_start, node.pos_end)
 
+    def visit_YieldNode(self, node: YieldNode, ctx: Context, methods_instead_of_funcs: bool) -> RTResult:
+        """Visit YieldNode"""
+        result = RTResult()
+
+        value = result.register(self.visit(node.node_to_yield, ctx, methods_instead_of_funcs))
+        if result.should_return():  # check for errors
+            return result
+        assert value is not None
+
+        if ctx.generator_channel is None:
+            return result.failure(RunTimeError(
+                node.pos_start, node.pos_end,
+                "'yield' outside of a generator.",
+                ctx, origin_file=f"{_ORIGIN_FILE}.visit_YieldNode"
+            ))
+        if not ctx.generator_channel.yield_(value):  # the generator is not used anymore: we stop its body
+            return result.failure(RunTimeError(
+                node.pos_start, node.pos_end,
+                "the generator was closed.",
+                ctx, origin_file=f"{_ORIGIN_FILE}.visit_YieldNode"
+            ))
+        return result.success(NoneValue(False))
+
     @staticmethod
     def visit_ContinueNode(node: ContinueNode) -> RTResult:
         """Visit ContinueNode"""
@@ -1493,6 +1687,8 @@ class Interpreter:
             print("==========")
             print(f"workdir is {self.work_dir}")
 
+        resolver = self.import_resolver
+        resolution_start = time.perf_counter_ns()
         if len(identifiers) != 1:
             path = self.work_dir
             last_i = len(identifiers) - 1
@@ -1501,7 +1697,7 @@ class Interpreter:
 
                 assert isinstance(identifier.value, str)
                 if should_be_dir:
-                    if not os.path.isdir(path + identifier.value):
+                    if not resolver.is_dir(path, identifier.value):
                         assert identifier.pos_start is not None
                         assert identifier.pos_end is not None
                         return result.failure(RTFileNotFoundError(
@@ -1512,7 +1708,7 @@ class Interpreter:
                     path += identifier.value + "/"
                     continue
 
-                noug_lib_exists = os.path.exists(path + identifier.value + ".noug")
+                noug_lib_exists = resolver.is_file(path, identifier.value + ".noug")
                 if noug_lib_exists:
                     path += identifier.value + ".noug"
                     is_nougaro_lib = True
@@ -1530,19 +1726,10 @@ class Interpreter:
         else:
             identifier = identifiers[0]
             name_to_import = identifier.value  # we get the module identifier
-            IS_LOCAL_LIB = os.path.exists(self.work_dir + f"{name_to_import}.noug")
-            is_nougaro_lib = os.path.exists(os.path.abspath(self.noug_dir + f"/lib_/{name_to_import}.noug"))
-            is_python_lib = os.path.exists(os.path.abspath(self.noug_dir + f"/lib_/{name_to_import}_.py"))
-            if IS_LOCAL_LIB:
-                path = os.path.abspath(self.work_dir + f"{name_to_import}.noug")
-                is_nougaro_lib = True
-            elif is_nougaro_lib:
-                path = os.path.abspath(self.noug_dir + f"/lib_/{name_to_import}.noug")
-            elif is_python_lib:
-                path = os.path.abspath(self.noug_dir + f"/lib_/{name_to_import}_.py")
-            else:
-                path = ""
+            assert isinstance(name_to_import, str)
+            path, is_nougaro_lib, is_python_lib = resolver.resolve(self.work_dir, name_to_import)
         identifier = identifiers[-1]
+        resolution_time = time.perf_counter_ns() - resolution_start
 
         if self.debug:
             print(f"path is {path}")
@@ -1556,33 +1743,22 @@ class Interpreter:
         else:
             import_as_name = as_identifier.value
 
-        if is_nougaro_lib:
-            with open(path) as lib_:
-                text = lib_.read()
+        assert isinstance(name_to_import, str)
+        assert isinstance(import_as_name, str)
+        assert ctx.symbol_table is not None
 
-            value, error = self.run(file_name=f"{name_to_import} (lib)", text=text, noug_dir=self.noug_dir,
-                                    exec_from=ctx.display_name, use_default_symbol_table=True, work_dir=self.work_dir)
-            if error is not None:
-                return result.failure(error)
-            if result.should_return():
-                return result
-            assert value is not None
+        was_cached = MODULE_CACHE.is_cached(path)
+        cached_module = MODULE_CACHE.get(path) if (is_nougaro_lib or is_python_lib) else None
+        if resolver.trace:
+            resolver.print_trace(name_to_import, path, resolution_time, cached_module is not None)
+        if cached_module is not None:
+            if self.debug:
+                print(f"{path} found in module cache")
+            ctx.symbol_table.set(import_as_name, cached_module)
+            self.update_symbol_table(ctx)
+            return result.success(cached_module)
 
-            assert value.context is not None
-            what_to_import = value.context.what_to_export.symbols
-        elif is_python_lib:
-            try:
-                module = importlib.import_module(f"lib_.{name_to_import}_")
-                what_to_import = module.WHAT_TO_IMPORT
-            except ImportError:
-                assert identifier.pos_start is not None
-                assert identifier.pos_end is not None
-                return result.failure(RTNotDefinedError(
-                    identifier.pos_start, identifier.pos_end, f"name '{name_to_import}' is not a module.", ctx,
-                    origin_file=f"{_ORIGIN_FILE}.visit_ImportNode\n"
-                    "(troubleshooting: is python importlib working?)"
-                ))
-        else:
+        if not (is_nougaro_lib or is_python_lib):
             assert identifier.pos_start is not None
             assert identifier.pos_end is not None
             return result.failure(RTNotDefinedError(
@@ -1591,15 +1767,71 @@ class Interpreter:
                 "(troubleshooting: not involving importlib. Is path detection working?)"
             ))
 
-        assert isinstance(name_to_import, str)
-        assert isinstance(import_as_name, str)
-        assert ctx.symbol_table is not None
-        module_value = Module(name_to_import, what_to_import)
+        # the library is executed the first time one of its attributes is used (see Module.load), unless it does
+        # something else than defining and exporting values
+        loader = ModuleLoader(
+            lambda: self._load_module(path, name_to_import, identifier, ctx, is_nougaro_lib, reload=was_cached)
+        )
+        module_value = Module(name_to_import, {}, loader)
+        if MODULE_CACHE.eager_imports or (is_nougaro_lib and not self._can_load_lazily(path)):
+            error = module_value.load()
+            if error is not None:
+                return result.failure(error)
+        MODULE_CACHE.set(path, module_value)
         ctx.symbol_table.set(import_as_name, module_value)
         self.update_symbol_table(ctx)
 
         return result.success(module_value)
 
+    @staticmethod
+    def _can_load_lazily(path: str) -> bool:
+        """Return True if the nougaro lib only defines and exports values (see only_defines_and_exports). The libs
+        that are imported for what they do (e.g. `hello`, that prints a message) are executed when they are imported."""
+        with open(path) as lib_:
+            text = lib_.read()
+        tokens, error = Lexer(path, text).make_tokens()
+        if error is not None:  # the error is shown now
+            return False
+        assert tokens is not None
+        ast = Parser(tokens).parse()
+        if ast.error is not None:
+            return False
+        assert ast.node is not None
+        return only_defines_and_exports(ast.node)
+
+    def _load_module(
+            self, path: str, name_to_import: str, identifier: Token, ctx: Context, is_nougaro_lib: bool, reload: bool
+    ) -> tuple[dict[str, Value], None] | tuple[None, Error]:
+        """Execute a nougaro lib or import a python lib, then return what it exports.
+        Errors are located at the identifier of the import statement, in the context of the import statement."""
+        if is_nougaro_lib:
+            with open(path) as lib_:
+                text = lib_.read()
+
+            value, error = self.run(file_name=f"{name_to_import} (lib)", text=text, noug_dir=self.noug_dir,
+                                    exec_from=ctx.display_name, use_default_symbol_table=True, work_dir=self.work_dir,
+                                    result_is_used=False)
+            if error is not None:
+                return None, error
+            assert value is not None
+
+            assert value.context is not None
+            return value.context.what_to_export.symbols, None
+
+        try:
+            module = importlib.import_module(f"lib_.{name_to_import}_")
+            if reload:  # the file changed since the last import
+                module = importlib.reload(module)
+            return module.WHAT_TO_IMPORT, None
+        except ImportError:
+            assert identifier.pos_start is not None
+            assert identifier.pos_end is not None
+            return None, RTNotDefinedError(
+                identifier.pos_start, identifier.pos_end, f"name '{name_to_import}' is not a module.", ctx,
+                origin_file=f"{_ORIGIN_FILE}._load_module\n"
+                "(troubleshooting: is python importlib working?)"
+            )
+
     def visit_ExportNode(self, node: ExportNode, ctx: Context, methods_instead_of_funcs: bool) -> RTResult:
         """Visit ExportNode"""
         result = RTResult()
@@ -1617,6 +1849,8 @@ class Interpreter:
             assert ctx.symbol_table is not None
             assert isinstance(expr_or_identifier.value, str)
             value_to_export = ctx.symbol_table.get(expr_or_identifier.value)
+            if value_to_export is not None and expr_or_identifier.value == "__symbol_table__":
+                value_to_export = ctx.symbol_table.symbol_table_as_string()
             assert expr_or_identifier.pos_start is not None
             assert expr_or_identifier.pos_end is not None
             if value_to_export is None:
@@ -1695,16 +1929,32 @@ class Interpreter:
 
         if file_name_value == '<stdout>':  # print in console
             if open_mode == 'w+':  # can not overwrite the console
+                sys.stdout.flush()
                 clear_screen()
-            print(str_to_write_value)
+            sys.stdout.write(str_to_write_value + "\n")
             return result.success(str_to_write)
 
         try:
             if line_number == 'last':  # if no line number was given
+                LINE_INDEX_CACHE.invalidate(file_name_value)
                 with open(file_name_value, open_mode, encoding='UTF-8') as file:  # we (over)write our text
                     file.write(str_to_write_value)
             else:  # a line number was given
                 assert isinstance(line_number, int)
+                if line_number > 0 and os.path.isfile(file_name_value):
+                    index = LINE_INDEX_CACHE.get(file_name_value)
+                    if index is not None and line_number <= index.line_count:
+                        # if the new line has the same length as the old one, it is replaced directly in the file
+                        if open_mode == 'a+':  # we add our text to the end of the line
+                            old_line = index.read_line(file_name_value, line_number)
+                            new_line = old_line.replace('\n', '') + str_to_write_value + '\n'
+                        else:  # we replace the line by the new one
+                            new_line = str_to_write_value + '\n'
+                        if LINE_INDEX_CACHE.patch_line(file_name_value, index, line_number, new_line):
+                            return result.success(str_to_write)
+
+                # the file is rewritten
+                LINE_INDEX_CACHE.invalidate(file_name_value)
                 file_was_created = False
                 if not os.path.exists(file_name_value):  # the file does not exist
                     with open(file_name_value, 'w+', encoding='UTF-8'):  # we create our file
@@ -1782,15 +2032,23 @@ class Interpreter:
                         file_str = file.read()
                 else:  # read a single line
                     assert isinstance(line_number, int)
-                    with open(file_name_value, 'r+', encoding='UTF-8') as file:
-                        file_data = file.readlines()
-                        if 0 < line_number <= len(file_data):  # good index
-                            file_str = file_data[line_number - 1]
-                        else:  # wrong index
-                            return result.failure(RTIndexError(
-                                node.pos_start, node.pos_end, f"{line_number}.", ctx,
-                                f"{_ORIGIN_FILE}.visit_ReadNode"
-                            ))
+                    index = LINE_INDEX_CACHE.get(file_name_value)
+                    file_data: list[str] = []
+                    if index is not None:  # we will go directly to the line
+                        line_count = index.line_count
+                    else:  # the file can not be indexed (see LineIndex.from_bytes)
+                        with open(file_name_value, 'r+', encoding='UTF-8') as file:
+                            file_data = file.readlines()
+                        line_count = len(file_data)
+                    if not 0 < line_number <= line_count:  # wrong index
+                        return result.failure(RTIndexError(
+                            node.pos_start, node.pos_end, f"{line_number}.", ctx,
+                            f"{_ORIGIN_FILE}.visit_ReadNode"
+                        ))
+                    if index is not None:
+                        file_str = index.read_line(file_name_value, line_number)
+                    else:
+                        file_str = file_data[line_number - 1]
             except FileNotFoundError:  # file not found
                 return result.failure(RTFileNotFoundError(
                     node.pos_start, node.pos_end, file_name_value, ctx,
@@ -1825,6 +2083,8 @@ class Interpreter:
             value_to_return = String("$").set_pos(node.pos_start, node.pos_end)
         elif ctx.symbol_table.exists(node.identifier.value, True):
             value_to_return = ctx.symbol_table.get(node.identifier.value)
+            if value_to_return is not None and node.reads_symbol_table:
+                value_to_return = ctx.symbol_table.symbol_table_as_string()
             if value_to_return is not None:
                 print(value_to_return.to_python_str())
             else:
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# `read file N` and `write ... >> file N` only need one line of the file. Instead of reading the whole file each
+# time, the offset of the start of each line is computed once and cached: the line is then read with a `seek`.
+
+# IMPORTS
+# built-in python imports
+from array import array
+import mmap
+import os
+
+
+# ##########
+# LINE INDEX
+# ##########
+class LineIndex:
+    """The offsets (in bytes) of the start of each line of a file"""
+    def __init__(self, starts: array, size: int):
+        self.starts = starts  # starts[i] is the offset of the line i+1
+        self.size = size
+
+    def __repr__(self) -> str:
+        return f"<LineIndex of {self.line_count} lines>"
+
+    @property
+    def line_count(self) -> int:
+        return len(self.starts)
+
+    def span(self, line_number: int) -> tuple[int, int]:
+        """Return the start and the end offsets of the line (1 is the first line). The end includes the '\\n'."""
+        assert 0 < line_number <= self.line_count
+        end = self.starts[line_number] if line_number < self.line_count else self.size
+        return self.starts[line_number - 1], end
+
+    def read_line(self, path: str, line_number: int) -> str:
+        """Return the line (with its '\\n'), like `file.readlines()[line_number - 1]` would"""
+        start, end = self.span(line_number)
+        with open(path, 'rb') as file:
+            file.seek(start)
+            return file.read(end - start).decode('UTF-8')
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """Return the index of a file from its content, or None if the file contains '\\r': in text mode, python
+        translates the newlines, so the lines in the file would not be the lines given by `readlines()`"""
+        if b'\r' in data:
+            return None
+        starts = array('q')
+        if data:
+            starts.append(0)
+        position = data.find(b'\n')
+        while position != -1 and position + 1 < len(data):
+            starts.append(position + 1)
+            position = data.find(b'\n', position + 1)
+        return cls(starts, len(data))
+
+
+# ##########
+# LINE INDEX CACHE
+# ##########
+class LineIndexCache:
+    """The line indexes of the files, keyed by absolute path. An entry is invalidated when the modification time or
+    the size of its file changes."""
+    def __init__(self):
+        self.indexes: dict[str, tuple[tuple[int, int], LineIndex | None]] = {}
+
+    def __repr__(self) -> str:
+        return f"<LineIndexCache of {len(self.indexes)} files>"
+
+    @staticmethod
+    def _key(stat: os.stat_result) -> tuple[int, int]:
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self, path: str) -> LineIndex | None:
+        """Return the index of the file (made if needed), or None if the file can not be indexed.
+        Raise OSError (e.g. FileNotFoundError) if the file can not be read."""
+        path = os.path.abspath(path)
+        entry = self.indexes.get(path, None)
+        if entry is not None and entry[0] == self._key(os.stat(path)):
+            return entry[1]
+        with open(path, 'rb') as file:
+            key = self._key(os.fstat(file.fileno()))
+            index = LineIndex.from_bytes(file.read())
+        self.indexes[path] = (key, index)
+        return index
+
+    def patch_line(self, path: str, index: LineIndex, line_number: int, new_line: str) -> bool:
+        """Replace the line (1 is the first line) by new_line directly in the file, if they have the same length in
+        bytes and if new_line is a single line. Return False if not: the file must be rewritten."""
+        if '\r' in new_line or '\n' in new_line[:-1]:  # the lines would move
+            return False
+        start, end = index.span(line_number)
+        data = new_line.encode('UTF-8')
+        if len(data) != end - start:
+            return False
+        with open(path, 'r+b') as file:
+            with mmap.mmap(file.fileno(), 0) as mapped_file:
+                mapped_file[start:end] = data
+                mapped_file.flush()
+            key = self._key(os.fstat(file.fileno()))
+        self.indexes[os.path.abspath(path)] = (key, index)  # the lines did not move
+        return True
+
+    def invalidate(self, path: str):
+        """Remove the entry of the file (call it after writing in it)"""
+        self.indexes.pop(os.path.abspath(path), None)
+
+    def clear(self):
+        self.indexes.clear()
+
+
+LINE_INDEX_CACHE = LineIndexCache()
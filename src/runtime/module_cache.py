@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# __future__ import (must be first)
+from __future__ import annotations
+# built-in python imports
+import os.path
+from typing import Callable
+# special typing import
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.runtime.values.basevalues.basevalues import Module
+    from src.runtime.values.basevalues.value import Value
+    from src.errors.errors import Error
+
+
+# ##########
+# MODULE CACHE
+# ##########
+class ModuleCache:
+    """Registry of the already imported modules (like python’s sys.modules), keyed by absolute path.
+    An entry is invalidated when the modification time of its file changes (useful in the shell)."""
+    def __init__(self):
+        self.modules: dict[str, tuple[float, Module]] = {}
+        self.eager_imports = False  # set by `--eager-imports`: execute the modules as soon as they are imported
+
+    def __repr__(self) -> str:
+        return f"<ModuleCache of {len(self.modules)} modules>"
+
+    def get(self, path: str) -> Module | None:
+        """Return the cached module for this path, or None if it is not cached or if the file changed since."""
+        entry = self.modules.get(path, None)
+        if entry is None:
+            return None
+        mtime, module = entry
+        try:
+            if os.path.getmtime(path) != mtime:
+                del self.modules[path]
+                return None
+        except OSError:  # the file was deleted
+            del self.modules[path]
+            return None
+        return module
+
+    def set(self, path: str, module: Module):
+        """Add a module to the cache. Does nothing if the file does not exist."""
+        try:
+            self.modules[path] = (os.path.getmtime(path), module)
+        except OSError:
+            pass
+
+    def is_cached(self, path: str) -> bool:
+        """Return True if there is an entry for this path, even if it is outdated."""
+        return path in self.modules
+
+    def clear(self):
+        self.modules.clear()
+
+
+# ##########
+# MODULE LOADER
+# ##########
+class ModuleLoader:
+    """Execute a module only once, the first time what it exports is needed.
+    The same loader is shared by all the copies of a Module value."""
+    def __init__(self, load_function: Callable[[], tuple[dict[str, Value], None] | tuple[None, Error]]):
+        self.load_function = load_function
+        self.attributes: dict[str, Value] | None = None
+
+    def __repr__(self) -> str:
+        return f"<ModuleLoader (loaded={self.attributes is not None})>"
+
+    def load(self) -> tuple[dict[str, Value], None] | tuple[None, Error]:
+        if self.attributes is None:
+            attributes, error = self.load_function()
+            if error is not None:
+                return None, error
+            assert attributes is not None
+            self.attributes = attributes
+        return self.attributes, None
+
+
+MODULE_CACHE = ModuleCache()
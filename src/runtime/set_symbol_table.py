@@ -8,21 +8,41 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 # IMPORTS
+# __future__ import (must be first)
+from __future__ import annotations
 # nougaro modules imports
 from src.runtime.symbol_table import SymbolTable
-from src.runtime.values.number_constants import *
-from src.runtime.values.basevalues.basevalues import String, Value, NoneValue
-from src.runtime.values.functions.builtin_function import BuiltInFunction
+# the values and the built-in functions are imported in _build_snapshot
 # built-in python imports
-import platform
 import sys
-import pprint
+# special typing import
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.runtime.values.basevalues.value import Value
+
+# the symbols of the global symbol table, built only once. Do not edit it, copy it.
+_SNAPSHOT: dict[str, Value] | None = None
 
 
 def set_symbol_table(symbol_table: SymbolTable):
     """Configures the global symbol table
+    The symbols are computed the first time, then copied from a snapshot.
     :param symbol_table: src.symbol_table.SymbolTable
     """
+    global _SNAPSHOT
+    if _SNAPSHOT is None:
+        _SNAPSHOT = _build_snapshot()
+    symbol_table.symbols.update(_SNAPSHOT)
+
+
+def _build_snapshot() -> dict[str, Value]:
+    """Build the symbols of the global symbol table"""
+    from src.runtime.values.number_constants import NULL, TRUE, FALSE, Number
+    from src.runtime.values.basevalues.basevalues import String, Value, NoneValue
+    from src.runtime.values.functions.builtin_function import BuiltInFunction
+    import platform
+
+    symbol_table = SymbolTable()
     # Constants
     symbol_table.set("null", NULL)
     symbol_table.set("True", TRUE)
@@ -39,6 +59,7 @@ def set_symbol_table(symbol_table: SymbolTable):
     symbol_table.set("print_in_red", BuiltInFunction('print_in_red'))
     symbol_table.set("print_ret", BuiltInFunction('print_ret'))
     symbol_table.set("print_in_red_ret", BuiltInFunction('print_in_red_ret'))
+    symbol_table.set("flush", BuiltInFunction('flush'))
     symbol_table.set("input", BuiltInFunction('input'))
     symbol_table.set("input_int", BuiltInFunction('input_int'))
     symbol_table.set("input_num", BuiltInFunction('input_num'))
@@ -49,6 +70,8 @@ def set_symbol_table(symbol_table: SymbolTable):
     symbol_table.set("is_num", BuiltInFunction('is_num'))
     symbol_table.set("is_str", BuiltInFunction('is_str'))
     symbol_table.set("is_list", BuiltInFunction('is_list'))
+    symbol_table.set("is_dict", BuiltInFunction('is_dict'))
+    symbol_table.set("is_set", BuiltInFunction('is_set'))
     symbol_table.set("is_func", BuiltInFunction('is_func'))
     symbol_table.set("is_module", BuiltInFunction('is_module'))
     symbol_table.set("is_none", BuiltInFunction('is_none'))
@@ -56,6 +79,9 @@ def set_symbol_table(symbol_table: SymbolTable):
     symbol_table.set("__py_type__", BuiltInFunction('py_type'))
     symbol_table.set("str", BuiltInFunction('str'))
     symbol_table.set("list", BuiltInFunction('list'))
+    symbol_table.set("dict", BuiltInFunction('dict'))
+    symbol_table.set("set", BuiltInFunction('set'))
+    symbol_table.set("range", BuiltInFunction('range'))
     symbol_table.set("int", BuiltInFunction('int'))
     symbol_table.set("float", BuiltInFunction('float'))
     symbol_table.set("round", BuiltInFunction('round'))
@@ -70,10 +96,22 @@ def set_symbol_table(symbol_table: SymbolTable):
     symbol_table.set("min", BuiltInFunction('min'))
     symbol_table.set("len", BuiltInFunction('len'))
     symbol_table.set("sort", BuiltInFunction('sort'))
+    symbol_table.set("sorted", BuiltInFunction('sorted'))
     symbol_table.set("reverse", BuiltInFunction('reverse'))
     symbol_table.set("esrever", BuiltInFunction('reverse'))
+    symbol_table.set("keys", BuiltInFunction('keys'))
+    symbol_table.set("values", BuiltInFunction('values'))
+    symbol_table.set("items", BuiltInFunction('items'))
+    symbol_table.set("union", BuiltInFunction('union'))
+    symbol_table.set("intersection", BuiltInFunction('intersection'))
+    symbol_table.set("difference", BuiltInFunction('difference'))
 
     symbol_table.set("split", BuiltInFunction('split'))
+    symbol_table.set("join", BuiltInFunction('join'))
+    symbol_table.set("map", BuiltInFunction('map'))
+    symbol_table.set("filter", BuiltInFunction('filter'))
+    symbol_table.set("reduce", BuiltInFunction('reduce'))
+    symbol_table.set("sum", BuiltInFunction('sum'))
     symbol_table.set("upper", BuiltInFunction('upper'))
     symbol_table.set("lower", BuiltInFunction('lower'))
     symbol_table.set("ord", BuiltInFunction('ord'))
@@ -124,7 +162,5 @@ def set_symbol_table(symbol_table: SymbolTable):
     symbol_table.set("__test__", BuiltInFunction("__test__"))
     symbol_table.set("__how_many_lines_of_code__", BuiltInFunction("__how_many_lines_of_code__"))
 
-    symbols_copy: dict[str, Value] = symbol_table.symbols.copy()
-    if '__symbol_table__' in symbols_copy.keys():
-        del symbols_copy['__symbol_table__']
-    symbol_table.set('__symbol_table__', String(pprint.pformat(symbols_copy)))
+    symbol_table.set('__symbol_table__', String(""))  # generated when read: see SymbolTable.symbol_table_as_string
+    return symbol_table.symbols
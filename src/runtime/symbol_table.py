@@ -43,6 +43,17 @@ class SymbolTable:
             return self.parent.get(name, get_in_grandparent)
         return value
 
+    def symbol_table_as_string(self) -> Value:
+        """Value of `__symbol_table__`: the pretty-printed symbols of the table that defines it (this one or a parent).
+        The symbol table only stores a placeholder: the value is generated by the interpreter when it is read."""
+        from src.runtime.values.basevalues.basevalues import String
+        table = self
+        while '__symbol_table__' not in table.symbols and table.parent is not None:
+            table = table.parent
+        symbols_copy = table.symbols.copy()
+        symbols_copy.pop("__symbol_table__", None)
+        return String(pprint.pformat(symbols_copy))
+
     def getf(self, name: str) -> Value | None:
         """Like get, but with get_in_(grand)parent to False. For builtin functions and modules."""
         return self.get(name, False, False)
@@ -15,36 +15,124 @@ from src.runtime.values.basevalues.value import Value
 from src.runtime.runtime_result import RTResult
 from src.runtime.symbol_table import SymbolTable
 from src.runtime.context import Context
-from src.errors.errors import RunTimeError, RTArithmeticError, RTIndexError, RTOverflowError
+from src.errors.errors import RunTimeError, RTArithmeticError, RTIndexError, RTOverflowError, RTTypeError
 # built-in python imports
-# no imports
+from typing import Any, Iterable, Iterator, SupportsIndex
+import array
+import weakref
+# special typing import
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.errors.errors import Error
+    from src.runtime.module_cache import ModuleLoader
 
 
 # IMPORTANT NOTE: THE DOC FOR ALL THE FUNCTIONS IN THIS FILE ARE IN value.py :)
 
+# a string at least this long is built with a buffer when something is added to it (see String.concatenated)
+_ROPE_MIN_LENGTH = 1024
+
+
+def _range_to_slice(indexes: range) -> slice:
+    """Return the slice that gives the elements at these indexes (range(len(x))[slice_] gives the indexes of x[slice_])"""
+    return slice(indexes.start, indexes.stop if indexes.stop >= 0 else None, indexes.step)
+
 
 class String(Value):
     def __init__(self, value: String | str):
         super().__init__()
         if isinstance(value, String):
-            self.value: str = value.value
-        else:
-            self.value: str = value
+            value = value.value
+        self._value: str | None = value
+        self._length = len(value)
+        # Strings made with `+` or `+=` from a big string do not copy it: the parts are stored in a buffer (list of
+        # python str) shared with the string on the left, and joined only when the value is needed (see concatenated).
+        # This string is the _parts_count first parts of the buffer.
+        self._buffer: list[str] | None = None
+        self._parts_count = 0
+        # Slices of a string (`s(a:b)`) do not copy it either: they keep the python str they are made from, and the
+        # indexes of their chars in it (see sliced).
+        self._source: str | None = None
+        self._indexes: range | None = None
         self.type_ = "str"
 
+    @property
+    def value(self) -> str:
+        if self._value is None:
+            if self._source is not None:  # we copy the slice
+                assert self._indexes is not None
+                self._value = self._source[_range_to_slice(self._indexes)]
+                self._source = None
+                self._indexes = None
+            else:  # we join the parts
+                assert self._buffer is not None
+                if self._parts_count == len(self._buffer):
+                    self._value = "".join(self._buffer)
+                else:
+                    self._value = "".join(self._buffer[:self._parts_count])
+        return self._value
+
+    @value.setter
+    def value(self, value: str):
+        self._value = value
+        self._length = len(value)
+        self._buffer = None
+        self._parts_count = 0
+        self._source = None
+        self._indexes = None
+
+    def sliced(self, slice_: slice) -> String:
+        """Return self(start:stop:step), without copying the chars: they are copied when the value of the new string
+        is needed, but its length and its iteration do not need it."""
+        if self._source is not None:  # slice of a slice
+            assert self._indexes is not None
+            source, indexes = self._source, self._indexes[slice_]
+        else:
+            source = self.value
+            indexes = range(len(source))[slice_]
+        new_string = String("")
+        new_string._value = None
+        new_string._length = len(indexes)
+        new_string._source = source
+        new_string._indexes = indexes
+        return new_string.set_context(self.context)
+
+    def concatenated(self, other: str) -> String:
+        """Return a new String, self + other. If the result is big, self is not copied: other is appended to the buffer
+        of self (if no other string was made from self before), so that a loop of `var s += x` is in linear time."""
+        if self._length + len(other) < _ROPE_MIN_LENGTH:
+            return String(self.value + other)
+        buffer = self._buffer
+        if buffer is None or self._parts_count != len(buffer):  # the buffer is already used by a longer string
+            buffer = [self.value]
+        buffer.append(other)
+        new_string = String("")
+        new_string._value = None
+        new_string._length = self._length + len(other)
+        new_string._buffer = buffer
+        new_string._parts_count = len(buffer)
+        return new_string
+
     def __repr__(self):
         return f'"{self.value}"'
 
     def __len__(self):
-        return len(self.value)
+        return self._length
 
     def to_python_str(self) -> str:
         """Returns self.value, as a python str"""
         return self.value
 
+    def iter_(self) -> Iterator[Value]:
+        if self._source is not None:
+            assert self._indexes is not None
+            source = self._source
+            return (String(source[index]) for index in self._indexes)
+        return (String(char) for char in self.value)
+
     def added_to(self, other: Value):
         if isinstance(other, String):
-            return String(self.value + other.value).set_context(self.context), None
+            return self.concatenated(other.value).set_context(self.context), None
         else:
             return None, self.illegal_operation(other)
 
@@ -65,7 +153,10 @@ class String(Value):
             return None, self.illegal_operation(other)
 
     def is_true(self):
-        return len(self.value) > 0
+        return self._length > 0
+
+    def hash_key(self):
+        return self.value
 
     def to_str_(self) -> tuple[String, None]:
         return self.copy(), None
@@ -156,18 +247,31 @@ class String(Value):
 
     def is_in(self, other: Value):
         if isinstance(other, List):
+            is_in = other.hashed_contains(self)
+            if is_in is not None:
+                return Number(int(is_in)).set_context(self.context), None
             for x in other.elements:
                 if self.get_comparison_eq(x)[0].is_true():
                     return TRUE.copy().set_context(self.context), None
             return FALSE.set_context(self.context), None
         elif isinstance(other, String):
             return Number(int(self.value in other.value)).set_context(self.context), None
+        elif isinstance(other, Dict):
+            return Number(int(self.value in other.entries)).set_context(self.context), None
+        elif isinstance(other, Set):
+            return Number(int(self.value in other.elements)).set_context(self.context), None
         else:
             return None, self.can_not_be_in(other)
 
     def copy(self):
-        """Return a copy of self"""
-        copy = String(self.value)
+        """Return a copy of self (if self is a slice or is made of parts, the copy is too)"""
+        copy = String("")
+        copy._value = self._value
+        copy._length = self._length
+        copy._buffer = self._buffer
+        copy._parts_count = self._parts_count
+        copy._source = self._source
+        copy._indexes = self._indexes
         copy.set_pos(self.pos_start, self.pos_end)
         copy.set_context(self.context)
         copy.module_context = self.module_context
@@ -465,15 +569,29 @@ class Number(Value):
 
     def is_in(self, other: Value):
         if isinstance(other, List):
+            is_in = other.hashed_contains(self)
+            if is_in is not None:
+                return Number(int(is_in)).set_context(self.context), None
             for x in other.elements:
                 if self.get_comparison_eq(x)[0].is_true():
                     return TRUE.copy().set_context(self.context), None
             return FALSE.set_context(self.context), None
         elif isinstance(other, String):
             return Number(int(str(self.value) in other.value)).set_context(self.context), None
+        elif isinstance(other, Dict):
+            return Number(int(self.value in other.entries)).set_context(self.context), None
+        elif isinstance(other, Set):
+            return Number(int(self.value in other.elements)).set_context(self.context), None
+        elif isinstance(other, Range):
+            return Number(int(self.value in other.range_)).set_context(self.context), None
+        elif isinstance(other, Array):
+            return Number(int(self.value in other.array_)).set_context(self.context), None
         else:
             return None, self.can_not_be_in(other)
 
+    def hash_key(self):
+        return self.value
+
     def is_int(self):
         return isinstance(self.value, int)
 
@@ -495,30 +613,178 @@ FALSE = Number(0)
 TRUE = Number(1)
 
 
+class ElementList(list[Value]):
+    """The python list of the elements of a List (shared by its copies).
+    It keeps a hash index of its elements for the `in` operator (see List.hashed_contains), and drops it each time it
+    is modified. The views on it (slices of the list, see ListView) copy their elements before it is modified."""
+    def __init__(self, elements: Iterable[Value] = ()):
+        super().__init__(elements)
+        # None: not built yet. False: can not be built (an element is neither a str nor a number)
+        self.hash_index: set[str | int | float] | bool | None = None
+        self.views: weakref.WeakSet[ListView] | None = None
+
+    def add_view(self, view: ListView):
+        if self.views is None:
+            self.views = weakref.WeakSet()
+        self.views.add(view)
+
+    def _modified(self):
+        """Called before each modification"""
+        self.hash_index = None
+        if self.views is not None:
+            for view in list(self.views):
+                view.materialize()
+            self.views = None
+
+    def append(self, element: Value):
+        self._modified()
+        super().append(element)
+
+    def extend(self, elements: Iterable[Value]):
+        self._modified()
+        super().extend(elements)
+
+    def insert(self, index: SupportsIndex, element: Value):
+        self._modified()
+        super().insert(index, element)
+
+    def pop(self, index: SupportsIndex = -1) -> Value:
+        self._modified()
+        return super().pop(index)
+
+    def remove(self, element: Value):
+        self._modified()
+        super().remove(element)
+
+    def clear(self):
+        self._modified()
+        super().clear()
+
+    def sort(self, *args: Any, **kwargs: Any):
+        self._modified()
+        super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self._modified()
+        super().reverse()
+
+    def __setitem__(self, index: Any, value: Any):
+        self._modified()
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index: Any):
+        self._modified()
+        super().__delitem__(index)
+
+    def __iadd__(self, elements: Iterable[Value]):
+        self._modified()
+        return super().__iadd__(elements)
+
+    def __imul__(self, times: SupportsIndex):
+        self._modified()
+        return super().__imul__(times)
+
+
+class ListView:
+    """A slice of a list (`l(a:b:c)`), that does not copy the elements of the list until it is needed: until the list
+    or the slice is modified, or until something asks for the python list of the elements of the slice.
+    Shared by the copies of the List made from the slice, so that they also share the copied elements."""
+    def __init__(self, parent: ElementList, indexes: range):
+        self.parent: ElementList | None = parent
+        self.indexes = indexes  # the indexes of the elements of the slice in parent
+        self.elements: ElementList | None = None  # the copied elements, once they are copied
+        parent.add_view(self)
+
+    def __repr__(self):
+        return f"<ListView {self.indexes} (copied={self.elements is not None})>"
+
+    def materialize(self) -> ElementList:
+        """Copy the elements of the slice (if not already done) and return them"""
+        if self.elements is None:
+            parent = self.parent
+            assert parent is not None
+            indexes = self.indexes
+            if indexes.step == 1:
+                self.elements = ElementList(parent[indexes.start:indexes.stop])
+            else:
+                self.elements = ElementList([parent[index] for index in indexes])
+            self.parent = None  # the parent can be freed
+        return self.elements
+
+
 class List(Value):
-    def __init__(self, elements: list[Value]):
+    def __init__(self, elements: list[Value], view: ListView | None = None):
         super().__init__()
-        self.elements = elements
+        self._elements: list[Value] = elements if isinstance(elements, ElementList) else ElementList(elements)
+        # if self is a slice of another list, its elements are not copied until self.elements is used (see ListView)
+        self._view = view
         self.type_ = 'list'
         self.update_should_print()
 
+    @property
+    def elements(self) -> list[Value]:
+        if self._view is not None:
+            self._elements = self._view.materialize()
+            self._view = None
+        return self._elements
+
+    @elements.setter
+    def elements(self, elements: list[Value]):
+        self._elements = elements if isinstance(elements, ElementList) else ElementList(elements)
+        self._view = None
+
+    def _lazy_view(self) -> ListView | None:
+        """Return the view of self if its elements are not copied yet"""
+        view = self._view
+        if view is not None and view.elements is None:
+            return view
+        return None
+
+    def sliced(self, slice_: slice) -> List:
+        """Return self(start:stop:step), without copying the elements (see ListView)"""
+        view = self._lazy_view()
+        if view is not None:  # slice of a slice
+            assert view.parent is not None
+            parent, indexes = view.parent, view.indexes[slice_]
+        else:
+            parent = self.elements
+            assert isinstance(parent, ElementList)
+            indexes = range(len(parent))[slice_]
+        return List([], ListView(parent, indexes)).set_context(self.context)
+
     def __repr__(self):
-        return f'[{", ".join([x.__str__() for x in self.elements])}]'
+        return f'[{", ".join([x.__str__() for x in self.iter_()])}]'
     
     def to_python_str(self) -> str:
         return self.__repr__()
 
+    def __len__(self):
+        view = self._lazy_view()
+        if view is not None:
+            return len(view.indexes)
+        return len(self.elements)
+
+    def iter_(self) -> Iterator[Value]:
+        if self._lazy_view() is not None:
+            # self[index] is used each time, in case the parent list is modified during the iteration
+            return (self[index] for index in range(len(self)))
+        return iter(self.elements)
+
     def __getitem__(self, item: int):
         """If there is foo[bar] in the python code and that foo is a Nougaro List, it works ^^ !!"""
+        view = self._lazy_view()
+        if view is not None:
+            assert view.parent is not None
+            return view.parent[view.indexes[item]]
         return self.elements[item]
 
     def update_should_print(self):
         should_print = False
 
-        if len(self.elements) == 0:
+        if len(self) == 0:
             should_print = True
         else:
-            for e in self.elements:
+            for e in self.iter_():
                 if e.should_print:
                     should_print = True
                     break
@@ -593,11 +859,11 @@ class List(Value):
         # think this is very slow
         # TODO: maybe find something to improve speed of this method (is_eq in List)
         if isinstance(other, List):
-            if len(self.elements) != len(other.elements):
+            if len(self) != len(other):
                 return False
             else:
-                for index, element in enumerate(self.elements):
-                    comparison, error = element.get_comparison_eq(other.elements[index])
+                for index, element in enumerate(self.iter_()):
+                    comparison, error = element.get_comparison_eq(other[index])
                     if error is not None:
                         return None
                     assert comparison is not None
@@ -661,15 +927,45 @@ class List(Value):
     def is_in(self, other: Value):
         if isinstance(other, String):
             return Number(int(self.to_str_()[0].value in other.value)).set_context(self.context), None
+        elif isinstance(other, Set):
+            hash_key = self.hash_key()
+            return Number(int(hash_key is not None and hash_key in other.elements)).set_context(self.context), None
         else:
             return None, self.can_not_be_in(other)
-    
+
+    def hashed_contains(self, value: String | Number) -> bool | None:
+        """`value in self`, using the hash index of the elements. The index is built at the first call, and built again
+        after each modification of the list. Return None if it can not be used (if an element is neither a str nor a
+        number, or if self.elements is not an ElementList)."""
+        elements = self.elements
+        if not isinstance(elements, ElementList):
+            return None
+        if elements.hash_index is None:
+            if all(isinstance(element, (String, Number)) for element in elements):
+                elements.hash_index = {element.value for element in elements}  # type: ignore
+            else:
+                elements.hash_index = False
+        if not isinstance(elements.hash_index, set):
+            return None
+        return value.value in elements.hash_index
+
+    def hash_key(self):
+        """Lists are hashed like python tuples: a list can be a key of a dict or an element of a set if all its
+        elements can. Modifying a list after using it as a key does not update the key."""
+        keys: list[str | int | float | tuple[Any, ...]] = []
+        for element in self.elements:
+            key = element.hash_key()
+            if key is None:
+                return None
+            keys.append(key)
+        return tuple(keys)
+
     def is_true(self):
-        return bool(len(self.elements))
+        return bool(len(self))
 
     def copy(self):
-        """Return a copy of self"""
-        copy = List(self.elements)
+        """Return a copy of self (if self is a slice, the copy shares its view)"""
+        copy = List(self._elements, self._view)
         copy.set_pos(self.pos_start, self.pos_end)
         copy.set_context(self.context)
         copy.module_context = self.module_context
@@ -689,12 +985,393 @@ class List(Value):
         return self.copy()
 
 
+class Dict(Value):
+    """Hash map. Keys are hashed with Value.hash_key: only strings, numbers and lists of them can be keys."""
+    def __init__(self, entries: dict[Any, tuple[Value, Value]] | None = None):
+        super().__init__()
+        # hash key: (nougaro key, nougaro value). The nougaro key is kept to be given back by keys() and items()
+        self.entries: dict[Any, tuple[Value, Value]] = entries if entries is not None else {}
+        self.type_ = 'dict'
+
+    def __repr__(self):
+        return '{' + ", ".join([f"{key.__str__()}: {value.__str__()}" for key, value in self.entries.values()]) + '}'
+
+    def to_python_str(self) -> str:
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def iter_(self) -> Iterator[Value]:
+        """Iterate over the keys, like in python"""
+        return (key for key, _ in self.entries.values())
+
+    def get(self, key: Value) -> Value | None:
+        """Return the value of this key, or None if the key is not in the dict or can not be a key"""
+        hash_key = key.hash_key()
+        if hash_key is None:
+            return None
+        entry = self.entries.get(hash_key, None)
+        if entry is None:
+            return None
+        return entry[1]
+
+    def set(self, key: Value, value: Value) -> bool:
+        """Set the value of this key. Return False if the key can not be a key (i.e. is mutable)"""
+        hash_key = key.hash_key()
+        if hash_key is None:
+            return False
+        entry = self.entries.get(hash_key, None)
+        if entry is not None:  # like in python, the first key is kept (e.g. 1 if we set 1 then 1.0)
+            key = entry[0]
+        self.entries[hash_key] = (key, value)
+        return True
+
+    def delete(self, key: Value) -> bool:
+        """Remove this key. Return False if the key is not in the dict"""
+        hash_key = key.hash_key()
+        if hash_key is None or hash_key not in self.entries:
+            return False
+        del self.entries[hash_key]
+        return True
+
+    def keys(self) -> list[Value]:
+        return [key for key, _ in self.entries.values()]
+
+    def values(self) -> list[Value]:
+        return [value for _, value in self.entries.values()]
+
+    def items(self) -> list[Value]:
+        return [List([key, value]) for key, value in self.entries.values()]
+
+    def to_str_(self):
+        return String(self.__repr__()).set_context(self.context), None
+
+    def to_list_(self):
+        return List(self.keys()).set_context(self.context), None
+
+    def is_eq(self, other: Value):
+        if not isinstance(other, Dict):
+            return False
+        if len(self.entries) != len(other.entries):
+            return False
+        for hash_key, (_, value) in self.entries.items():
+            other_entry = other.entries.get(hash_key, None)
+            if other_entry is None:
+                return False
+            comparison, error = value.get_comparison_eq(other_entry[1])
+            if error is not None or comparison is None or not comparison.is_true():
+                return False
+        return True
+
+    def get_comparison_eq(self, other: Value):
+        if self.is_eq(other):
+            return TRUE.copy().set_context(self.context), None
+        return FALSE.copy().set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        if self.is_eq(other):
+            return FALSE.copy().set_context(self.context), None
+        return TRUE.copy().set_context(self.context), None
+
+    def and_(self, other: Value):
+        return Number(int(self.is_true() and other.is_true())), None
+
+    def or_(self, other: Value):
+        return Number(int(self.is_true() or other.is_true())), None
+
+    def is_true(self):
+        return len(self.entries) != 0
+
+    def copy(self):
+        """Return a copy of self (the entries are shared, like in List.copy)"""
+        copy = Dict(self.entries)
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+    def true_copy(self):
+        """Return a copy of self where entries are also a copy"""
+        copy = Dict(self.entries.copy())
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+    def __copy__(self):
+        return self.copy()
+
+
+class Set(Value):
+    """Set of strings, numbers and lists (hashed with Value.hash_key)"""
+    def __init__(self, elements: dict[Any, Value] | None = None):
+        super().__init__()
+        # hash key: nougaro value. A dict is used to keep the insertion order
+        self.elements: dict[Any, Value] = elements if elements is not None else {}
+        self.type_ = 'set'
+
+    def __repr__(self):
+        if len(self.elements) == 0:
+            return 'set()'
+        return '{' + ", ".join([element.__str__() for element in self.elements.values()]) + '}'
+
+    def to_python_str(self) -> str:
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self.elements)
+
+    def iter_(self) -> Iterator[Value]:
+        return iter(self.elements.values())
+
+    def add(self, element: Value) -> bool:
+        """Add an element. Return False if it can not be hashed"""
+        hash_key = element.hash_key()
+        if hash_key is None:
+            return False
+        self.elements.setdefault(hash_key, element)
+        return True
+
+    def remove(self, element: Value) -> bool:
+        """Remove an element. Return False if it is not in the set"""
+        hash_key = element.hash_key()
+        if hash_key is None or hash_key not in self.elements:
+            return False
+        del self.elements[hash_key]
+        return True
+
+    def union(self, other: Set) -> Set:
+        elements = self.elements.copy()
+        for hash_key, element in other.elements.items():
+            elements.setdefault(hash_key, element)
+        return Set(elements).set_context(self.context)
+
+    def intersection(self, other: Set) -> Set:
+        return Set({
+            hash_key: element for hash_key, element in self.elements.items() if hash_key in other.elements
+        }).set_context(self.context)
+
+    def difference(self, other: Set) -> Set:
+        return Set({
+            hash_key: element for hash_key, element in self.elements.items() if hash_key not in other.elements
+        }).set_context(self.context)
+
+    def to_str_(self):
+        return String(self.__repr__()).set_context(self.context), None
+
+    def to_list_(self):
+        return List(list(self.elements.values())).set_context(self.context), None
+
+    def is_eq(self, other: Value):
+        return isinstance(other, Set) and self.elements.keys() == other.elements.keys()
+
+    def get_comparison_eq(self, other: Value):
+        if self.is_eq(other):
+            return TRUE.copy().set_context(self.context), None
+        return FALSE.copy().set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        if self.is_eq(other):
+            return FALSE.copy().set_context(self.context), None
+        return TRUE.copy().set_context(self.context), None
+
+    def and_(self, other: Value):
+        return Number(int(self.is_true() and other.is_true())), None
+
+    def or_(self, other: Value):
+        return Number(int(self.is_true() or other.is_true())), None
+
+    def is_true(self):
+        return len(self.elements) != 0
+
+    def copy(self):
+        """Return a copy of self (the elements are shared, like in List.copy)"""
+        copy = Set(self.elements)
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+    def true_copy(self):
+        """Return a copy of self where elements is also a copy"""
+        copy = Set(self.elements.copy())
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+    def __copy__(self):
+        return self.copy()
+
+
+class Range(Value):
+    """Lazy range of integers, like python’s range: the numbers are only made when they are needed"""
+    def __init__(self, start: int, stop: int, step: int):
+        super().__init__()
+        self.range_ = range(start, stop, step)
+        self.type_ = 'range'
+
+    def __repr__(self):
+        return f'range({self.range_.start}, {self.range_.stop}, {self.range_.step})'
+
+    def to_python_str(self) -> str:
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self.range_)
+
+    def iter_(self) -> Iterator[Value]:
+        context = self.context
+        return (Number(i).set_context(context) for i in self.range_)
+
+    def to_str_(self):
+        return String(self.__repr__()).set_context(self.context), None
+
+    def to_list_(self):
+        context = self.context
+        return List([Number(i).set_context(context) for i in self.range_]).set_context(context), None
+
+    def is_eq(self, other: Value):
+        return isinstance(other, Range) and self.range_ == other.range_
+
+    def get_comparison_eq(self, other: Value):
+        if self.is_eq(other):
+            return TRUE.copy().set_context(self.context), None
+        return FALSE.copy().set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        if self.is_eq(other):
+            return FALSE.copy().set_context(self.context), None
+        return TRUE.copy().set_context(self.context), None
+
+    def and_(self, other: Value):
+        return Number(int(self.is_true() and other.is_true())), None
+
+    def or_(self, other: Value):
+        return Number(int(self.is_true() or other.is_true())), None
+
+    def is_true(self):
+        return len(self.range_) != 0
+
+    def copy(self):
+        """Return a copy of self"""
+        copy = Range(self.range_.start, self.range_.stop, self.range_.step)
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+    def __copy__(self):
+        return self.copy()
+
+
+class Array(Value):
+    """Typed array of numbers (see the `array` module), backed by a python array.array: each element takes only a few
+    bytes instead of a whole Number. The Numbers are only made when the elements are read."""
+    def __init__(self, array_: array.array):
+        super().__init__()
+        self.array_ = array_
+        self.type_ = 'array'
+
+    def __repr__(self):
+        return f"array('{self.array_.typecode}', [{', '.join(map(str, self.array_))}])"
+
+    def to_python_str(self) -> str:
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self.array_)
+
+    def __getitem__(self, item: int):
+        return Number(self.array_[item]).set_context(self.context)
+
+    def iter_(self) -> Iterator[Value]:
+        context = self.context
+        return (Number(element).set_context(context) for element in self.array_)
+
+    def sliced(self, slice_: slice) -> Array:
+        """Return self(start:stop:step). The slice of an array.array is a (C) copy."""
+        return Array(self.array_[slice_]).set_context(self.context)
+
+    def append(self, value: Value) -> tuple[type[RunTimeError], str] | None:
+        """Append the value. Return (error class, error message) if it can not be stored in the array."""
+        if not isinstance(value, Number):
+            return RTTypeError, f"expected a number, but got {value.type_}."
+        try:
+            self.array_.append(value.value)
+        except TypeError:
+            return RTTypeError, f"array of type '{self.array_.typecode}' can not contain {value.value}."
+        except OverflowError:
+            return RTOverflowError, f"{value.value} is out of the bounds of an array of type '{self.array_.typecode}'."
+        return None
+
+    def to_str_(self):
+        return String(self.__repr__()).set_context(self.context), None
+
+    def to_list_(self):
+        context = self.context
+        return List([Number(e).set_context(context) for e in self.array_]).set_context(context), None
+
+    def is_eq(self, other: Value):
+        return isinstance(other, Array) and self.array_ == other.array_
+
+    def get_comparison_eq(self, other: Value):
+        if self.is_eq(other):
+            return TRUE.copy().set_context(self.context), None
+        return FALSE.copy().set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        if self.is_eq(other):
+            return FALSE.copy().set_context(self.context), None
+        return TRUE.copy().set_context(self.context), None
+
+    def and_(self, other: Value):
+        return Number(int(self.is_true() and other.is_true())), None
+
+    def or_(self, other: Value):
+        return Number(int(self.is_true() or other.is_true())), None
+
+    def is_true(self):
+        return len(self.array_) != 0
+
+    def copy(self):
+        """Return a copy of self (the python array is shared, like the elements in List.copy)"""
+        copy = Array(self.array_)
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+    def __copy__(self):
+        return self.copy()
+
+
 class Module(Value):
-    def __init__(self, name: str, functions_and_constants: dict[str, Value]):
+    def __init__(self, name: str, functions_and_constants: dict[str, Value], loader: ModuleLoader | None = None):
         super().__init__()
         self.name = name
         self.type_ = "module"
         self.attributes = functions_and_constants.copy()
+        self.loader = loader  # if not None, the module is not loaded yet
+
+    def load(self) -> Error | None:
+        """Execute the module if it is not loaded yet, then fill its attributes. Returns the error if any."""
+        if self.loader is None:
+            return None
+        attributes, error = self.loader.load()
+        if error is not None:
+            return error
+        assert attributes is not None
+        self.attributes = attributes.copy()
+        self.loader = None
+        return None
 
     def __repr__(self):
         return f"<module {self.name}>"
@@ -750,7 +1427,7 @@ class Module(Value):
 
     def copy(self):
         """Return a copy of self"""
-        copy = Module(self.name, self.attributes)
+        copy = Module(self.name, self.attributes, self.loader)
         copy.set_pos(self.pos_start, self.pos_end)
         copy.set_context(self.context)
         copy.module_context = self.module_context
@@ -16,7 +16,7 @@ from src.runtime.context import Context
 from src.runtime.runtime_result import RTResult
 from src.errors.errors import RunTimeError
 # built-in python imports
-# no imports
+from typing import Any, Iterator
 # special typing import
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -43,6 +43,11 @@ class Value:
     def to_python_str(self) -> str:
         return "BaseValue"
 
+    def __bool__(self) -> bool:
+        """A value is always true in python (e.g. in `value or default`), even if it has a length of 0 (e.g. an empty
+        list). The nougaro truth value is self.is_true()."""
+        return True
+
     def set_pos(self, pos_start: Position | None = None, pos_end: Position | None = None):
         """Change self.pos_start and self.pos_end"""
         self.pos_start = pos_start
@@ -289,6 +294,20 @@ class Value:
         """Return PYTHON BOOLEAN True or False depending on if the value's type is FLOAT or not"""
         return False
 
+    def hash_key(self) -> str | int | float | tuple[Any, ...] | None:
+        """Return the python key used to store this value as a key of a Dict or as an element of a Set, or None if it
+        can not be hashed. Two values that are equal must have the same key."""
+        return None
+
+    def iter_(self) -> Iterator[Value] | None:
+        """Return a python iterator over the elements of this value (used by `for ... in`), or None if the value is not
+        iterable. The elements should be made one by one, so that big iterables do not need to be stored in memory."""
+        return None
+
+    def sliced(self, slice_: slice) -> Value | None:
+        """Return self(start:stop:step), or None if the value can not be sliced"""
+        return None
+
     def is_true(self) -> bool:
         """Return PYTHON BOOLEAN True or False depending on if the value is the NOUGARO VALUE for True or not"""
         return False
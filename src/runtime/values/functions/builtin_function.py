@@ -13,6 +13,7 @@ from __future__ import annotations
 # nougaro modules imports
 from src.runtime.values.functions.base_builtin_func import BaseBuiltInFunction
 from src.runtime.values.functions.base_function import BaseFunction
+from src.runtime.values.functions.function_caller import FunctionCaller
 from src.runtime.context import Context
 from src.runtime.values.basevalues.basevalues import *
 from src.runtime.values.number_constants import *
@@ -25,7 +26,7 @@ import os.path
 import random
 import sys
 import subprocess
-from typing import TYPE_CHECKING, Coroutine
+from typing import TYPE_CHECKING, Coroutine, Sized
 if TYPE_CHECKING:
     from src.runtime.interpreter import Interpreter
 
@@ -42,6 +43,24 @@ class BuiltInFunction(BaseBuiltInFunction):
         # create the result
         result = RTResult()
 
+        # fast-call protocol: no context, the arguments are given directly to the method
+        method_dict = self.builtin_functions.get(self.name)
+        if method_dict is not None and method_dict.get("fast_call", False):
+            result.register(self.check_args(
+                method_dict["param_names"], args, method_dict["optional_params"],
+                method_dict["should_respect_args_number"]
+            ))
+            if result.should_return():
+                return result
+            for arg in args:  # there is no new context: the arguments are in the context of the function
+                arg.set_context(self.context)
+            if method_dict.get("calls_functions", False):
+                caller = FunctionCaller(
+                    interpreter_, run, noug_dir, f"{self.name} from {exec_from}", cli_args, work_dir
+                )
+                return method_dict["function"](self, caller, *args)
+            return method_dict["function"](self, *args)
+
         # generate the context and change the symbol table for the context
         exec_ctx = self.generate_new_context()
         assert exec_ctx.symbol_table is not None
@@ -130,9 +149,9 @@ class BuiltInFunction(BaseBuiltInFunction):
     # BUILT-IN FUNCTIONS
     # ==================
 
-    def execute_void(self):
+    def execute_void(self, *_args: Value):
         """Return nothing"""
-        # No params.
+        # No params (but any number of args are accepted and ignored).
         return RTResult().success(NoneValue(False))
 
     builtin_functions["void"] = {
@@ -141,22 +160,22 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": False,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
     
-    def execute_print(self, exec_ctx: Context):
+    def execute_print(self, value: Value | None = None):
         """Print 'value'"""
         # Optional params:
         # * value
-        assert exec_ctx.symbol_table is not None
-        value = exec_ctx.symbol_table.getf('value')
+        # one write instead of two with python's print (the text then the '\n'): see src.output
         if value is not None:  # if the value is defined
             try:
-                print(value.to_python_str())
+                sys.stdout.write(value.to_python_str() + "\n")
             except AttributeError:
-                print(str(value))
+                sys.stdout.write(str(value) + "\n")
         else:  # the value is not defined, we just print a new line like in regular print() python builtin func
-            print()
+            sys.stdout.write("\n")
         return RTResult().success(NoneValue(False))
 
     builtin_functions["print"] = {
@@ -165,7 +184,23 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": ["value"],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
+    }
+
+    def execute_flush(self):
+        """Write what was printed and is still in the buffer of the console (see src.output)"""
+        sys.stdout.flush()
+        return RTResult().success(NoneValue(False))
+
+    builtin_functions["flush"] = {
+        "function": execute_flush,
+        "param_names": [],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir_work_dir": False,
+        "noug_dir": False,
+        "fast_call": True
     }
 
     def execute_print_in_red(self, exec_ctx: Context):
@@ -346,12 +381,10 @@ class BuiltInFunction(BaseBuiltInFunction):
         "noug_dir": False
     }
 
-    def execute_is_int(self, exec_ctx: Context):
+    def execute_is_int(self, value: Value):
         """Check if 'value' is an integer"""
         # Params:
         # * value
-        assert exec_ctx.symbol_table is not None
-        value = exec_ctx.symbol_table.getf('value')  # we get the value
         is_number = isinstance(value, Number)  # we check if the value is a number
         if is_number:
             if value.type_ == 'int':  # then we check if the number is an integer
@@ -369,15 +402,14 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
-    def execute_is_float(self, exec_ctx: Context):
+    def execute_is_float(self, value: Value):
         """Check if 'value' is a float"""
         # Params:
         # * value
-        assert exec_ctx.symbol_table is not None
-        value = exec_ctx.symbol_table.getf('value')  # we get the value
         is_number = isinstance(value, Number)  # we check if the value is a number
         if is_number:
             if value.type_ == 'float':  # then we check if the number is a float
@@ -395,15 +427,14 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
-    def execute_is_num(self, exec_ctx: Context):
+    def execute_is_num(self, value: Value):
         """Check if 'value' is an int or a float"""
         # Params:
         # * value
-        assert exec_ctx.symbol_table is not None
-        value = exec_ctx.symbol_table.getf('value')  # we get the value
         is_number = isinstance(value, Number)  # we check if the value is a number
         # TRUE and FALSE are defined in src/values/number_constants.py
         return RTResult().success(TRUE.copy() if is_number else FALSE.copy())
@@ -414,16 +445,16 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
-    def execute_is_list(self, exec_ctx: Context):
+    def execute_is_list(self, value: Value):
         """Check if 'value' is a List"""
         # Params:
         # * value
         # we get the value and check if it is a list
-        assert exec_ctx.symbol_table is not None
-        is_list = isinstance(exec_ctx.symbol_table.getf('value'), List)
+        is_list = isinstance(value, List)
         # TRUE and FALSE are defined in src/values/number_constants.py
         return RTResult().success(TRUE.copy() if is_list else FALSE.copy())
 
@@ -433,16 +464,52 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
+    }
+
+    def execute_is_dict(self, value: Value):
+        """Check if 'value' is a Dict"""
+        # Params:
+        # * value
+        is_dict = isinstance(value, Dict)
+        # TRUE and FALSE are defined in src/values/number_constants.py
+        return RTResult().success(TRUE.copy() if is_dict else FALSE.copy())
+
+    builtin_functions["is_dict"] = {
+        "function": execute_is_dict,
+        "param_names": ["value"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir_work_dir": False,
+        "noug_dir": False,
+        "fast_call": True
+    }
+
+    def execute_is_set(self, value: Value):
+        """Check if 'value' is a Set"""
+        # Params:
+        # * value
+        is_set = isinstance(value, Set)
+        # TRUE and FALSE are defined in src/values/number_constants.py
+        return RTResult().success(TRUE.copy() if is_set else FALSE.copy())
+
+    builtin_functions["is_set"] = {
+        "function": execute_is_set,
+        "param_names": ["value"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir_work_dir": False,
+        "noug_dir": False,
+        "fast_call": True
     }
 
-    def execute_is_str(self, exec_ctx: Context):
+    def execute_is_str(self, value: Value):
         """Check if 'value' is a String"""
         # Params:
         # * value
         # we get the value and check if it is a str
-        assert exec_ctx.symbol_table is not None
-        is_str = isinstance(exec_ctx.symbol_table.getf('value'), String)
+        is_str = isinstance(value, String)
         # TRUE and FALSE are defined in src/values/number_constants.py
         return RTResult().success(TRUE.copy() if is_str else FALSE.copy())
 
@@ -452,16 +519,15 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
-    def execute_is_func(self, exec_ctx: Context):
+    def execute_is_func(self, value: Value):
         """Check if 'value' is a BaseFunction"""
         # Params:
         # * value
-        assert exec_ctx.symbol_table is not None
-        is_func = isinstance(exec_ctx.symbol_table.getf('value'), BaseFunction)  # we get the value and check if it
-        #                                                                             is a function
+        is_func = isinstance(value, BaseFunction)  # we check if the value is a function
         # TRUE and FALSE are defined in src/values/number_constants.py
         return RTResult().success(TRUE.copy() if is_func else FALSE.copy())
 
@@ -471,16 +537,16 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
-    def execute_is_none(self, exec_ctx: Context):
+    def execute_is_none(self, value: Value):
         """Check if 'value' is a NoneValue"""
         # Params:
         # * value
         # we get the value and check if it is None
-        assert exec_ctx.symbol_table is not None
-        is_none = isinstance(exec_ctx.symbol_table.getf('value'), NoneValue)
+        is_none = isinstance(value, NoneValue)
         # TRUE and FALSE are defined in src/values/number_constants.py
         return RTResult().success(TRUE.copy() if is_none else FALSE.copy())
 
@@ -490,16 +556,16 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
-    def execute_is_module(self, exec_ctx: Context):
+    def execute_is_module(self, value: Value):
         """Check if 'value' is a Module"""
         # Params:
         # * value
         # we get the value and check if it is a module
-        assert exec_ctx.symbol_table is not None
-        is_none = isinstance(exec_ctx.symbol_table.getf('value'), Module)
+        is_none = isinstance(value, Module)
         # TRUE and FALSE are defined in src/values/number_constants.py
         return RTResult().success(TRUE.copy() if is_none else FALSE.copy())
 
@@ -509,18 +575,34 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
-    def execute_append(self, exec_ctx: Context):
+    def execute_append(self, list_: Value, value: Value):
         """Append 'value' to 'list'"""
         # Params:
         # * list
         # * value
         # we get list and value
-        assert exec_ctx.symbol_table is not None
-        list_ = exec_ctx.symbol_table.getf('list')
-        value = exec_ctx.symbol_table.getf('value')
+        assert self.context is not None
+
+        if isinstance(list_, Set):  # append(set, value) adds the value to the set
+            if not list_.add(value):
+                return self._unhashable_error(value, "append")
+            return RTResult().success(list_)
+
+        if isinstance(list_, Array):  # append(array, number) checks that the number fits in the array
+            error = list_.append(value)
+            if error is not None:
+                error_class, error_message = error
+                assert value.pos_start is not None
+                assert value.pos_end is not None
+                return RTResult().failure(error_class(
+                    value.pos_start, value.pos_end, error_message, self.context,
+                    "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_append"
+                ))
+            return RTResult().success(list_)
 
         if not isinstance(list_, List):  # we check if the list is a list
             assert list_ is not None
@@ -528,7 +610,7 @@ class BuiltInFunction(BaseBuiltInFunction):
             assert list_.pos_end is not None
             return RTResult().failure(RTTypeErrorF(
                 list_.pos_start, list_.pos_end, "first", "append", "list", list_,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_append"
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_append", or_="set"
             ))
 
         assert value is not None
@@ -542,7 +624,8 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
     def execute_pop(self, exec_ctx: Context):
@@ -556,13 +639,18 @@ class BuiltInFunction(BaseBuiltInFunction):
         list_ = exec_ctx.symbol_table.getf('list')
         index = exec_ctx.symbol_table.getf('index')
 
+        if isinstance(list_, Dict):  # pop(dict, key) removes the key and returns its value
+            return self._pop_dict(list_, index, exec_ctx)
+        if isinstance(list_, Set):  # pop(set, value) removes the value and returns it
+            return self._pop_set(list_, index, exec_ctx)
+
         if not isinstance(list_, List):  # we check if the list is a list
             assert list_ is not None
             assert list_.pos_start is not None
             assert list_.pos_end is not None
             return RTResult().failure(RTTypeErrorF(
                 list_.pos_start, list_.pos_end, "first", "pop", "list", list_,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_pop"
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_pop", or_="dict"
             ))
 
         if index is None:
@@ -595,6 +683,47 @@ class BuiltInFunction(BaseBuiltInFunction):
             ))
         return RTResult().success(element)
 
+    def _pop_dict(self, dict_: Dict, key: Value | None, exec_ctx: Context):
+        """pop(dict, key)"""
+        if key is None:
+            assert self.pos_start is not None
+            assert self.pos_end is not None
+            return RTResult().failure(RunTimeError(
+                self.pos_start, self.pos_end,
+                "'pop' needs a key when its first argument is a dict.",
+                exec_ctx, origin_file="src.runtime.values.functions.builtin_function.BuiltInFunction._pop_dict"
+            ))
+        value = dict_.get(key)
+        if value is None or not dict_.delete(key):
+            assert key.pos_start is not None
+            assert key.pos_end is not None
+            return RTResult().failure(RTKeyError(
+                key.pos_start, key.pos_end,
+                f"key {key} not found in dict.",
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction._pop_dict"
+            ))
+        return RTResult().success(value)
+
+    def _pop_set(self, set_: Set, value: Value | None, exec_ctx: Context):
+        """pop(set, value)"""
+        if value is None:
+            assert self.pos_start is not None
+            assert self.pos_end is not None
+            return RTResult().failure(RunTimeError(
+                self.pos_start, self.pos_end,
+                "'pop' needs a value when its first argument is a set.",
+                exec_ctx, origin_file="src.runtime.values.functions.builtin_function.BuiltInFunction._pop_set"
+            ))
+        if not set_.remove(value):
+            assert value.pos_start is not None
+            assert value.pos_end is not None
+            return RTResult().failure(RTKeyError(
+                value.pos_start, value.pos_end,
+                f"{value} not found in set.",
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction._pop_set"
+            ))
+        return RTResult().success(value)
+
     builtin_functions["pop"] = {
         "function": execute_pop,
         "param_names": ["list"],
@@ -723,22 +852,44 @@ class BuiltInFunction(BaseBuiltInFunction):
         "noug_dir": False
     }
 
-    def execute_get(self, exec_ctx: Context):
+    def execute_get(self, list_: Value, index_: Value, default: Value | None = None):
+        """Get the element at 'index' in 'list', or the value of the key 'index' in a dict"""
         # Params:
         # * list
         # * index
+        # Optional params:
+        # * default (dicts only: value returned if the key is not in the dict)
         # we get the list and the index
-        assert exec_ctx.symbol_table is not None
-        list_ = exec_ctx.symbol_table.getf('list')
-        index_ = exec_ctx.symbol_table.getf('index')
+        assert self.context is not None
 
         assert list_ is not None
         assert list_.pos_start is not None
         assert list_.pos_end is not None
+        if isinstance(list_, Dict):
+            value = list_.get(index_)
+            if value is not None:
+                return RTResult().success(value)
+            if default is not None:
+                return RTResult().success(default)
+            assert index_.pos_start is not None
+            assert index_.pos_end is not None
+            return RTResult().failure(RTKeyError(
+                index_.pos_start, index_.pos_end,
+                f"key {index_} not found in dict.",
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_get"
+            ))
         if not isinstance(list_, List):  # we check if the list is a list
             return RTResult().failure(RTTypeErrorF(
                 list_.pos_start, list_.pos_end, "first", "get", "list", list_,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_get"
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_get", or_="dict"
+            ))
+        if default is not None:
+            assert default.pos_start is not None
+            assert default.pos_end is not None
+            return RTResult().failure(RunTimeError(
+                default.pos_start, default.pos_end,
+                "the third argument of 'get' can only be used with dicts.",
+                self.context, origin_file="src.runtime.values.functions.builtin_function.BuiltInFunction.execute_get"
             ))
 
         assert index_ is not None
@@ -747,7 +898,7 @@ class BuiltInFunction(BaseBuiltInFunction):
         if not isinstance(index_, Number) or not isinstance(index_.value, int):  # we check if the index is a number
             return RTResult().failure(RTTypeErrorF(
                 index_.pos_start, index_.pos_end, "second", "get", "integer", index_,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_get"
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_get"
             ))
 
         try:
@@ -756,16 +907,17 @@ class BuiltInFunction(BaseBuiltInFunction):
             return RTResult().failure(RTIndexError(
                 list_.pos_start, index_.pos_end,
                 f'list index {index_.value} out of range.',
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_get"
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_get"
             ))
     
     builtin_functions["get"] = {
         "function": execute_get,
         "param_names": ["list", "index"],
-        "optional_params": [],
+        "optional_params": ["default"],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
     def execute_replace(self, exec_ctx: Context):
@@ -783,11 +935,24 @@ class BuiltInFunction(BaseBuiltInFunction):
         assert list_ is not None
         assert list_.pos_start is not None
         assert list_.pos_end is not None
+        assert index_ is not None
+        assert value is not None
+        if isinstance(list_, Dict):  # replace(dict, key, value) sets the value of the key
+            if not list_.set(index_, value):
+                assert index_.pos_start is not None
+                assert index_.pos_end is not None
+                return RTResult().failure(RTTypeError(
+                    index_.pos_start, index_.pos_end,
+                    f"unhashable type: ‘{index_.type_}’ can not be a key of a dict.",
+                    exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_replace"
+                ))
+            return RTResult().success(list_)
+
         # we check the values
         if not isinstance(list_, List):
             return RTResult().failure(RTTypeErrorF(
                 list_.pos_start, list_.pos_end, "first", "replace", "list", list_,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_replace"
+                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_replace", or_="dict"
             ))
 
         assert index_ is not None
@@ -990,6 +1155,281 @@ class BuiltInFunction(BaseBuiltInFunction):
         "noug_dir": False
     }
 
+    def execute_join(self, iterable: Value, separator: Value | None = None):
+        """Joins the strs of a list (or of any iterable) into one str, with a separator (empty str by default)"""
+        # Params:
+        # * iterable
+        # Optional params:
+        # * separator
+        assert self.context is not None
+        if separator is None:
+            separator = String("")
+        if not isinstance(separator, String):
+            assert separator.pos_start is not None
+            assert separator.pos_end is not None
+            return RTResult().failure(RTTypeErrorF(
+                separator.pos_start, separator.pos_end, "second", "join", "str", separator,
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_join"
+            ))
+        elements = iterable.iter_()
+        if elements is None:
+            assert iterable.pos_start is not None
+            assert iterable.pos_end is not None
+            return RTResult().failure(RTTypeErrorF(
+                iterable.pos_start, iterable.pos_end, "first", "join", "list", iterable,
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_join"
+            ))
+
+        parts: list[str] = []
+        try:
+            for element in elements:
+                if not isinstance(element, String):
+                    assert iterable.pos_start is not None
+                    assert iterable.pos_end is not None
+                    return RTResult().failure(RTTypeError(
+                        iterable.pos_start, iterable.pos_end,
+                        f"every element to join should be a str, got {element.type_}.",
+                        self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_join"
+                    ))
+                parts.append(element.value)
+        except IterationError as e:  # e.g. an error in the body of a generator
+            return RTResult().failure(e.error)
+        return RTResult().success(String(separator.value.join(parts)))
+
+    builtin_functions["join"] = {
+        "function": execute_join,
+        "param_names": ["iterable"],
+        "optional_params": ["separator"],
+        "should_respect_args_number": True,
+        "run_noug_dir_work_dir": False,
+        "noug_dir": False,
+        "fast_call": True
+    }
+
+    @staticmethod
+    def _with_pos(element: Value, iterable: Value) -> Value:
+        """Elements made on the fly (by a range, an array, ...) have no position: give them the one of the iterable, so
+        that the errors are shown at the right place"""
+        if element.pos_start is None:
+            return element.copy().set_pos(iterable.pos_start, iterable.pos_end)
+        return element
+
+    def execute_map(self, caller: FunctionCaller, function: Value, iterable: Value):
+        """Calls a function on each element of a list (or of any iterable) and returns the list of the results"""
+        # Params:
+        # * function
+        # * iterable
+        assert self.context is not None
+        if not isinstance(function, BaseFunction):
+            assert function.pos_start is not None
+            assert function.pos_end is not None
+            return RTResult().failure(RTTypeErrorF(
+                function.pos_start, function.pos_end, "first", "map", "function", function,
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_map"
+            ))
+        elements = iterable.iter_()
+        if elements is None:
+            assert iterable.pos_start is not None
+            assert iterable.pos_end is not None
+            return RTResult().failure(RTTypeErrorF(
+                iterable.pos_start, iterable.pos_end, "second", "map", "list", iterable,
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_map"
+            ))
+
+        call = caller.repeated(function)
+        results: list[Value] = []
+        try:
+            for element in elements:
+                result = call([self._with_pos(element, iterable)])
+                if result.should_return():  # we stop at the first error
+                    return result
+                assert result.value is not None
+                results.append(result.value)
+        except IterationError as e:  # e.g. an error in the body of a generator
+            return RTResult().failure(e.error)
+        return RTResult().success(List(results))
+
+    builtin_functions["map"] = {
+        "function": execute_map,
+        "param_names": ["function", "iterable"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir_work_dir": False,
+        "noug_dir": False,
+        "fast_call": True,
+        "calls_functions": True
+    }
+
+    def execute_filter(self, caller: FunctionCaller, function: Value, iterable: Value):
+        """Returns the list of the elements of a list (or of any iterable) for which the function returns True"""
+        # Params:
+        # * function
+        # * iterable
+        assert self.context is not None
+        if not isinstance(function, BaseFunction):
+            assert function.pos_start is not None
+            assert function.pos_end is not None
+            return RTResult().failure(RTTypeErrorF(
+                function.pos_start, function.pos_end, "first", "filter", "function", function,
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_filter"
+            ))
+        elements = iterable.iter_()
+        if elements is None:
+            assert iterable.pos_start is not None
+            assert iterable.pos_end is not None
+            return RTResult().failure(RTTypeErrorF(
+                iterable.pos_start, iterable.pos_end, "second", "filter", "list", iterable,
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_filter"
+            ))
+
+        call = caller.repeated(function)
+        kept: list[Value] = []
+        try:
+            for element in elements:
+                result = call([self._with_pos(element, iterable)])
+                if result.should_return():  # we stop at the first error
+                    return result
+                assert result.value is not None
+                if result.value.is_true():
+                    kept.append(element)
+        except IterationError as e:  # e.g. an error in the body of a generator
+            return RTResult().failure(e.error)
+        return RTResult().success(List(kept))
+
+    builtin_functions["filter"] = {
+        "function": execute_filter,
+        "param_names": ["function", "iterable"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir_work_dir": False,
+        "noug_dir": False,
+        "fast_call": True,
+        "calls_functions": True
+    }
+
+    def execute_reduce(self, caller: FunctionCaller, function: Value, iterable: Value, initial: Value | None = None):
+        """Reduces a list (or any iterable) to one value, by calling the function on the result so far and the next
+        element: reduce(f, [a, b, c]) is f(f(a, b), c)"""
+        # Params:
+        # * function
+        # * iterable
+        # Optional params:
+        # * initial
+        assert self.context is not None
+        if not isinstance(function, BaseFunction):
+            assert function.pos_start is not None
+            assert function.pos_end is not None
+            return RTResult().failure(RTTypeErrorF(
+                function.pos_start, function.pos_end, "first", "reduce", "function", function,
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_reduce"
+            ))
+        elements = iterable.iter_()
+        if elements is None:
+            assert iterable.pos_start is not None
+            assert iterable.pos_end is not None
+            return RTResult().failure(RTTypeErrorF(
+                iterable.pos_start, iterable.pos_end, "second", "reduce", "list", iterable,
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_reduce"
+            ))
+
+        call = caller.repeated(function)
+        accumulator = initial
+        try:
+            for element in elements:
+                element = self._with_pos(element, iterable)
+                if accumulator is None:  # no initial value: we start with the first element
+                    accumulator = element
+                    continue
+                result = call([accumulator, element])
+                if result.should_return():  # we stop at the first error
+                    return result
+                assert result.value is not None
+                accumulator = result.value
+                if accumulator.pos_start is None:
+                    accumulator.set_pos(element.pos_start, element.pos_end)
+        except IterationError as e:  # e.g. an error in the body of a generator
+            return RTResult().failure(e.error)
+
+        if accumulator is None:
+            assert iterable.pos_start is not None
+            assert iterable.pos_end is not None
+            return RTResult().failure(RTIndexError(
+                iterable.pos_start, iterable.pos_end,
+                "can not reduce an empty iterable without an initial value.",
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_reduce"
+            ))
+        return RTResult().success(accumulator)
+
+    builtin_functions["reduce"] = {
+        "function": execute_reduce,
+        "param_names": ["function", "iterable"],
+        "optional_params": ["initial"],
+        "should_respect_args_number": True,
+        "run_noug_dir_work_dir": False,
+        "noug_dir": False,
+        "fast_call": True,
+        "calls_functions": True
+    }
+
+    def execute_sum(self, iterable: Value, start: Value | None = None):
+        """Adds the numbers of a list (or of any iterable), without making a Number for each intermediate sum"""
+        # Params:
+        # * iterable
+        # Optional params:
+        # * start
+        assert self.context is not None
+        if start is None:
+            start = Number(0)
+        if not isinstance(start, Number):
+            assert start.pos_start is not None
+            assert start.pos_end is not None
+            return RTResult().failure(RTTypeErrorF(
+                start.pos_start, start.pos_end, "second", "sum", "number", start,
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_sum"
+            ))
+
+        # the numbers of ranges and arrays are added directly by python
+        if isinstance(iterable, Range):
+            return RTResult().success(Number(sum(iterable.range_, start.value)))
+        if isinstance(iterable, Array):
+            return RTResult().success(Number(sum(iterable.array_, start.value)))
+
+        elements = iterable.iter_()
+        if elements is None:
+            assert iterable.pos_start is not None
+            assert iterable.pos_end is not None
+            return RTResult().failure(RTTypeErrorF(
+                iterable.pos_start, iterable.pos_end, "first", "sum", "list", iterable,
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_sum"
+            ))
+
+        total = start.value
+        try:
+            for element in elements:
+                if not isinstance(element, Number):
+                    element = self._with_pos(element, iterable)
+                    assert element.pos_start is not None
+                    assert element.pos_end is not None
+                    return RTResult().failure(RTTypeError(
+                        element.pos_start, element.pos_end,
+                        f"every element to add should be a number, got {element.type_}.",
+                        self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_sum"
+                    ))
+                total += element.value
+        except IterationError as e:  # e.g. an error in the body of a generator
+            return RTResult().failure(e.error)
+        return RTResult().success(Number(total))
+
+    builtin_functions["sum"] = {
+        "function": execute_sum,
+        "param_names": ["iterable"],
+        "optional_params": ["start"],
+        "should_respect_args_number": True,
+        "run_noug_dir_work_dir": False,
+        "noug_dir": False,
+        "fast_call": True
+    }
+
     def execute_exit(self, exec_ctx: Context):
         """Stops the Nougaro Interpreter"""
         # Optional params:
@@ -1010,12 +1450,10 @@ class BuiltInFunction(BaseBuiltInFunction):
         "noug_dir": False
     }
 
-    def execute_type(self, exec_ctx: Context):
+    def execute_type(self, value_to_get_type: Value):
         """Get the type of 'value'"""
         # Params :
         # * value
-        assert exec_ctx.symbol_table is not None
-        value_to_get_type = exec_ctx.symbol_table.getf('value')  # we get the value
         assert value_to_get_type is not None
         return RTResult().success(String(value_to_get_type.type_))  # we return its type
 
@@ -1025,15 +1463,14 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
-    def execute_py_type(self, exec_ctx: Context):
+    def execute_py_type(self, value_to_get_type: Value):
         """Get the python type of 'value'"""
         # Params :
         # * value
-        assert exec_ctx.symbol_table is not None
-        value_to_get_type = exec_ctx.symbol_table.getf('value')  # we get the value
         return RTResult().success(String(str(type(value_to_get_type))))  # we return its python type
 
     builtin_functions["py_type"] = {
@@ -1042,15 +1479,14 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
-    def execute_str(self, exec_ctx: Context):
+    def execute_str(self, value: Value):
         """Python 'str()'"""
         # Params :
         # * value
-        assert exec_ctx.symbol_table is not None
-        value = exec_ctx.symbol_table.getf('value')  # we get the value
         assert value is not None
         str_value, error = value.to_str_()  # we convert
         if error is not None:
@@ -1065,15 +1501,14 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
-    def execute_int(self, exec_ctx: Context):
+    def execute_int(self, value: Value):
         """Python 'int()'"""
         # Params :
         # * value
-        assert exec_ctx.symbol_table is not None
-        value = exec_ctx.symbol_table.getf('value')  # we get the value
         assert value is not None
         int_value, error = value.to_int_()  # we convert
         if error is not None:
@@ -1088,15 +1523,14 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
-    def execute_float(self, exec_ctx: Context):
+    def execute_float(self, value: Value):
         """Python 'float()'"""
         # Params :
         # * value
-        assert exec_ctx.symbol_table is not None
-        value = exec_ctx.symbol_table.getf('value')  # we get the value
         assert value is not None
         float_value, error = value.to_float_()  # we convert
         if error is not None:
@@ -1111,15 +1545,14 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
-    def execute_list(self, exec_ctx: Context):
+    def execute_list(self, value: Value):
         """Python 'list()'"""
         # Params :
         # * value
-        assert exec_ctx.symbol_table is not None
-        value = exec_ctx.symbol_table.getf('value')  # we get the value
         assert value is not None
         if isinstance(value, List):
             return RTResult().success(value.true_copy())
@@ -1136,30 +1569,31 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
-    def execute_len(self, exec_ctx: Context):
+    def execute_len(self, value_: Value):
         """Returns the length of a list or a str"""
         # Params :
         # * list
-        assert exec_ctx.symbol_table is not None
-        value_ = exec_ctx.symbol_table.getf('value')  # we get the value
+        assert self.context is not None
 
         # we check if the value is a list or a str
-        if not isinstance(value_, List) and not isinstance(value_, String):
-            assert value_ is not None
-            assert value_.pos_start is not None
-            assert value_.pos_end is not None
-            return RTResult().failure(RTTypeErrorF(
-                value_.pos_start, value_.pos_end, "first", "len", "list", value_,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_len", or_="str"
-            ))
-
         if isinstance(value_, List):
-            return RTResult().success(Number(len(value_.elements)))
-        else:
-            return RTResult().success(Number(len(value_.value)))
+            return RTResult().success(Number(len(value_)))
+        elif isinstance(value_, String):
+            return RTResult().success(Number(len(value_)))
+        elif isinstance(value_, Sized):  # dict, set, range, array, and the values of the modules that have a length
+            return RTResult().success(Number(len(value_)))
+
+        assert value_ is not None
+        assert value_.pos_start is not None
+        assert value_.pos_end is not None
+        return RTResult().failure(RTTypeErrorF(
+            value_.pos_start, value_.pos_end, "first", "len", "list", value_,
+            self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_len", or_="str"
+        ))
 
     builtin_functions["len"] = {
         "function": execute_len,
@@ -1167,7 +1601,296 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
+    }
+
+    def execute_dict(self, value: Value | None = None):
+        """Python 'dict()': returns a copy of a dict, or converts a list of [key, value] lists to a dict"""
+        # Optional params:
+        # * value
+        assert self.context is not None
+        if value is None:
+            return RTResult().success(Dict())
+        if isinstance(value, Dict):
+            return RTResult().success(value.true_copy())
+        if not isinstance(value, List):
+            assert value.pos_start is not None
+            assert value.pos_end is not None
+            return RTResult().failure(RTTypeErrorF(
+                value.pos_start, value.pos_end, "first", "dict", "list", value,
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_dict", or_="dict"
+            ))
+
+        dict_ = Dict()
+        for pair in value.elements:
+            if not isinstance(pair, List) or len(pair.elements) != 2:
+                assert value.pos_start is not None
+                assert value.pos_end is not None
+                return RTResult().failure(RTTypeError(
+                    value.pos_start, value.pos_end,
+                    f"every element of the list should be a [key, value] list, got {pair}.",
+                    self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_dict"
+                ))
+            key = pair.elements[0]
+            if not dict_.set(key, pair.elements[1]):
+                assert value.pos_start is not None
+                assert value.pos_end is not None
+                return RTResult().failure(RTTypeError(
+                    value.pos_start, value.pos_end,
+                    f"unhashable type: ‘{key.type_}’ can not be a key of a dict.",
+                    self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_dict"
+                ))
+        return RTResult().success(dict_)
+
+    builtin_functions["dict"] = {
+        "function": execute_dict,
+        "param_names": [],
+        "optional_params": ["value"],
+        "should_respect_args_number": True,
+        "run_noug_dir_work_dir": False,
+        "noug_dir": False,
+        "fast_call": True
+    }
+
+    def _check_dict(self, dict_: Value, func_name: str) -> RTResult | None:
+        """Return a failed result if 'dict_' (first argument of 'func_name') is not a dict"""
+        if isinstance(dict_, Dict):
+            return None
+        assert self.context is not None
+        assert dict_.pos_start is not None
+        assert dict_.pos_end is not None
+        return RTResult().failure(RTTypeErrorF(
+            dict_.pos_start, dict_.pos_end, "first", func_name, "dict", dict_,
+            self.context, f"src.runtime.values.functions.builtin_function.BuiltInFunction.execute_{func_name}"
+        ))
+
+    def execute_keys(self, dict_: Value):
+        """Returns the list of the keys of a dict"""
+        # Params:
+        # * dict
+        error = self._check_dict(dict_, "keys")
+        if error is not None:
+            return error
+        assert isinstance(dict_, Dict)
+        return RTResult().success(List(dict_.keys()))
+
+    builtin_functions["keys"] = {
+        "function": execute_keys,
+        "param_names": ["dict"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir_work_dir": False,
+        "noug_dir": False,
+        "fast_call": True
+    }
+
+    def execute_values(self, dict_: Value):
+        """Returns the list of the values of a dict"""
+        # Params:
+        # * dict
+        error = self._check_dict(dict_, "values")
+        if error is not None:
+            return error
+        assert isinstance(dict_, Dict)
+        return RTResult().success(List(dict_.values()))
+
+    builtin_functions["values"] = {
+        "function": execute_values,
+        "param_names": ["dict"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir_work_dir": False,
+        "noug_dir": False,
+        "fast_call": True
+    }
+
+    def execute_items(self, dict_: Value):
+        """Returns the list of the [key, value] lists of a dict"""
+        # Params:
+        # * dict
+        error = self._check_dict(dict_, "items")
+        if error is not None:
+            return error
+        assert isinstance(dict_, Dict)
+        return RTResult().success(List(dict_.items()))
+
+    builtin_functions["items"] = {
+        "function": execute_items,
+        "param_names": ["dict"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir_work_dir": False,
+        "noug_dir": False,
+        "fast_call": True
+    }
+
+    def _unhashable_error(self, value: Value, func_name: str) -> RTResult:
+        assert self.context is not None
+        assert value.pos_start is not None
+        assert value.pos_end is not None
+        return RTResult().failure(RTTypeError(
+            value.pos_start, value.pos_end,
+            f"unhashable type: ‘{value.type_}’ can not be an element of a set.",
+            self.context, f"src.runtime.values.functions.builtin_function.BuiltInFunction.execute_{func_name}"
+        ))
+
+    def execute_set(self, value: Value | None = None):
+        """Python 'set()': converts an iterable (list, str, dict keys, range...) to a new set"""
+        # Optional params:
+        # * value
+        assert self.context is not None
+        if value is None:
+            return RTResult().success(Set())
+        if isinstance(value, Set):
+            return RTResult().success(value.true_copy())
+        elements = value.iter_()
+        if elements is None:
+            assert value.pos_start is not None
+            assert value.pos_end is not None
+            return RTResult().failure(RTTypeErrorF(
+                value.pos_start, value.pos_end, "first", "set", "list", value,
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_set", or_="str"
+            ))
+
+        set_ = Set()
+        try:
+            for element in elements:
+                if not set_.add(element):
+                    return self._unhashable_error(element if element.pos_start is not None else value, "set")
+        except IterationError as e:  # e.g. an error in the body of a generator
+            return RTResult().failure(e.error)
+        return RTResult().success(set_)
+
+    builtin_functions["set"] = {
+        "function": execute_set,
+        "param_names": [],
+        "optional_params": ["value"],
+        "should_respect_args_number": True,
+        "run_noug_dir_work_dir": False,
+        "noug_dir": False,
+        "fast_call": True
+    }
+
+    def execute_range(self, start: Value, stop: Value | None = None, step: Value | None = None):
+        """Python 'range()': returns a lazy range. range(stop) is range(0, stop, 1)"""
+        # Params:
+        # * start
+        # Optional params:
+        # * stop
+        # * step
+        assert self.context is not None
+        for arg_num, arg in (("first", start), ("second", stop), ("third", step)):
+            if arg is not None and not (isinstance(arg, Number) and isinstance(arg.value, int)):
+                assert arg.pos_start is not None
+                assert arg.pos_end is not None
+                return RTResult().failure(RTTypeErrorF(
+                    arg.pos_start, arg.pos_end, arg_num, "range", "int", arg,
+                    self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_range"
+                ))
+        assert isinstance(start, Number)
+        if stop is None:
+            start, stop = Number(0), start
+        assert isinstance(stop, Number)
+        if step is None:
+            step_value = 1
+        else:
+            assert isinstance(step, Number)
+            step_value = step.value
+            if step_value == 0:
+                assert step.pos_start is not None
+                assert step.pos_end is not None
+                return RTResult().failure(RunTimeError(
+                    step.pos_start, step.pos_end, "the step of a range can not be 0.",
+                    self.context, origin_file="src.runtime.values.functions.builtin_function.BuiltInFunction."
+                                              "execute_range"
+                ))
+        return RTResult().success(Range(start.value, stop.value, step_value))
+
+    builtin_functions["range"] = {
+        "function": execute_range,
+        "param_names": ["start"],
+        "optional_params": ["stop", "step"],
+        "should_respect_args_number": True,
+        "run_noug_dir_work_dir": False,
+        "noug_dir": False,
+        "fast_call": True
+    }
+
+    def _check_sets(self, set_1: Value, set_2: Value, func_name: str) -> RTResult | None:
+        """Return a failed result if one of the arguments of 'func_name' is not a set"""
+        assert self.context is not None
+        for arg_num, set_ in (("first", set_1), ("second", set_2)):
+            if not isinstance(set_, Set):
+                assert set_.pos_start is not None
+                assert set_.pos_end is not None
+                return RTResult().failure(RTTypeErrorF(
+                    set_.pos_start, set_.pos_end, arg_num, func_name, "set", set_,
+                    self.context, f"src.runtime.values.functions.builtin_function.BuiltInFunction.execute_{func_name}"
+                ))
+        return None
+
+    def execute_union(self, set_1: Value, set_2: Value):
+        """Returns a new set with the elements of both sets"""
+        # Params:
+        # * set_1
+        # * set_2
+        error = self._check_sets(set_1, set_2, "union")
+        if error is not None:
+            return error
+        assert isinstance(set_1, Set) and isinstance(set_2, Set)
+        return RTResult().success(set_1.union(set_2))
+
+    builtin_functions["union"] = {
+        "function": execute_union,
+        "param_names": ["set_1", "set_2"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir_work_dir": False,
+        "noug_dir": False,
+        "fast_call": True
+    }
+
+    def execute_intersection(self, set_1: Value, set_2: Value):
+        """Returns a new set with the elements that are in both sets"""
+        # Params:
+        # * set_1
+        # * set_2
+        error = self._check_sets(set_1, set_2, "intersection")
+        if error is not None:
+            return error
+        assert isinstance(set_1, Set) and isinstance(set_2, Set)
+        return RTResult().success(set_1.intersection(set_2))
+
+    builtin_functions["intersection"] = {
+        "function": execute_intersection,
+        "param_names": ["set_1", "set_2"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir_work_dir": False,
+        "noug_dir": False,
+        "fast_call": True
+    }
+
+    def execute_difference(self, set_1: Value, set_2: Value):
+        """Returns a new set with the elements of the first set that are not in the second one"""
+        # Params:
+        # * set_1
+        # * set_2
+        error = self._check_sets(set_1, set_2, "difference")
+        if error is not None:
+            return error
+        assert isinstance(set_1, Set) and isinstance(set_2, Set)
+        return RTResult().success(set_1.difference(set_2))
+
+    builtin_functions["difference"] = {
+        "function": execute_difference,
+        "param_names": ["set_1", "set_2"],
+        "optional_params": [],
+        "should_respect_args_number": True,
+        "run_noug_dir_work_dir": False,
+        "noug_dir": False,
+        "fast_call": True
     }
 
     def execute_rickroll(self):
@@ -1357,6 +2080,7 @@ class BuiltInFunction(BaseBuiltInFunction):
             ))
 
         try:  # we execute the command
+            sys.stdout.flush()  # the output of the command must come after what was printed before
             to_return_value = os_system(str(cmd.value))
             return RTResult().success(String(str(to_return_value)))
         except Exception as e:
@@ -1377,19 +2101,18 @@ class BuiltInFunction(BaseBuiltInFunction):
         "noug_dir": False
     }
 
-    def execute_lower(self, exec_ctx: Context):
+    def execute_lower(self, value: Value):
         """Return lower-cased string. e.g. lower('NOUGARO') returns 'nougaro'."""
         # Params :
         # * value
-        assert exec_ctx.symbol_table is not None
-        value = exec_ctx.symbol_table.getf("value")  # we get the value
+        assert self.context is not None
         if not isinstance(value, String):  # we check if it is a string
             assert value is not None
             assert value.pos_start is not None
             assert value.pos_end is not None
             return RTResult().failure(RTTypeErrorF(
                 value.pos_start, value.pos_end, "first", "lower", "str", value,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_lower"
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_lower"
             ))
         return RTResult().success(String(value.value.lower()))  # we return the lower str
 
@@ -1399,22 +2122,22 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
-    def execute_upper(self, exec_ctx: Context):
+    def execute_upper(self, value: Value):
         """Return upper-cased string. e.g. upper('nougaro') returns 'NOUGARO'."""
         # Params :
         # * value
-        assert exec_ctx.symbol_table is not None
-        value = exec_ctx.symbol_table.getf("value")  # we get the value
+        assert self.context is not None
         if not isinstance(value, String):  # we check if it is a string
             assert value is not None
             assert value.pos_start is not None
             assert value.pos_end is not None
             return RTResult().failure(RTTypeErrorF(
                 value.pos_start, value.pos_end, "first", "upper", "str", value,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_upper"
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_upper"
             ))
         return RTResult().success(String(value.value.upper()))  # we return the upper str
 
@@ -1424,7 +2147,8 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
     def execute_nougaro(self, exec_ctx: Context):
@@ -1513,6 +2237,7 @@ class BuiltInFunction(BaseBuiltInFunction):
             # tested on Windows, Linux
             import platform
             system = platform.system()
+            sys.stdout.flush()  # the command may write in the terminal
             if system == "Darwin":  # macOS
                 subprocess.run(('open', os.path.abspath(noug_dir + "/LICENSE")))
             elif system == 'Windows':  # Windows
@@ -1640,12 +2365,11 @@ class BuiltInFunction(BaseBuiltInFunction):
         "noug_dir": False
     }
 
-    def execute_ord(self, exec_ctx: Context):
+    def execute_ord(self, chr_: Value):
         """like python ord"""
         # params:
         # * chr
-        assert exec_ctx.symbol_table is not None
-        chr_ = exec_ctx.symbol_table.getf("chr")  # we get the char
+        assert self.context is not None
 
         if not isinstance(chr_, String):  # we check if it is a string
             assert chr_ is not None
@@ -1653,7 +2377,7 @@ class BuiltInFunction(BaseBuiltInFunction):
             assert chr_.pos_end is not None
             return RTResult().failure(RTTypeErrorF(
                 chr_.pos_start, chr_.pos_end, "first", "ord", "str", chr_,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_ord"
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_ord"
             ))
 
         if len(chr_.value) != 1:
@@ -1662,7 +2386,7 @@ class BuiltInFunction(BaseBuiltInFunction):
             return RTResult().failure(RTTypeError(
                 chr_.pos_start, chr_.pos_end,
                 f"ord() expected a character, but string of length {len(chr_.value)} found.",
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_ord"
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_ord"
             ))
 
         try:
@@ -1673,7 +2397,8 @@ class BuiltInFunction(BaseBuiltInFunction):
             return RTResult().failure(RunTimeError(
                 self.pos_start, self.pos_end,
                 f'Python error: {e.__class__.__name__}: {e}',
-                exec_ctx, origin_file="src.runtime.values.functions.builtin_function.BuiltInFunction.execute_ord"
+                self.context,
+                origin_file="src.runtime.values.functions.builtin_function.BuiltInFunction.execute_ord"
             ))
 
     builtin_functions["ord"] = {
@@ -1682,15 +2407,15 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
-    def execute_chr(self, exec_ctx: Context):
+    def execute_chr(self, ord_: Value):
         """like python chr"""
         # params:
         # * ord
-        assert exec_ctx.symbol_table is not None
-        ord_ = exec_ctx.symbol_table.getf("ord")  # we get the char
+        assert self.context is not None
 
         assert ord_ is not None
         assert ord_.pos_start is not None
@@ -1698,14 +2423,14 @@ class BuiltInFunction(BaseBuiltInFunction):
         if not isinstance(ord_, Number):  # we check if it is a string
             return RTResult().failure(RTTypeErrorF(
                 ord_.pos_start, ord_.pos_end, "first", "chr", "int", ord_,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_chr"
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_chr"
             ))
 
         if not isinstance(ord_.value, int):
             return RTResult().failure(RTTypeError(
                 ord_.pos_start, ord_.pos_end,
                 f"first argument of builtin function 'chr' must be an int.",
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_chr"
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_chr"
             ))
 
         try:
@@ -1716,7 +2441,8 @@ class BuiltInFunction(BaseBuiltInFunction):
             return RTResult().failure(RunTimeError(
                 self.pos_start, self.pos_end,
                 f'Python error: {e.__class__.__name__}: {e}',
-                exec_ctx, origin_file="src.runtime.values.functions.builtin_function.BuiltInFunction.execute_chr"
+                self.context,
+                origin_file="src.runtime.values.functions.builtin_function.BuiltInFunction.execute_chr"
             ))
 
     builtin_functions["chr"] = {
@@ -1725,7 +2451,8 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
     def execute___how_many_lines_of_code__(self, exec_ctx: Context, noug_dir: str):
@@ -1825,31 +2552,92 @@ class BuiltInFunction(BaseBuiltInFunction):
         "noug_dir": False
     }
     
-    def execute_sort(self, exec_ctx: Context):
-        """Like python’s sort()"""
-        assert exec_ctx.symbol_table is not None
+    def _sorted_elements(self, caller: FunctionCaller, elements: list[Value], key: Value | None, reverse: bool,
+                         iterable: Value) -> tuple[list[Value], None] | tuple[None, RTResult]:
+        """Sort the elements like python’s sorted(). The key function is called exactly once per element, then the
+        elements are sorted by their keys (decorate-sort-undecorate)."""
+        assert self.context is not None
+        if key is None:
+            keys = elements
+        else:
+            call = caller.repeated(key)
+            keys: list[Value] = []
+            for element in elements:
+                result = call([self._with_pos(element, iterable)])
+                if result.should_return():  # we stop at the first error
+                    return None, result
+                assert result.value is not None
+                keys.append(result.value)
+
+        try:
+            if all(isinstance(key_, Number) for key_ in keys) or all(isinstance(key_, String) for key_ in keys):
+                python_keys = [key_.value for key_ in keys]  # native path: python compares the numbers or the strs
+            else:  # e.g. lists of lists
+                python_keys = [noug2py(key_, False) for key_ in keys]
+            order = sorted(range(len(elements)), key=python_keys.__getitem__, reverse=reverse)
+        except TypeError:
+            assert iterable.pos_start is not None
+            assert iterable.pos_end is not None
+            types = sorted({key_.type_ for key_ in keys})
+            return None, RTResult().failure(RTTypeError(
+                iterable.pos_start, iterable.pos_end,
+                f"can not compare the {'keys' if key is not None else 'elements'} to sort them "
+                f"(found {', '.join(types)}).",
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction._sorted_elements"
+            ))
+        return [elements[index] for index in order], None
+
+    def execute_sort(self, caller: FunctionCaller, list_: Value, mode: Value | None = None,
+                     reverse: Value | None = None):
+        """Like python’s sort(): sorts the list in place, then returns it. The second argument is either the mode or a
+        key function"""
+        # Params:
+        # * list_
+        # Optional params:
+        # * mode (or key)
+        # * reverse
+        assert self.context is not None
         result = RTResult()
-        list_ = exec_ctx.symbol_table.getf("list_")
-        mode = exec_ctx.symbol_table.getf("mode")
-        
+
         if not isinstance(list_, List):
-            assert list_ is not None
             assert list_.pos_start is not None
             assert list_.pos_end is not None
             return result.failure(RTTypeErrorF(
                 list_.pos_start, list_.pos_end, "first", "sort", "list", list_,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_sort"
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_sort"
             ))
-        if mode is None:
+        key = None
+        if mode is None or isinstance(mode, NoneValue):
             mode = String("timsort").set_pos(self.pos_start, self.pos_end)
+        elif isinstance(mode, BaseFunction):
+            key = mode
+            mode = String("timsort").set_pos(mode.pos_start, mode.pos_end)
         if not isinstance(mode, String):
             assert mode.pos_start is not None
             assert mode.pos_end is not None
             return result.failure(RTTypeErrorF(
                 mode.pos_start, mode.pos_end, "second", "sort", "str", mode,
-                exec_ctx, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_sort"
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_sort",
+                or_="function"
             ))
-        
+        if reverse is None:
+            reverse = FALSE.copy()
+        if not isinstance(reverse, Number):
+            assert reverse.pos_start is not None
+            assert reverse.pos_end is not None
+            return result.failure(RTTypeErrorF(
+                reverse.pos_start, reverse.pos_end, "third", "sort", "number", reverse,
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_sort"
+            ))
+        if reverse.is_true() and mode.value != "timsort":
+            assert reverse.pos_start is not None
+            assert reverse.pos_end is not None
+            return result.failure(RunTimeError(
+                reverse.pos_start, reverse.pos_end,
+                "the list can only be sorted in reverse order with the 'timsort' mode.",
+                self.context, origin_file="src.runtime.values.function.builtin_function.BuiltInFunction.execute_sort"
+            ))
+
         def get_comparison_gt(list_to_sort_: list[Value], index_: int) -> tuple[Number, None] | tuple[None, RunTimeError]:
             if index_ + 1 < len(list_to_sort_):
                 comp, error_ = list_to_sort_[index_].get_comparison_gt(list_to_sort_[index_ + 1])
@@ -1877,16 +2665,13 @@ class BuiltInFunction(BaseBuiltInFunction):
         mode = mode_noug.value
         list_to_sort: list[Value] = list_.elements
         if mode == "timsort":  # default python sort algorithm
-            try:
-                sorted_ = sorted(list_to_sort, key=lambda val: noug2py(val, False))
-            except TypeError as e:
-                assert list_.pos_start is not None
-                assert list_.pos_end is not None
-                return result.failure(RTTypeError(
-                    list_.pos_start, list_.pos_end,
-                    str(e), exec_ctx,
-                    origin_file="src.runtime.values.function.builtin_function.BuiltInFunction.execute_sort"
-                ))
+            sorted_, error_result = self._sorted_elements(caller, list_to_sort, key, reverse.is_true(), list_)
+            if error_result is not None:
+                return error_result
+            assert sorted_ is not None
+            list_to_sort[:] = sorted_
+            list_.update_should_print()
+            return result.success(list_)
         elif mode == "stalin":  # stalin sort
             for i in range(len(list_to_sort)):
                 if i == len(list_to_sort):
@@ -1920,7 +2705,7 @@ class BuiltInFunction(BaseBuiltInFunction):
                     return result.failure(RTTypeError(
                         i.pos_start, i.pos_end, 
                         f"sleep mode: expected list of int, but found {i.type_} inside the list.",
-                        exec_ctx,
+                        self.context,
                         origin_file="src.runtime.values.function.builtin_function.BuiltInFunction.execute_sort"
                     ))
                 if i.value < 0:
@@ -1928,7 +2713,7 @@ class BuiltInFunction(BaseBuiltInFunction):
                         i.pos_start, i.pos_end,
                         f"sleep mode: expected list of positive integers, but found negative integer {i.value} inside "
                         f"the list.",
-                        exec_ctx,
+                        self.context,
                         origin_file="src.runtime.values.function.builtin_function.BuiltInFunction.execute_sort"
 
                     ))
@@ -1965,7 +2750,7 @@ class BuiltInFunction(BaseBuiltInFunction):
                 "\t* 'stalin',\n"
                 "\t* 'sleep',\n"
                 "\t* 'miracle'.",
-                exec_ctx, origin_file="src.runtime.values.function.builtin_function.BuiltInFunction.execute_sort"
+                self.context, origin_file="src.runtime.values.function.builtin_function.BuiltInFunction.execute_sort"
             ))
         
         return result.success(List(sorted_))
@@ -1973,10 +2758,70 @@ class BuiltInFunction(BaseBuiltInFunction):
     builtin_functions["sort"] = {
         "function": execute_sort,
         "param_names": ["list_"],
-        "optional_params": ["mode"],
+        "optional_params": ["mode", "reverse"],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True,
+        "calls_functions": True
+    }
+
+    def execute_sorted(self, caller: FunctionCaller, iterable: Value, key: Value | None = None,
+                       reverse: Value | None = None):
+        """Like python’s sorted(): returns a new sorted list made from the elements of the iterable"""
+        # Params:
+        # * iterable
+        # Optional params:
+        # * key
+        # * reverse
+        assert self.context is not None
+        if isinstance(key, NoneValue):
+            key = None
+        if key is not None and not isinstance(key, BaseFunction):
+            assert key.pos_start is not None
+            assert key.pos_end is not None
+            return RTResult().failure(RTTypeErrorF(
+                key.pos_start, key.pos_end, "second", "sorted", "function", key,
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_sorted",
+                or_="None"
+            ))
+        if reverse is None:
+            reverse = FALSE.copy()
+        if not isinstance(reverse, Number):
+            assert reverse.pos_start is not None
+            assert reverse.pos_end is not None
+            return RTResult().failure(RTTypeErrorF(
+                reverse.pos_start, reverse.pos_end, "third", "sorted", "number", reverse,
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_sorted"
+            ))
+        elements_iterator = iterable.iter_()
+        if elements_iterator is None:
+            assert iterable.pos_start is not None
+            assert iterable.pos_end is not None
+            return RTResult().failure(RTTypeErrorF(
+                iterable.pos_start, iterable.pos_end, "first", "sorted", "list", iterable,
+                self.context, "src.runtime.values.functions.builtin_function.BuiltInFunction.execute_sorted"
+            ))
+        try:
+            elements = list(elements_iterator)
+        except IterationError as e:  # e.g. an error in the body of a generator
+            return RTResult().failure(e.error)
+
+        sorted_, error_result = self._sorted_elements(caller, elements, key, reverse.is_true(), iterable)
+        if error_result is not None:
+            return error_result
+        assert sorted_ is not None
+        return RTResult().success(List(sorted_))
+
+    builtin_functions["sorted"] = {
+        "function": execute_sorted,
+        "param_names": ["iterable"],
+        "optional_params": ["key", "reverse"],
+        "should_respect_args_number": True,
+        "run_noug_dir_work_dir": False,
+        "noug_dir": False,
+        "fast_call": True,
+        "calls_functions": True
     }
 
     def execute_reverse(self, exec_ctx: Context):
@@ -2012,10 +2857,9 @@ class BuiltInFunction(BaseBuiltInFunction):
         "noug_dir": False
     }
 
-    def execute_startswith(self, exec_ctx: Context):
+    def execute_startswith(self, str_: Value, startswith: Value):
         """Check if a str starts with some other str"""
-        assert exec_ctx.symbol_table is not None
-        str_ = exec_ctx.symbol_table.getf("str_")
+        assert self.context is not None
         if not isinstance(str_, String):
             assert str_ is not None
             assert str_.pos_start is not None
@@ -2023,11 +2867,10 @@ class BuiltInFunction(BaseBuiltInFunction):
             return RTResult().failure(RTTypeErrorF(
                 str_.pos_start, str_.pos_end,
                 "first", "startswith", "str", str_,
-                exec_ctx,
+                self.context,
                 origin_file="src.runtime.values.function.builtin_function.BuiltInFunction.execute_startswith"
             ))
 
-        startswith = exec_ctx.symbol_table.getf("startswith")
         if not isinstance(startswith, String):
             assert startswith is not None
             assert startswith.pos_start is not None
@@ -2035,7 +2878,7 @@ class BuiltInFunction(BaseBuiltInFunction):
             return RTResult().failure(RTTypeErrorF(
                 startswith.pos_start, startswith.pos_end,
                 "second", "startswith", "str", startswith,
-                exec_ctx,
+                self.context,
                 origin_file="src.runtime.values.function.builtin_function.BuiltInFunction.execute_startswith"
             ))
 
@@ -2047,13 +2890,13 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
-    def execute_endswith(self, exec_ctx: Context):
+    def execute_endswith(self, str_: Value, endswith: Value):
         """Check if a str ends with some other str"""
-        assert exec_ctx.symbol_table is not None
-        str_ = exec_ctx.symbol_table.getf("str_")
+        assert self.context is not None
         if not isinstance(str_, String):
             assert str_ is not None
             assert str_.pos_start is not None
@@ -2061,11 +2904,10 @@ class BuiltInFunction(BaseBuiltInFunction):
             return RTResult().failure(RTTypeErrorF(
                 str_.pos_start, str_.pos_end,
                 "first", "endswith", "str", str_,
-                exec_ctx,
+                self.context,
                 origin_file="src.runtime.values.function.builtin_function.BuiltInFunction.execute_endswith"
             ))
 
-        endswith = exec_ctx.symbol_table.getf("endswith")
         if not isinstance(endswith, String):
             assert endswith is not None
             assert endswith.pos_start is not None
@@ -2073,7 +2915,7 @@ class BuiltInFunction(BaseBuiltInFunction):
             return RTResult().failure(RTTypeErrorF(
                 endswith.pos_start, endswith.pos_end,
                 "second", "endswith", "str", endswith,
-                exec_ctx,
+                self.context,
                 origin_file="src.runtime.values.function.builtin_function.BuiltInFunction.execute_endswith"
             ))
 
@@ -2085,7 +2927,8 @@ class BuiltInFunction(BaseBuiltInFunction):
         "optional_params": [],
         "should_respect_args_number": True,
         "run_noug_dir_work_dir": False,
-        "noug_dir": False
+        "noug_dir": False,
+        "fast_call": True
     }
 
     def execute___python__(self, exec_ctx: Context) -> RTResult:
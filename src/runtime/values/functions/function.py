@@ -11,15 +11,16 @@
 # __future__ import (must be first)
 from __future__ import annotations
 # nougaro modules imports
-from src.parser.nodes import Node
+from src.parser.nodes import Node, FuncDefNode, ClassNode, contains_node
 from src.runtime.values.functions.base_function import BaseFunction
 from src.runtime.values.basevalues.value import Value
 from src.runtime.values.basevalues.basevalues import NoneValue, String, List
+from src.runtime.values.functions.generator import Generator, GeneratorChannel
 from src.runtime.runtime_result import RTResult
 from src.runtime.context import Context
 from src.misc import nice_str_from_idk, RunFunction
 # built-in python imports
-# no imports
+from typing import Callable
 # special typing imports
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -28,12 +29,14 @@ if TYPE_CHECKING:
 
 class Function(BaseFunction):
     def __init__(self, name: str | None, body_node: Node, param_names: list[str], should_auto_return: bool,
-                 call_with_module_context: bool = False):
+                 call_with_module_context: bool = False, is_generator: bool = False):
         super().__init__(name, call_with_module_context)
         self.body_node = body_node
         self.param_names = param_names
         self.should_auto_return = should_auto_return
+        self.is_generator = is_generator  # there is a `yield` in the body: calling the function returns a generator
         self.type_ = "func"
+        self.frame_reusable: bool | None = None  # cache of self.can_reuse_frame()
 
     def __repr__(self):
         return f'<function {self.name}>'
@@ -72,6 +75,22 @@ class Function(BaseFunction):
         if result.should_return():
             return result
 
+        if self.is_generator:  # the body is executed later, when the elements of the generator are asked
+            def run_body(channel: GeneratorChannel) -> RTResult:
+                exec_context.generator_channel = channel
+                return interpreter.visit(self.body_node, exec_context, methods_instead_of_funcs=False)
+            return result.success(Generator(self.name, run_body).set_context(exec_context))
+
+        result = self._run_body(interpreter, exec_context, result)
+        if self.can_reuse_frame():
+            # nothing can use the variables of the call anymore. The values often refer to exec_context, so removing
+            # them breaks the reference cycles: they are freed now (e.g. open files are closed) instead of at the next
+            # garbage collection
+            exec_context.symbol_table.symbols.clear()
+        return result
+
+    def _run_body(self, interpreter: Interpreter, exec_context: Context, result: RTResult) -> RTResult:
+        """Run the body node in the context (where the arguments are already set) and return the returned value"""
         # run the body node with the interpreter and check for errors
         value = result.register(interpreter.visit(self.body_node, exec_context, methods_instead_of_funcs=False))
         if result.should_return() and result.function_return_value is None:
@@ -89,11 +108,52 @@ class Function(BaseFunction):
         return_value = (value if self.should_auto_return else None) or result.function_return_value or NoneValue(False)
         return result.success(return_value)
 
+    def can_reuse_frame(self) -> bool:
+        """Return True if one context (frame) can be used for several calls of self (see frame_caller): nothing made
+        by a call (a function, a class or a generator) can keep its context after the call."""
+        if self.frame_reusable is None:
+            self.frame_reusable = not self.is_generator and not contains_node(self.body_node, (FuncDefNode, ClassNode))
+        return self.frame_reusable
+
+    def frame_caller(self, interpreter_: type[Interpreter], run: RunFunction, noug_dir: str,
+                     exec_from: str = "<invalid>", use_context: Context | None = None,
+                     cli_args: list[String] | None = None,
+                     work_dir: str | None = None) -> Callable[[list[Value]], RTResult]:
+        """Return a python function that calls self with the given arguments, like self.execute. All the calls share
+        the same interpreter and the same context, whose symbol table is reset before each call: it is much faster
+        when self is called for each element of a list (see the `map` built-in function).
+        Use it only if self.can_reuse_frame()."""
+        if work_dir is None:
+            work_dir = noug_dir
+        if cli_args is None:
+            cli_args = []
+        interpreter = interpreter_(run, noug_dir, cli_args, work_dir)
+
+        if use_context is not None:
+            self.context = use_context
+        exec_context = self.generate_new_context(True)
+        symbol_table = exec_context.symbol_table
+        assert symbol_table is not None
+        symbol_table.set("__exec_from__", String(exec_from))
+        symbol_table.set("__actual_context__", String(self.name))
+        symbol_table.set("__args__", List(list(map(nice_str_from_idk, cli_args))))
+        initial_symbols = symbol_table.symbols.copy()
+
+        def call(args: list[Value]) -> RTResult:
+            symbol_table.set_whole_table(initial_symbols)  # the variables of the previous call are removed
+            result = RTResult()
+            result.register(self.check_and_populate_args(self.param_names, args, exec_context))
+            if result.should_return():
+                return result
+            return self._run_body(interpreter, exec_context, result)
+        return call
+
     def copy(self):
         """Return a copy of self"""
         copy = Function(self.name, self.body_node, self.param_names, self.should_auto_return,
-                        self.call_with_module_context)
+                        self.call_with_module_context, self.is_generator)
         copy.module_context = self.module_context
+        copy.frame_reusable = self.frame_reusable
         copy.set_context(self.context)
         copy.set_pos(self.pos_start, self.pos_end)
         copy.attributes = self.attributes.copy()
@@ -103,8 +163,8 @@ class Function(BaseFunction):
 class Method(Function):
     """Parent class for methods (functions in classes)"""
     def __init__(self, name: str | None, body_node: Node, param_names: list[str], should_auto_return: bool,
-                 call_with_module_context: bool = False):
-        super().__init__(name, body_node, param_names, should_auto_return, call_with_module_context)
+                 call_with_module_context: bool = False, is_generator: bool = False):
+        super().__init__(name, body_node, param_names, should_auto_return, call_with_module_context, is_generator)
         self.type_ = "method"
         self.object_: Value | None = None
 
@@ -114,9 +174,10 @@ class Method(Function):
     def copy(self):
         """Return a copy of self"""
         copy = Method(self.name, self.body_node, self.param_names, self.should_auto_return,
-                      self.call_with_module_context)
+                      self.call_with_module_context, self.is_generator)
         copy.object_ = self.object_
         copy.module_context = self.module_context
+        copy.frame_reusable = self.frame_reusable
         copy.set_context(self.context)
         copy.set_pos(self.pos_start, self.pos_end)
         copy.attributes = self.attributes.copy()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# __future__ import (must be first)
+from __future__ import annotations
+# nougaro modules imports
+from src.runtime.values.basevalues.value import Value
+from src.runtime.values.functions.base_function import BaseFunction
+from src.runtime.values.functions.function import Function, Method
+from src.runtime.runtime_result import RTResult
+from src.runtime.context import Context
+from src.runtime.symbol_table import SymbolTable
+from src.misc import RunFunction
+# built-in python imports
+from typing import Callable
+# special typing imports
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.runtime.values.basevalues.basevalues import String
+    from src.runtime.interpreter import Interpreter
+
+
+class FunctionCaller:
+    """Calls nougaro values (functions, built-in functions, methods) from python. Given to the built-in functions that
+    declare `"calls_functions": True`, such as `map`."""
+    def __init__(self, interpreter_: type[Interpreter], run: RunFunction, noug_dir: str, exec_from: str = "<invalid>",
+                 cli_args: list[String] | None = None, work_dir: str | None = None):
+        self.interpreter_ = interpreter_
+        self.run = run
+        self.noug_dir = noug_dir
+        self.exec_from = exec_from
+        self.cli_args = cli_args
+        self.work_dir = work_dir
+
+    def __repr__(self):
+        return f"<FunctionCaller (from {self.exec_from})>"
+
+    @staticmethod
+    def _use_context(function: BaseFunction) -> Context | None:
+        """The context given to function.execute, like in Interpreter.visit_CallNode"""
+        if function.call_with_module_context:
+            return function.module_context
+        if isinstance(function, Method):  # `this` is defined in a new context
+            assert function.object_ is not None
+            context = Context(function.name, function.context, function.pos_start)
+            parent_symbol_table = function.context.symbol_table if function.context is not None else None
+            context.symbol_table = SymbolTable(parent_symbol_table)
+            context.symbol_table.set("this", function.object_)
+            return context
+        return None
+
+    def call(self, function: BaseFunction, args: list[Value]) -> RTResult:
+        """Call the function once"""
+        return function.execute(
+            args, self.interpreter_, self.run, self.noug_dir, exec_from=self.exec_from,
+            use_context=self._use_context(function), cli_args=self.cli_args, work_dir=self.work_dir
+        )
+
+    def repeated(self, function: BaseFunction) -> Callable[[list[Value]], RTResult]:
+        """Return a python function to call the function many times (e.g. once per element of a list). If possible, all
+        the calls use the same context instead of making a new one each time (see Function.frame_caller)."""
+        if isinstance(function, Function) and function.can_reuse_frame():
+            return function.frame_caller(
+                self.interpreter_, self.run, self.noug_dir, exec_from=self.exec_from,
+                use_context=self._use_context(function), cli_args=self.cli_args, work_dir=self.work_dir
+            )
+        return lambda args: self.call(function, args)
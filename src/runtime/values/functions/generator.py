@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# The interpreter is recursive, so the body of a generator can not be paused in the middle of a visit. Instead, it is
+# executed in its own python thread, and the thread that consumes the generator and the one that executes its body
+# take turns: the body runs until the next `yield`, then waits until the next element is asked.
+
+# IMPORTS
+# __future__ import (must be first)
+from __future__ import annotations
+# nougaro modules imports
+from src.runtime.values.basevalues.value import Value
+from src.runtime.values.basevalues.basevalues import String, List
+from src.runtime.values.number_constants import FALSE, TRUE
+from src.runtime.runtime_result import RTResult
+from src.errors.errors import IterationError
+# built-in python imports
+import threading
+from typing import Callable, Iterator
+# special typing import
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.errors.errors import Error
+
+
+# ##########
+# GENERATOR CHANNEL
+# ##########
+class GeneratorChannel:
+    """Passes the yielded values from the thread of the body to the consumer. Only one of them runs at a time."""
+    def __init__(self, name: str | None, run_body: Callable[[GeneratorChannel], RTResult]):
+        self.name = name
+        self.run_body = run_body
+        self.thread: threading.Thread | None = None
+        self.resume = threading.Semaphore(0)  # released by the consumer when it wants the next value
+        self.pause = threading.Semaphore(0)  # released by the body when it yields a value or ends
+
+        self.value: Value | None = None  # the last yielded value
+        self.error: Error | None = None  # the error of the body, if any
+        self.exception: BaseException | None = None  # python exception (e.g. internal error) in the body
+        self.finished = False
+        self.closed = False
+
+    def __repr__(self) -> str:
+        return f"<GeneratorChannel of {self.name} (finished={self.finished})>"
+
+    def next_(self) -> tuple[Value, None] | tuple[None, Error] | tuple[None, None]:
+        """Run the body until the next `yield`. Return (None, None) when the body is finished."""
+        if self.finished:
+            return None, None
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name=f"nougaro generator {self.name}", daemon=True)
+            self.thread.start()
+        else:
+            self.resume.release()
+        self.pause.acquire()
+
+        if self.exception is not None:
+            exception, self.exception = self.exception, None
+            raise exception
+        if self.finished:
+            error, self.error = self.error, None
+            return None, error
+        value, self.value = self.value, None
+        assert value is not None
+        return value, None
+
+    def yield_(self, value: Value) -> bool:
+        """Called by the body: give the value to the consumer then wait until the next one is asked.
+        Return False if the generator was closed in the meantime: the body should stop."""
+        self.value = value
+        self.pause.release()
+        self.resume.acquire()
+        return not self.closed
+
+    def close(self):
+        """Stop the body if it is waiting in a `yield`"""
+        if self.thread is not None and not self.finished and not self.closed:
+            self.closed = True
+            self.resume.release()
+
+    def _run(self):
+        try:
+            result = self.run_body(self)
+            if result.error is not None and not self.closed:
+                self.error = result.error
+        except BaseException as e:
+            self.exception = e
+        finally:
+            self.finished = True
+            self.pause.release()
+
+
+class _ChannelOwner:
+    """Shared by all the copies of a Generator: when the last copy is deleted, the body is stopped. The thread of the
+    body only knows the channel, so that it does not keep the generator alive."""
+    def __init__(self, channel: GeneratorChannel):
+        self.channel = channel
+
+    def __del__(self):
+        self.channel.close()
+
+
+# ##########
+# GENERATOR
+# ##########
+class Generator(Value):
+    """Value returned by the call of a function that contains `yield`. The values are made one by one, when they are
+    asked (by a `for` loop, `list()`, ...). Like in python, a generator can only be iterated once."""
+    def __init__(self, name: str | None, run_body: Callable[[GeneratorChannel], RTResult] | None = None,
+                 owner: _ChannelOwner | None = None):
+        super().__init__()
+        self.name = name if name is not None else "(anonymous)"
+        if owner is None:
+            assert run_body is not None
+            owner = _ChannelOwner(GeneratorChannel(self.name, run_body))
+        self.owner = owner
+        self.type_ = "generator"
+
+    def __repr__(self):
+        return f'<generator {self.name}>'
+
+    def to_python_str(self) -> str:
+        return self.__repr__()
+
+    def iter_(self) -> Iterator[Value]:
+        channel = self.owner.channel
+        while True:
+            value, error = channel.next_()
+            if error is not None:
+                raise IterationError(error)
+            if value is None:
+                return
+            yield value
+
+    def to_str_(self):
+        return String(self.__repr__()).set_context(self.context), None
+
+    def to_list_(self):
+        channel = self.owner.channel
+        elements: list[Value] = []
+        while True:
+            value, error = channel.next_()
+            if error is not None:
+                return None, RTResult().failure(error)
+            if value is None:
+                return List(elements).set_context(self.context), None
+            elements.append(value)
+
+    def is_eq(self, other: Value):
+        return isinstance(other, Generator) and self.owner is other.owner
+
+    def get_comparison_eq(self, other: Value):
+        if self.is_eq(other):
+            return TRUE.copy().set_context(self.context), None
+        return FALSE.copy().set_context(self.context), None
+
+    def get_comparison_ne(self, other: Value):
+        if self.is_eq(other):
+            return FALSE.copy().set_context(self.context), None
+        return TRUE.copy().set_context(self.context), None
+
+    def is_true(self):
+        return True
+
+    def copy(self):
+        """Return a copy of self. The copies share the same body: iterating one of them also advances the others"""
+        copy = Generator(self.name, owner=self.owner)
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        copy.module_context = self.module_context
+        copy.attributes = self.attributes.copy()
+        return copy
+
+    def __copy__(self):
+        return self.copy()
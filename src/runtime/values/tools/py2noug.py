@@ -13,13 +13,14 @@ from src.misc import is_num
 from src.runtime.values.basevalues.basevalues import *
 # built-in python imports
 from typing import Any
+import array
 
 
 # This next line should be uncommented when the project (fully) switches to python 3.12, and the type of the "value"
 # argument in the "py2noug" function should be defined as "val"
 # (todo)
 # type val = Value | str | int | float | bool | list[val] | dict[val, val] | None
-def py2noug(value: Value | str | int | float | bool | list[Any] | dict[Any, Any] | None) -> Value:
+def py2noug(value: Value | str | int | float | bool | list[Any] | dict[Any, Any] | array.array | None) -> Value:
     """Converts python values to nougaro ones"""
     if isinstance(value, Value):
         return value
@@ -35,26 +36,28 @@ def py2noug(value: Value | str | int | float | bool | list[Any] | dict[Any, Any]
         list_ = list(value)  # we want a list instead of a tuple
         list_ = list(map(py2noug, list_))  # todo: when project fully switches to 3.12 remove this: # type: ignore
         return List(list_)
+    elif isinstance(value, array.array):  # not copied
+        return Array(value)
     elif isinstance(value, dict):
-        list_ = list(value.items())
-        list_ = list(map(py2noug, list_))  # todo: when project fully switches to 3.12 remove this: # type: ignore
-        return List(list_)
+        dict_ = Dict()
+        for key, element in value.items():
+            if not dict_.set(py2noug(key), py2noug(element)):
+                # the key can not be a nougaro key (e.g. a tuple): we fall back to a list of [key, value] lists
+                list_ = list(value.items())
+                list_ = list(map(py2noug, list_))  # todo: when project fully switches to 3.12 remove this: # type: ignore
+                return List(list_)
+        return dict_
     elif value is None:
         return NoneValue()
     else:
         return Value()  # we just return a base value if there is no equivalent...
 
 
-# todo: move this to unittests
-test_, err = py2noug(
-    {"a": ["b", 12], 13: "c"}
-).get_comparison_eq(
-    List([
-        List([String("a"), List([String("b"), Number(12)])]),
-        List([Number(13), String("c")])
-    ]))
-assert test_ is not None
-assert test_.is_true()
+def _hashable(value: Any) -> Any:
+    """Lists (that can be nougaro keys) become tuples, so that they can be python keys"""
+    if isinstance(value, list):
+        return tuple(map(_hashable, value))
+    return value
 
 
 def noug2py(value: Value, none_instead_of_raw_value: bool = True) -> Any:
@@ -63,6 +66,10 @@ def noug2py(value: Value, none_instead_of_raw_value: bool = True) -> Any:
         return value.value
     elif isinstance(value, List):
         return [noug2py(e) for e in value.elements]
+    elif isinstance(value, Array):  # not copied
+        return value.array_
+    elif isinstance(value, Dict):
+        return {_hashable(noug2py(key)): noug2py(element) for key, element in value.entries.values()}
     elif isinstance(value, NoneValue):
         return None
     else:
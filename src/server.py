@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# `shell.py --serve` and `shell.py --client file.noug`
+# The server imports everything once, then forks itself for each script it receives. The forked child runs the script
+# with a pre-warmed interpreter and streams its stdout and stderr back to the client, then its exit code.
+# Protocol: the client sends a JSON line {"file": ..., "text": ..., "args": [...], "cwd": ...}, then the server sends
+# frames made of a one-byte channel (o=stdout, e=stderr, x=exit code), a 4-byte big-endian length and the payload.
+
+# IMPORTS
+# nougaro modules imports
+# (imported in the functions, so that the client stays light: it does not need the interpreter)
+# built-in python imports
+import importlib
+import io
+import json
+import os
+import signal
+import socket
+import stat
+import struct
+import sys
+import tempfile
+from typing import Callable
+
+_HEADER = struct.Struct(">cI")
+
+
+def default_socket_path() -> str:
+    """Return the default path of the UNIX socket, one per user. It is in a directory that only the user can access
+    (made if needed), so that another user can not put their own socket in its place.
+    Raise OSError if this directory can not be made, or if it is not private."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR", "")
+    if runtime_dir != "":  # made by the system for this user only
+        return os.path.join(runtime_dir, "nougaro.sock")
+    if not hasattr(os, "getuid"):  # e.g. Windows, where the temporary directory is already per user
+        return os.path.join(tempfile.gettempdir(), "nougaro.sock")
+    directory = os.path.join(tempfile.gettempdir(), f"nougaro-{os.getuid()}")
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(directory)  # not os.stat: a symbolic link is not accepted
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077 != 0:
+        raise PermissionError(f"{directory} is not a directory that only the current user can access.")
+    return os.path.join(directory, "nougaro.sock")
+
+
+def _send_frame(connection: socket.socket, channel: bytes, payload: bytes):
+    connection.sendall(_HEADER.pack(channel, len(payload)) + payload)
+
+
+def _recv_exactly(connection: socket.socket, size: int) -> bytes | None:
+    """Receive exactly `size` bytes, or return None if the connection is closed before."""
+    data = b""
+    while len(data) < size:
+        chunk = connection.recv(size - len(data))
+        if chunk == b"":
+            return None
+        data += chunk
+    return data
+
+
+class _SocketStream(io.TextIOBase):
+    """A text stream that sends everything that is written to it to the client, in the given channel"""
+    def __init__(self, connection: socket.socket, channel: bytes):
+        self.connection = connection
+        self.channel = channel
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, text: str) -> int:
+        if text != "":
+            _send_frame(self.connection, self.channel, text.encode("UTF-8"))
+        return len(text)
+
+
+def _handle_request(connection: socket.socket, execute: Callable[[str, str, str, list[str]], None]):
+    """Run the script sent by the client. Called in the forked child."""
+    from src.output import ConsoleOutput
+    from src.misc import close_open_files
+    request_file = connection.makefile("rb")
+    request = json.loads(request_file.readline().decode("UTF-8"))
+    request_file.close()
+
+    sys.stdin = open(os.devnull)
+    stdout = ConsoleOutput(_SocketStream(connection, b"o"))  # one frame per buffer instead of one per print
+    sys.stdout = stdout
+    sys.stderr = _SocketStream(connection, b"e")
+    exit_code = 0
+    try:
+        os.chdir(request["cwd"])
+        execute(request["file"], request["text"], request["cwd"], request["args"])
+    except SystemExit as e:
+        if e.code is None:
+            exit_code = 0
+        elif isinstance(e.code, int):
+            exit_code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            exit_code = 1
+    except BaseException as e:  # never let the child go back in the server loop
+        print(f"[nougaro server] {e.__class__.__name__}: {e}", file=sys.stderr)
+        exit_code = 1
+    close_open_files()  # the child leaves with os._exit: the atexit handlers are not called
+    try:
+        stdout.flush()
+    except OSError:  # the client left
+        pass
+    _send_frame(connection, b"x", str(exit_code).encode("UTF-8"))
+
+
+def serve(socket_path: str, noug_dir: str, execute: Callable[[str, str, str, list[str]], None]):
+    """Listen on the UNIX socket and run the scripts sent by the clients, until CTRL+C"""
+    from src.misc import print_in_red
+    from src.runtime.import_resolver import get_import_resolver
+    if not hasattr(os, "fork"):
+        print_in_red("[nougaro] fatal error: --serve is not supported on this platform.")
+        sys.exit(1)
+
+    # warm up: the interpreter, the symbol tables and the python libs are made once here instead of once per script
+    import src.nougaro as nougaro
+    nougaro.init_symbol_tables()
+    for lib_name in get_import_resolver(noug_dir).python_libs:
+        importlib.import_module(f"lib_.{lib_name}_")
+
+    try:
+        info = os.lstat(socket_path)
+    except FileNotFoundError:
+        pass
+    else:
+        if not stat.S_ISSOCK(info.st_mode):
+            print_in_red(f"[nougaro] fatal error: {socket_path} already exists and is not a socket.")
+            sys.exit(1)
+        os.remove(socket_path)  # left by a server that did not stop properly
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # the socket is made with the permissions 0o600: only the user can connect to it
+    try:
+        server.bind(socket_path)
+    finally:
+        os.umask(old_umask)
+    server.listen()
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)  # the children are reaped automatically
+    print(f"Nougaro server listening on {socket_path}")
+    try:
+        while True:
+            connection, _ = server.accept()
+            pid = os.fork()
+            if pid == 0:  # child
+                server.close()
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                try:
+                    _handle_request(connection, execute)
+                finally:
+                    connection.close()
+                    os._exit(0)
+            connection.close()
+    except KeyboardInterrupt:
+        print_in_red("\nKeyboardInterrupt")
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+
+def client(socket_path: str, path: str, args: list[str]) -> int:
+    """Send the script to the server, print what it prints and return its exit code"""
+    with open(path, encoding="UTF-8") as file:
+        text = file.read()
+    request = {"file": os.path.realpath(path), "text": text, "args": args, "cwd": os.getcwd()}
+
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(socket_path)
+    except OSError as e:
+        from src.misc import print_in_red
+        print_in_red(f"[nougaro] fatal error: unable to connect to the server at {socket_path} ({e.strerror}). "
+                     f"Is `shell.py --serve` running?")
+        return 1
+
+    with connection:
+        connection.sendall(json.dumps(request).encode("UTF-8") + b"\n")
+        while True:
+            header = _recv_exactly(connection, _HEADER.size)
+            if header is None:  # the child died before sending its exit code
+                return 1
+            channel, size = _HEADER.unpack(header)
+            payload = _recv_exactly(connection, size)
+            if payload is None:
+                return 1
+            if channel == b"o":
+                sys.stdout.write(payload.decode("UTF-8"))
+                sys.stdout.flush()
+            elif channel == b"e":
+                sys.stderr.write(payload.decode("UTF-8"))
+                sys.stderr.flush()
+            else:
+                return int(payload.decode("UTF-8"))
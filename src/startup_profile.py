@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# `shell.py --profile-startup`: a report like `python3 -X importtime`, plus the time spent in each startup phase.
+# This file must stay light: it is imported before everything else.
+
+# IMPORTS
+# __future__ import (must be first)
+from __future__ import annotations
+# nougaro modules imports
+# no imports
+# built-in python imports
+import builtins
+import sys
+import time
+# special typing import
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.output import ConsoleOutput
+
+
+class StartupProfile:
+    def __init__(self):
+        self.enabled = False
+        self.start_time = time.perf_counter_ns()
+        self.imports: list[tuple[str, int, int]] = []  # (module name, self time, cumulative time), in ns
+        self.phases: list[tuple[str, int]] = []  # (phase name, time), in ns
+        self._children_time_stack: list[int] = []
+        self._original_import = builtins.__import__
+
+    def __repr__(self) -> str:
+        return f"<StartupProfile (enabled={self.enabled})>"
+
+    def enable(self):
+        """Start to record the imports"""
+        if self.enabled:
+            return
+        self.enabled = True
+        self.start_time = time.perf_counter_ns()
+        builtins.__import__ = self._import
+
+    def _import(self, name: str, globals_=None, locals_=None, fromlist=(), level: int = 0):
+        if level != 0 or name in sys.modules:  # already imported (relative imports are not used in Nougaro)
+            return self._original_import(name, globals_, locals_, fromlist, level)
+        self._children_time_stack.append(0)
+        start = time.perf_counter_ns()
+        try:
+            return self._original_import(name, globals_, locals_, fromlist, level)
+        finally:
+            cumulative = time.perf_counter_ns() - start
+            children_time = self._children_time_stack.pop()
+            self.imports.append((name, cumulative - children_time, cumulative))
+            if len(self._children_time_stack) != 0:
+                self._children_time_stack[-1] += cumulative
+
+    def phase(self, name: str) -> "_Phase":
+        """Record the time spent in a `with` block (does nothing if the profile is disabled)"""
+        return _Phase(self, name)
+
+    def report(self, console_output: ConsoleOutput | None = None):
+        """Print the report on stderr (with the stats of the console output, if it is given)"""
+        if not self.enabled:
+            return
+        builtins.__import__ = self._original_import
+        total = time.perf_counter_ns() - self.start_time
+        print("[startup profile] imports", file=sys.stderr)
+        print(f"{'self (µs)':>12} | {'cumulative (µs)':>15} | module", file=sys.stderr)
+        for name, self_time, cumulative in sorted(self.imports, key=lambda import_: import_[2], reverse=True):
+            print(f"{self_time / 1000:12.0f} | {cumulative / 1000:15.0f} | {name}", file=sys.stderr)
+        print("[startup profile] phases", file=sys.stderr)
+        for name, phase_time in self.phases:
+            print(f"{phase_time / 1_000_000:10.2f} ms | {name}", file=sys.stderr)
+        print(f"[startup profile] total: {total / 1_000_000:.2f} ms since the profile was enabled", file=sys.stderr)
+        if console_output is not None:
+            print(f"[startup profile] output: {console_output.bytes_written} bytes, {console_output.lines_written} "
+                  f"lines written in {console_output.flushes} writes", file=sys.stderr)
+
+
+class _Phase:
+    """Context manager returned by StartupProfile.phase"""
+    def __init__(self, profile: StartupProfile, name: str):
+        self.profile = profile
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *_):
+        if self.profile.enabled:
+            self.profile.phases.append((self.name, time.perf_counter_ns() - self.start))
+
+
+STARTUP_PROFILE = StartupProfile()
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+from src.runtime.values.functions.builtin_function import BuiltInFunction
+from src.runtime.values.basevalues.basevalues import Number
+from src.runtime.context import Context
+# other tests files imports
+# python imports
+import os
+import pathlib
+import unittest
+
+NOUG_DIR = os.path.abspath(pathlib.Path(__file__).parent.parent.absolute())
+
+
+class TestBuiltInFunction(unittest.TestCase):
+    def test_fast_call_sets_the_context(self):
+        # like with the normal protocol, the arguments of a fast-call function have a context
+        context = Context("<test>")
+        function = BuiltInFunction("str").set_context(context)
+        self.assertTrue(function.builtin_functions["str"].get("fast_call", False))
+        argument = Number(1)
+        result = function.execute([argument], None, None, NOUG_DIR)  # type: ignore
+        self.assertIsNone(result.error)
+        self.assertIs(argument.context, context)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+from src.nougaro import run
+from src.runtime.values.basevalues.basevalues import List, Number
+from src.runtime.values.functions.function import Function
+from src.errors.errors import RTArithmeticError
+# other tests files imports
+# python imports
+import os
+import pathlib
+import unittest
+
+NOUG_DIR = os.path.abspath(pathlib.Path(__file__).parent.parent.absolute())
+
+
+class TestFunctionCaller(unittest.TestCase):
+    def test_can_reuse_frame(self):
+        value, error = run("<test>", "def(x) -> x + 1", NOUG_DIR)
+        self.assertIsNone(error)
+        assert isinstance(value, List) and isinstance(value[0], Function)
+        self.assertTrue(value[0].can_reuse_frame())
+
+        value, error = run("<test>", "def(x) -> (def() -> x)", NOUG_DIR)
+        self.assertIsNone(error)
+        assert isinstance(value, List) and isinstance(value[0], Function)
+        self.assertFalse(value[0].can_reuse_frame())  # the inner function keeps the context of the call
+
+    def test_map_short_circuits(self):
+        code = "var calls = []\ndef f(x)\n    append(calls, x)\n    return 1 / x\nend\nmap(f, [1, 0, 2])\n"
+        value, error = run("<test>", code, NOUG_DIR)
+        self.assertIsInstance(error, RTArithmeticError)
+        assert error is not None
+        self.assertEqual(error.pos_start.line_number, 3)  # the divisor, in the body of the function
+        self.assertEqual(error.pos_start.colon, 15)
+
+        value, error = run("<test>", "calls", NOUG_DIR)
+        self.assertIsNone(error)
+        assert isinstance(value, List) and isinstance(value[0], List)
+        self.assertEqual([e.value for e in value[0].iter_() if isinstance(e, Number)], [1, 0])  # 2 is never used
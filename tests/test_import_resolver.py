@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+from src.runtime.import_resolver import ImportResolver
+# other tests files imports
+# python imports
+import os
+import pathlib
+import tempfile
+import unittest
+
+NOUG_DIR = os.path.abspath(pathlib.Path(__file__).parent.parent.absolute())
+
+
+class TestImportResolver(unittest.TestCase):
+    def test_lib_dir(self):
+        resolver = ImportResolver(NOUG_DIR)
+        self.assertTrue(resolver.is_lib("math"))
+        self.assertTrue(resolver.is_lib("debug"))
+        self.assertFalse(resolver.is_lib("lib_to_make_libs"))
+        self.assertEqual(resolver.resolve(NOUG_DIR, "math"),
+                         (os.path.join(NOUG_DIR, "lib_", "math_.py"), False, True))
+        self.assertEqual(resolver.resolve(NOUG_DIR, "this_lib_does_not_exist"), ("", False, False))
+
+    def test_work_dir_invalidation(self):
+        resolver = ImportResolver(NOUG_DIR)
+        with tempfile.TemporaryDirectory() as work_dir:
+            self.assertEqual(resolver.resolve(work_dir, "math")[1:], (False, True))
+            lib_path = os.path.join(work_dir, "math.noug")
+            with open(lib_path, "w") as lib_file:
+                lib_file.write("")
+            # make sure the mtime of the directory changed, even on file systems with a low mtime resolution
+            mtime = os.stat(work_dir).st_mtime
+            os.utime(work_dir, (mtime + 10, mtime + 10))
+            self.assertEqual(resolver.resolve(work_dir, "math"), (lib_path, True, False))
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+from src.nougaro import run
+from src.misc import close_open_files
+# other tests files imports
+# python imports
+import os
+import pathlib
+import tempfile
+import unittest
+
+NOUG_DIR = os.path.abspath(pathlib.Path(__file__).parent.parent.absolute())
+
+
+class TestIo(unittest.TestCase):
+    def test_close_open_files(self):
+        with tempfile.NamedTemporaryFile("w", delete=False) as file:
+            path = file.name
+        try:
+            code = f'import io\nvar file = io.open("{path}", "w")\nfile.write_str("hello")\nfile'
+            value, error = run("<test>", code, NOUG_DIR)
+            self.assertIsNone(error)
+            with open(path, encoding="UTF-8") as file:
+                self.assertEqual(file.read(), "")  # still in the buffer: the file is used by `value`
+            close_open_files()
+            with open(path, encoding="UTF-8") as file:
+                self.assertEqual(file.read(), "hello")
+            del value
+        finally:
+            os.remove(path)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+from lib_.lib_to_make_libs import lib_function, ModuleFunction
+from src.lexer.position import Position
+from src.runtime.context import Context
+from src.runtime.values.basevalues.basevalues import String, Number, List, Array
+from src.errors.errors import RTTypeError, RTArithmeticError
+from src.nougaro import run
+import lib_.math_ as math_
+# other tests files imports
+# python imports
+import array
+import os
+import pathlib
+import unittest
+
+NOUG_DIR = os.path.abspath(pathlib.Path(__file__).parent.parent.absolute())
+
+
+class TestLibFunction(unittest.TestCase):
+    def test_signature(self):
+        root = math_.Math.functions["root"]
+        self.assertEqual(root["param_names"], ["value"])
+        self.assertEqual(root["optional_params"], ["n"])
+        self.assertTrue(root.get("fast_call", False))
+
+        with self.assertRaises(TypeError):  # unsupported annotation
+            @lib_function({}, "test")
+            def execute_test_foo(self: ModuleFunction, value: dict[str, str]) -> None:
+                pass
+
+    def test_call(self):
+        pos = Position(0, 0, 0, "<test>", "math.sqrt(x)")
+        function = math_.Math("sqrt")
+        function.set_context(Context("<test>"))
+        function.set_pos(pos, pos)
+
+        result = math_.Math.functions["sqrt"]["function"](function, Number(16).set_pos(pos, pos))
+        self.assertIsNone(result.error)
+        assert isinstance(result.value, Number)
+        self.assertEqual(result.value.value, 4.0)
+
+        result = math_.Math.functions["sqrt"]["function"](function, String("16").set_pos(pos, pos))
+        self.assertIsInstance(result.error, RTTypeError)
+
+        result = math_.Math.functions["sqrt"]["function"](function, Number(-1).set_pos(pos, pos))
+        self.assertIsInstance(result.error, RTArithmeticError)
+
+        # the fast-call path sets the context of the function on the arguments
+        argument = Number(16).set_pos(pos, pos)
+        result = function.execute([argument], None, None, NOUG_DIR)  # type: ignore
+        self.assertIsNone(result.error)
+        self.assertIs(argument.context, function.context)
+
+    def test_elementwise(self):
+        call_pos = Position(0, 0, 0, "<test>", "math.sqrt(x)")
+        element_pos = Position(5, 0, 5, "<test>", "math.sqrt(x)")
+        function = math_.Math("sqrt")
+        function.set_context(Context("<test>"))
+        function.set_pos(call_pos, call_pos)
+        sqrt = math_.Math.functions["sqrt"]["function"]
+
+        result = sqrt(function, List([Number(4), Number(9)]).set_pos(call_pos, call_pos))
+        self.assertIsNone(result.error)
+        assert isinstance(result.value, List)
+        self.assertEqual([e.value for e in result.value.iter_() if isinstance(e, Number)], [2.0, 3.0])
+        self.assertTrue(all(e.context is not None for e in result.value.elements))
+
+        result = sqrt(function, Array(array.array("d", [16, 25])).set_pos(call_pos, call_pos))
+        assert isinstance(result.value, Array)
+        self.assertEqual(result.value.array_.tolist(), [4.0, 5.0])
+
+        # the error is shown at the position of the element
+        list_ = List([Number(4), Number(-1).set_pos(element_pos, element_pos)]).set_pos(call_pos, call_pos)
+        result = sqrt(function, list_)
+        self.assertIsInstance(result.error, RTArithmeticError)
+        assert result.error is not None
+        self.assertIs(result.error.pos_start, element_pos)
+
+    def test_elementwise_in_code(self):
+        # the error about an element is shown at the position of the element
+        _, error = run("<test>", "import math\nmath.sqrt([4, -1])", NOUG_DIR)
+        self.assertIsInstance(error, RTArithmeticError)
+        assert error is not None
+        self.assertEqual((error.pos_start.line_number, error.pos_start.colon, error.pos_end.colon), (1, 14, 16))
+        # the results can be used in arithmetic: this is a nougaro error, not a crash
+        _, error = run("<test>", "import math\nmath.sqrt([4])(0) / 0", NOUG_DIR)
+        self.assertIsInstance(error, RTArithmeticError)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+from src.runtime.line_index import LineIndex, LineIndexCache
+# other tests files imports
+# python imports
+import os
+import tempfile
+import unittest
+
+
+class TestLineIndex(unittest.TestCase):
+    def test_lines_match_readlines(self):
+        for content in ["", "a", "a\n", "a\nbb\nccc", "\n\n", "é\nà\n"]:
+            with tempfile.NamedTemporaryFile("w", delete=False, encoding="UTF-8", newline="") as file:
+                file.write(content)
+                path = file.name
+            try:
+                index = LineIndex.from_bytes(content.encode("UTF-8"))
+                assert index is not None
+                with open(path, encoding="UTF-8") as file:
+                    lines = file.readlines()
+                self.assertEqual(index.line_count, len(lines))
+                self.assertEqual([index.read_line(path, i + 1) for i in range(len(lines))], lines)
+            finally:
+                os.remove(path)
+        self.assertIsNone(LineIndex.from_bytes(b"a\r\nb"))  # python translates the newlines in text mode
+
+    def test_patch_and_invalidation(self):
+        with tempfile.NamedTemporaryFile("w", delete=False, encoding="UTF-8") as file:
+            file.write("a\nbb\nccc")
+            path = file.name
+        try:
+            cache = LineIndexCache()
+            index = cache.get(path)
+            assert index is not None
+            self.assertIs(cache.get(path), index)
+            self.assertTrue(cache.patch_line(path, index, 2, "xy\n"))
+            self.assertFalse(cache.patch_line(path, index, 2, "xyz\n"))
+            self.assertFalse(cache.patch_line(path, index, 2, "x\ny"))  # same length, but two lines
+            self.assertFalse(cache.patch_line(path, index, 2, "x\ry"))
+            self.assertIs(cache.get(path), index)
+            with open(path, encoding="UTF-8") as file:
+                self.assertEqual(file.read(), "a\nxy\nccc")
+
+            with open(path, "a", encoding="UTF-8") as file:
+                file.write("\nd")
+            new_index = cache.get(path)  # the size changed
+            assert new_index is not None
+            self.assertIsNot(new_index, index)
+            self.assertEqual(new_index.read_line(path, 4), "d")
+        finally:
+            os.remove(path)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+from src.nougaro import run
+from src.runtime.values.basevalues.basevalues import List, Number
+from src.errors.errors import RTArithmeticError
+# other tests files imports
+# python imports
+import os
+import pathlib
+import unittest
+
+NOUG_DIR = os.path.abspath(pathlib.Path(__file__).parent.parent.absolute())
+
+
+class TestList(unittest.TestCase):
+    def test_slice_view(self):
+        list_ = List([Number(i) for i in range(10)])
+        slice_ = list_.sliced(slice(2, 8, 2))
+        self.assertIsNotNone(slice_._lazy_view())
+        self.assertEqual(len(slice_), 3)
+        self.assertEqual([e.value for e in slice_.iter_()], [2, 4, 6])
+        self.assertEqual(slice_.sliced(slice(None, None, -1))[0].value, 6)
+        self.assertTrue(slice_.is_eq(List([Number(2), Number(4), Number(6)])))
+        self.assertIsNotNone(slice_._lazy_view())  # nothing was copied
+
+    def test_slice_copied_before_modification(self):
+        list_ = List([Number(i) for i in range(5)])
+        slice_ = list_.sliced(slice(1, 4))
+        copy = slice_.copy()
+        list_.elements.append(Number(5))
+        list_.elements.pop(1)
+        self.assertIsNone(slice_._lazy_view())
+        self.assertEqual([e.value for e in slice_.elements], [1, 2, 3])
+        # the copies of the slice share its elements, like the copies of any list
+        copy.elements.append(Number(42))
+        self.assertEqual([e.value for e in slice_.elements], [1, 2, 3, 42])
+        self.assertEqual([e.value for e in list_.elements], [0, 2, 3, 4, 5])
+
+    def test_array_elements_have_a_context(self):
+        for code in ["import array\narray.array('i', [1])(0) / 0",
+                     "import array\nfor x in array.array('i', [1]) then x / 0",
+                     "import array\nlist(array.array('i', [1]))(0) / 0",
+                     "import numeric\nfor x in numeric.array([1]) then x / 0"]:
+            _, error = run("<test>", code, NOUG_DIR)
+            self.assertIsInstance(error, RTArithmeticError)
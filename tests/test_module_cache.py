@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+from src.runtime.module_cache import ModuleCache, ModuleLoader
+from src.runtime.values.basevalues.basevalues import Module, Number
+from src.lexer.lexer import Lexer
+from src.parser.parser import Parser
+from src.parser.nodes import only_defines_and_exports
+from src.nougaro import run
+# other tests files imports
+# python imports
+import contextlib
+import io
+import os
+import pathlib
+import tempfile
+import unittest
+
+NOUG_DIR = os.path.abspath(pathlib.Path(__file__).parent.parent.absolute())
+
+
+class TestModuleCache(unittest.TestCase):
+    def test_cache_hit(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".noug", delete=False) as file:
+            path = file.name
+        try:
+            cache = ModuleCache()
+            module = Module("test", {})
+            self.assertIsNone(cache.get(path))
+            cache.set(path, module)
+            self.assertIs(cache.get(path), module)
+        finally:
+            os.remove(path)
+
+    def test_mtime_invalidation(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".noug", delete=False) as file:
+            path = file.name
+        try:
+            cache = ModuleCache()
+            cache.set(path, Module("test", {}))
+            mtime = os.path.getmtime(path)
+            os.utime(path, (mtime + 10, mtime + 10))
+            self.assertTrue(cache.is_cached(path))
+            self.assertIsNone(cache.get(path))
+            self.assertFalse(cache.is_cached(path))
+        finally:
+            os.remove(path)
+        self.assertIsNone(cache.get(path))
+
+    def test_lazy_module(self):
+        calls = []
+
+        def load_function():
+            calls.append(1)
+            return {"answer": Number(42)}, None
+
+        module = Module("test", {}, ModuleLoader(load_function))
+        module_copy = module.copy()
+        self.assertEqual(calls, [])
+        self.assertIsNone(module_copy.load())
+        self.assertIsNone(module.load())
+        self.assertEqual(calls, [1])
+        self.assertEqual(module.attributes["answer"].value, 42)
+        self.assertIsNone(module.loader)
+
+    def test_modules_with_effects_run_at_import(self):
+        for code, expected in [("var a = 1\ndef f() -> a\nexport f\nexport 2 as b", True),
+                               ("print(1)\nexport 2 as b", False),
+                               ("var a = 1", False)]:  # exports nothing
+            tokens, _ = Lexer("<test>", code).make_tokens()
+            self.assertEqual(only_defines_and_exports(Parser(tokens).parse().node), expected, code)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            _, error = run("<test>", "import hello", NOUG_DIR)
+        self.assertIsNone(error)
+        self.assertEqual(output.getvalue(), "Hello, world!\n")
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+from src.nougaro import run
+from src.errors.errors import RTArithmeticError, RTOverflowError
+# other tests files imports
+# python imports
+import os
+import pathlib
+import unittest
+
+NOUG_DIR = os.path.abspath(pathlib.Path(__file__).parent.parent.absolute())
+
+
+class TestNumeric(unittest.TestCase):
+    def test_int_overflow(self):
+        # the ints of an ndarray are 64-bit ints: numpy must not wrap around
+        for code in ["import numeric\nnumeric.array([9223372036854775807]) + 1",
+                     "import numeric\nnumeric.arange(2, 4) ^ 64",
+                     "import numeric\nnumeric.array([9223372036854775808])",
+                     "import numeric\nnumeric.arange(9223372036854775806, 9223372036854775810)",
+                     "import numeric\nnumeric.abs(numeric.array([-9223372036854775807 - 1]))"]:
+            _, error = run("<test>", code, NOUG_DIR)
+            self.assertIsInstance(error, RTOverflowError)
+
+    def test_elements_have_a_context(self):
+        for code in ["import numeric\nnumeric.to_list(numeric.array([1]))(0) / 0",
+                     "import numeric\nlist(numeric.array([1]))(0) / 0"]:
+            _, error = run("<test>", code, NOUG_DIR)
+            self.assertIsInstance(error, RTArithmeticError)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+from src.output import ConsoleOutput
+# other tests files imports
+# python imports
+import io
+import os
+import subprocess
+import sys
+import unittest
+
+
+class TestOutput(unittest.TestCase):
+    def test_buffer(self):
+        stream = io.StringIO()
+        output = ConsoleOutput(stream, 10)
+        print("hello", file=output)
+        self.assertEqual(stream.getvalue(), "")  # still in the buffer
+        print("world!", file=output)
+        self.assertEqual(stream.getvalue(), "hello\nworld!")  # the buffer was full (print writes the "\n" after)
+        output.write("é")
+        output.flush()
+        self.assertEqual(stream.getvalue(), "hello\nworld!\né")
+        self.assertEqual((output.bytes_written, output.lines_written, output.flushes), (15, 2, 2))
+
+    def test_unbuffered_and_close(self):
+        stream = io.StringIO()
+        output = ConsoleOutput(stream, 0)
+        output.write("a")
+        self.assertEqual(stream.getvalue(), "a")
+        output = ConsoleOutput(stream)
+        output.write("b")
+        self.assertEqual(stream.getvalue(), "a")
+        output.close()
+        self.assertEqual(stream.getvalue(), "ab")
+        self.assertFalse(stream.closed)
+
+    def test_flush_before_system_call(self):
+        shell_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shell.py")
+        process = subprocess.run(
+            (sys.executable, shell_path, "-d", 'print("first");system_call("echo second")'),
+            stdout=subprocess.PIPE, text=True
+        )
+        self.assertEqual(process.stdout, "first\nsecond\n")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+from src.runtime.values.tools.py2noug import py2noug, noug2py
+from src.runtime.values.basevalues.basevalues import String, Number, List, Dict, Array
+from src.nougaro import run
+from src.errors.errors import RTTypeError
+# other tests files imports
+# python imports
+import array
+import os
+import pathlib
+import unittest
+
+NOUG_DIR = os.path.abspath(pathlib.Path(__file__).parent.parent.absolute())
+
+
+class TestPy2Noug(unittest.TestCase):
+    def test_dict(self):
+        dict_ = py2noug({"a": ["b", 12], 13: "c"})
+        self.assertIsInstance(dict_, Dict)
+        assert isinstance(dict_, Dict)
+        test_, err = dict_.get_comparison_eq(Dict({
+            "a": (String("a"), List([String("b"), Number(12)])),
+            13: (Number(13), String("c"))
+        }))
+        self.assertIsNone(err)
+        assert test_ is not None
+        self.assertTrue(test_.is_true())
+        self.assertEqual(noug2py(dict_), {"a": ["b", 12], 13: "c"})
+
+    def test_dict_with_list_keys(self):
+        # tuples become lists, that can be keys if their elements can
+        dict_ = py2noug({(1, 2): "a"})
+        self.assertIsInstance(dict_, Dict)
+        assert isinstance(dict_, Dict)
+        value = dict_.get(List([Number(1), Number(2)]))
+        self.assertIsInstance(value, String)
+        # and back: lists become tuples, that python can hash
+        self.assertEqual(noug2py(dict_), {(1, 2): "a"})
+        # a key that can not be a nougaro key: we get a list of [key, value] lists
+        self.assertIsInstance(py2noug({frozenset(): "a"}), List)
+
+    def test_sort_dicts_with_list_keys(self):
+        # python can not compare dicts: this is a nougaro error, not a crash
+        _, error = run("<test>", "sort([{[1]: 1}, {[2]: 2}])", NOUG_DIR)
+        self.assertIsInstance(error, RTTypeError)
+
+    def test_array(self):
+        # arrays are not copied
+        python_array = array.array("d", [1.5, 2])
+        array_ = py2noug(python_array)
+        self.assertIsInstance(array_, Array)
+        assert isinstance(array_, Array)
+        self.assertEqual(len(array_), 2)
+        self.assertEqual(array_[1].value, 2)
+        self.assertIs(noug2py(array_), python_array)
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+from src.nougaro import run
+from src.errors.errors import RTArithmeticError
+# other tests files imports
+# python imports
+import os
+import pathlib
+import unittest
+
+NOUG_DIR = os.path.abspath(pathlib.Path(__file__).parent.parent.absolute())
+
+
+class TestRandom(unittest.TestCase):
+    def test_elements_have_a_context(self):
+        for code in ["import random\nrandom.randints(1, 2, 3)(0) / 0", "import random\nrandom.floats(3)(0) / 0",
+                     "import random\nrandom.Generator(1).randints(1, 2, 3)(0) / 0",
+                     "import random\nrandom.Generator(1).floats(3)(0) / 0"]:
+            _, error = run("<test>", code, NOUG_DIR)
+            self.assertIsInstance(error, RTArithmeticError)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+from src.server import default_socket_path
+# other tests files imports
+# python imports
+import os
+import stat
+import tempfile
+import unittest
+import unittest.mock
+
+
+class TestServer(unittest.TestCase):
+    @unittest.skipUnless(hasattr(os, "getuid"), "UNIX only")
+    def test_default_socket_path_is_private(self):
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                unittest.mock.patch.dict(os.environ, {"XDG_RUNTIME_DIR": ""}), \
+                unittest.mock.patch.object(tempfile, "tempdir", temp_dir):
+            path = default_socket_path()
+            directory = os.path.dirname(path)
+            self.assertEqual(os.path.dirname(directory), temp_dir)
+            self.assertEqual(stat.S_IMODE(os.lstat(directory).st_mode), 0o700)
+            # another user could have made the directory: it must not be used if it is not private
+            os.chmod(directory, 0o777)
+            self.assertRaises(PermissionError, default_socket_path)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+from lib_.statistics_ import _RunningState
+# other tests files imports
+# python imports
+import random
+import statistics
+import unittest
+
+
+class TestStatistics(unittest.TestCase):
+    def test_running_moments(self):
+        data = [random.uniform(-100, 100) for _ in range(1000)]
+        state = _RunningState([])
+        for x in data:
+            state.push(x)
+        self.assertEqual(state.count, 1000)
+        self.assertAlmostEqual(state.mean, statistics.mean(data))
+        self.assertAlmostEqual(state.m2 / (state.count - 1), statistics.variance(data))
+        self.assertEqual(state.min, min(data))
+        self.assertEqual(state.max, max(data))
+
+    def test_running_quantiles(self):
+        data = [random.gauss(0, 1) for _ in range(20000)]
+        state = _RunningState([0.1, 0.5, 0.9])
+        for x in data:
+            state.push(x)
+        deciles = statistics.quantiles(data, n=10)
+        for quantile, expected in zip(state.quantiles, (deciles[0], deciles[4], deciles[8])):
+            self.assertAlmostEqual(quantile.value(), expected, delta=0.05)
+
+    def test_running_quantiles_of_few_values(self):
+        # with five values or less, the quantiles are exact (linearly interpolated, like numpy's default)
+        state = _RunningState([0.25, 0.5])
+        for x in (5, 1, 4):
+            state.push(x)
+        self.assertEqual([quantile.value() for quantile in state.quantiles], [2.5, 4])
+        for x in (2, 3):
+            state.push(x)
+        self.assertEqual([quantile.value() for quantile in state.quantiles], [2, 3])
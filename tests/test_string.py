@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+
+# Nougaro : a python-interpreted high-level programming language
+# Copyright (C) 2021-2024  Jean Dubois (https://github.com/jd-develop) <jd-dev@laposte.net>
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# IMPORTS
+# nougaro modules imports
+from src.runtime.values.basevalues.basevalues import String
+# other tests files imports
+# python imports
+import unittest
+
+
+class TestString(unittest.TestCase):
+    def test_concatenation_buffer(self):
+        big = String("a" * 2000)
+        string = big
+        for i in range(100):
+            string = string.concatenated(str(i))
+        expected = "a" * 2000 + "".join(str(i) for i in range(100))
+        self.assertEqual(len(string), len(expected))
+        self.assertEqual(string.value, expected)
+        self.assertEqual(big.value, "a" * 2000)
+
+    def test_concatenation_branches(self):
+        # two strings made from the same one must not share their ends
+        base = String("b" * 2000).concatenated("c")
+        left = base.concatenated("left")
+        right = base.concatenated("right")
+        self.assertEqual(right.value, "b" * 2000 + "cright")
+        self.assertEqual(left.value, "b" * 2000 + "cleft")
+        self.assertEqual(base.value, "b" * 2000 + "c")
+        self.assertEqual(left.concatenated("!").value, "b" * 2000 + "cleft!")
+        base.value = "reset"
+        self.assertEqual(base.concatenated("?").value, "reset?")
+
+    def test_slice(self):
+        string = String("hello world")
+        slice_ = string.sliced(slice(None, None, -2))
+        self.assertIsNone(slice_._value)
+        self.assertEqual(len(slice_), 6)
+        self.assertEqual([char.value for char in slice_.iter_()], list("drwolh"))
+        self.assertEqual(slice_.copy().sliced(slice(1, 3)).value, "rw")
+        self.assertEqual(slice_.value, "drwolh")
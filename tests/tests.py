@@ -11,6 +11,22 @@
 # nougaro modules imports
 # other tests files imports
 from tests.test_lexer import TestLexer
+from tests.test_module_cache import TestModuleCache
+from tests.test_import_resolver import TestImportResolver
+from tests.test_py2noug import TestPy2Noug
+from tests.test_builtin_function import TestBuiltInFunction
+from tests.test_lib_function import TestLibFunction
+from tests.test_range import TestRange
+from tests.test_string import TestString
+from tests.test_list import TestList
+from tests.test_numeric import TestNumeric
+from tests.test_function_caller import TestFunctionCaller
+from tests.test_statistics import TestStatistics
+from tests.test_io import TestIo
+from tests.test_random import TestRandom
+from tests.test_line_index import TestLineIndex
+from tests.test_output import TestOutput
+from tests.test_server import TestServer
 # python imports
 import sys
 import unittest
@@ -20,6 +36,43 @@ def suite():
     s = unittest.TestSuite()
     s.addTest(TestLexer('test_invalid_char'))
     s.addTest(TestLexer('test_identifiers_and_keywords'))
+    s.addTest(TestModuleCache('test_cache_hit'))
+    s.addTest(TestModuleCache('test_mtime_invalidation'))
+    s.addTest(TestModuleCache('test_lazy_module'))
+    s.addTest(TestModuleCache('test_modules_with_effects_run_at_import'))
+    s.addTest(TestImportResolver('test_lib_dir'))
+    s.addTest(TestImportResolver('test_work_dir_invalidation'))
+    s.addTest(TestPy2Noug('test_dict'))
+    s.addTest(TestPy2Noug('test_dict_with_list_keys'))
+    s.addTest(TestPy2Noug('test_sort_dicts_with_list_keys'))
+    s.addTest(TestPy2Noug('test_array'))
+    s.addTest(TestBuiltInFunction('test_fast_call_sets_the_context'))
+    s.addTest(TestLibFunction('test_signature'))
+    s.addTest(TestLibFunction('test_call'))
+    s.addTest(TestRange('test_elements_have_a_context'))
+    s.addTest(TestLibFunction('test_elementwise'))
+    s.addTest(TestLibFunction('test_elementwise_in_code'))
+    s.addTest(TestString('test_concatenation_buffer'))
+    s.addTest(TestString('test_concatenation_branches'))
+    s.addTest(TestString('test_slice'))
+    s.addTest(TestList('test_slice_view'))
+    s.addTest(TestList('test_slice_copied_before_modification'))
+    s.addTest(TestList('test_array_elements_have_a_context'))
+    s.addTest(TestNumeric('test_int_overflow'))
+    s.addTest(TestFunctionCaller('test_can_reuse_frame'))
+    s.addTest(TestFunctionCaller('test_map_short_circuits'))
+    s.addTest(TestStatistics('test_running_moments'))
+    s.addTest(TestStatistics('test_running_quantiles'))
+    s.addTest(TestStatistics('test_running_quantiles_of_few_values'))
+    s.addTest(TestIo('test_close_open_files'))
+    s.addTest(TestRandom('test_elements_have_a_context'))
+    s.addTest(TestLineIndex('test_lines_match_readlines'))
+    s.addTest(TestLineIndex('test_patch_and_invalidation'))
+    s.addTest(TestOutput('test_buffer'))
+    s.addTest(TestOutput('test_unbuffered_and_close'))
+    s.addTest(TestOutput('test_flush_before_system_call'))
+    s.addTest(TestNumeric('test_elements_have_a_context'))
+    s.addTest(TestServer('test_default_socket_path_is_private'))
     return s
 
 